@@ -51,6 +51,9 @@ def create_parser() -> argparse.ArgumentParser:
   
   # song_list_generatorの実行をスキップ
   python -m src.cli.excel_to_tsv_cli --skip-song-list
+  
+  # 処理済みデータの生成をスキップ
+  python -m src.cli.excel_to_tsv_cli --skip-processed-data
         """
     )
     
@@ -84,6 +87,13 @@ def create_parser() -> argparse.ArgumentParser:
         help='song_list_generatorの実行をスキップ'
     )
     
+    # 処理済みデータ生成のスキップオプション
+    parser.add_argument(
+        '--skip-processed-data',
+        action='store_true',
+        help='処理済みデータ（M_YT_LIVE_PROCESSED.arrow）の生成をスキップ'
+    )
+    
     # ログレベルのオプション
     parser.add_argument(
         '--verbose', '-v',
@@ -124,7 +134,13 @@ def setup_cli_logging(verbose: bool) -> None:
         logger.debug("詳細ログモードが有効になりました")
 
 
-def print_header(input_file: str, output_dir: str, dry_run: bool, skip_song_list: bool) -> None:
+def print_header(
+    input_file: str,
+    output_dir: str,
+    dry_run: bool,
+    skip_song_list: bool,
+    skip_processed_data: bool = False
+) -> None:
     """
     ヘッダー情報を表示（要件5.1）
     
@@ -133,6 +149,7 @@ def print_header(input_file: str, output_dir: str, dry_run: bool, skip_song_list
         output_dir: 出力ディレクトリパス
         dry_run: ドライランモードかどうか
         skip_song_list: song_list_generatorをスキップするか
+        skip_processed_data: 処理済みデータの生成をスキップするか
     """
     logger = logging.getLogger(__name__)
     
@@ -143,6 +160,7 @@ def print_header(input_file: str, output_dir: str, dry_run: bool, skip_song_list
     logger.info(f"出力ディレクトリ: {output_dir}")
     logger.info(f"ドライランモード: {dry_run}")
     logger.info(f"song_list_generator実行: {'スキップ' if skip_song_list else '有効'}")
+    logger.info(f"処理済みデータ生成: {'スキップ' if skip_processed_data else '有効'}")
     logger.info("=" * 60)
 
 
@@ -226,7 +244,8 @@ def run_conversion(
     input_file: str,
     output_dir: str,
     dry_run: bool,
-    skip_song_list: bool
+    skip_song_list: bool,
+    skip_processed_data: bool = False
 ) -> ConversionResult:
     """
     Excel to TSV変換処理を実行
@@ -236,6 +255,7 @@ def run_conversion(
         output_dir: 出力ディレクトリのパス
         dry_run: ドライランモード
         skip_song_list: song_list_generatorをスキップするか
+        skip_processed_data: 処理済みデータの生成をスキップするか
         
     Returns:
         変換処理の結果
@@ -290,6 +310,30 @@ def run_conversion(
                 "TSVファイルは正常に生成されています"
             )
     
+    # 処理済みデータを生成（Webアプリの初回表示でパイプラインを実行しないため）
+    if not skip_processed_data and result.success and not dry_run:
+        logger.info("")
+        logger.info("処理済みデータを生成します...")
+        
+        live_file = str(Path(output_dir) / "M_YT_LIVE.TSV")
+        timestamp_file = str(Path(output_dir) / "M_YT_LIVE_TIMESTAMP.TSV")
+        processed_file = str(Path(output_dir) / "M_YT_LIVE_PROCESSED.arrow")
+        
+        processed_success = service.build_processed_data(
+            live_file=live_file,
+            timestamp_file=timestamp_file,
+            output_file=processed_file
+        )
+        
+        if processed_success:
+            logger.info(f"処理済みデータが生成されました: {processed_file}")
+        else:
+            # 処理済みデータがなくてもWebアプリはTSVから処理できるため警告として扱う
+            logger.warning(
+                "処理済みデータの生成に失敗しましたが、"
+                "TSVファイルは正常に生成されています"
+            )
+    
     return result
 
 
@@ -319,7 +363,8 @@ def main() -> int:
             input_file=args.input_file,
             output_dir=args.output_dir,
             dry_run=args.dry_run,
-            skip_song_list=args.skip_song_list
+            skip_song_list=args.skip_song_list,
+            skip_processed_data=args.skip_processed_data
         )
         
         # Excel to TSV変換処理を実行
@@ -327,7 +372,8 @@ def main() -> int:
             input_file=args.input_file,
             output_dir=args.output_dir,
             dry_run=args.dry_run,
-            skip_song_list=args.skip_song_list
+            skip_song_list=args.skip_song_list,
+            skip_processed_data=args.skip_processed_data
         )
         
         # 処理サマリーを表示（要件5.5）
@@ -8,7 +8,7 @@ import argparse
 import sys
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from src.config.logging_config import setup_logging
 from src.repositories.live_repository import LiveRepository
@@ -51,6 +51,13 @@ def create_parser() -> argparse.ArgumentParser:
   
   # 類似性チェックを無効化
   python -m src.cli.song_list_generator --no-similarity-check
+  
+  # 差分更新（ID 1200より後のタイムスタンプと、配信ID 95のレコードを反映）
+  python -m src.cli.song_list_generator --incremental --since-id 1200 \
+      --changed-live-ids 95
+  
+  # ソート用読み仮名のキャッシュを使用
+  python -m src.cli.song_list_generator --sort-cache-file .cache/artist_sort_readings.json
         """
     )
     
@@ -84,6 +91,36 @@ def create_parser() -> argparse.ArgumentParser:
         help='ドライランモード（ファイルを書き込まない）'
     )
     
+    # 差分更新のオプション
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='既存の出力ファイルを元に、追加・変更されたレコードのみを反映する'
+    )
+    
+    parser.add_argument(
+        '--since-id',
+        type=int,
+        default=None,
+        help='差分更新で反映するタイムスタンプIDの下限（このIDより大きいレコードを反映）'
+    )
+    
+    parser.add_argument(
+        '--changed-live-ids',
+        type=int,
+        nargs='+',
+        default=None,
+        help='差分更新で反映する、レコードが変更・削除された配信IDのリスト'
+    )
+    
+    # ソート用読み仮名のキャッシュのオプション
+    parser.add_argument(
+        '--sort-cache-file',
+        type=str,
+        default=None,
+        help='ソート用読み仮名の永続キャッシュファイルのパス（指定した場合のみ使用）'
+    )
+    
     # 類似性チェックのオプション
     parser.add_argument(
         '--similarity-threshold',
@@ -239,7 +276,11 @@ def run_generation(
     output_file: str,
     dry_run: bool,
     similarity_threshold: float,
-    no_similarity_check: bool
+    no_similarity_check: bool,
+    incremental: bool = False,
+    since_id: Optional[int] = None,
+    changed_live_ids: Optional[List[int]] = None,
+    sort_cache_file: Optional[str] = None
 ) -> tuple[List[SongInfo], List[SimilarityWarning], DiffResult]:
     """
     曲リスト生成処理を実行
@@ -251,6 +292,10 @@ def run_generation(
         dry_run: ドライランモード
         similarity_threshold: 類似度チェックの閾値
         no_similarity_check: 類似性チェックを無効化するか
+        incremental: 既存の出力ファイルを元に差分更新するか
+        since_id: 差分更新で反映するタイムスタンプIDの下限
+        changed_live_ids: 差分更新で反映する、レコードが変更・削除された配信IDのリスト
+        sort_cache_file: ソート用読み仮名の永続キャッシュファイルのパス
         
     Returns:
         (生成された曲リスト, 類似性警告リスト, 差分結果)のタプル
@@ -269,11 +314,19 @@ def run_generation(
     
     # サービスを初期化
     logger.info("サービスを初期化しています...")
-    service = SongListService(live_repo, timestamp_repo)
+    service = SongListService(live_repo, timestamp_repo, sort_cache_file_path=sort_cache_file)
     
     # 曲リストを生成
-    logger.info("曲リストを生成しています...")
-    songs = service.generate_song_list()
+    if incremental:
+        logger.info("既存の曲リストを差分更新しています...")
+        previous_songs = song_list_repo.load_all()
+        songs = service.update_song_list(previous_songs, since_id, changed_live_ids)
+    else:
+        logger.info("曲リストを生成しています...")
+        songs = service.generate_song_list()
+    
+    # 新しく生成した読み仮名をキャッシュに保存（全件生成時は使用されなかった読み仮名を取り除く）
+    service.artist_sort_generator.save_cache(prune=not incremental)
     
     # 類似性チェック
     warnings = []
@@ -308,6 +361,9 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    if args.incremental and args.since_id is None and not args.changed_live_ids:
+        parser.error('--incremental には --since-id または --changed-live-ids の指定が必要です')
+    
     # ログ設定を初期化
     setup_cli_logging(args.verbose)
     logger = logging.getLogger(__name__)
@@ -322,6 +378,11 @@ def main():
         logger.info(f"  タイムスタンプ情報: {args.timestamp_file}")
         logger.info(f"出力ファイル: {args.output_file}")
         logger.info(f"ドライランモード: {args.dry_run}")
+        if args.incremental:
+            logger.info(
+                f"差分更新: 有効 (since-id: {args.since_id}, "
+                f"changed-live-ids: {args.changed_live_ids})"
+            )
         
         if args.no_similarity_check:
             logger.info("類似性チェック: 無効")
@@ -337,7 +398,11 @@ def main():
             output_file=args.output_file,
             dry_run=args.dry_run,
             similarity_threshold=args.similarity_threshold,
-            no_similarity_check=args.no_similarity_check
+            no_similarity_check=args.no_similarity_check,
+            incremental=args.incremental,
+            since_id=args.since_id,
+            changed_live_ids=args.changed_live_ids,
+            sort_cache_file=args.sort_cache_file
         )
         
         # 処理サマリーを表示
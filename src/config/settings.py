@@ -25,6 +25,7 @@ class Config:
     lives_file_path: str = "data/M_YT_LIVE.TSV"
     songs_file_path: str = "data/M_YT_LIVE_TIMESTAMP.TSV"
     song_list_file_path: str = "data/V_SONG_LIST.TSV"
+    processed_data_file_path: str = "data/M_YT_LIVE_PROCESSED.arrow"
     tweet_embed_code_path: str = "data/tweet_embed_code.html"
     tweet_height_path: str = "data/tweet_height.txt"
     css_file_path: str = "src/ui/styles/style.css"
@@ -32,6 +33,7 @@ class Config:
     # 表示設定
     initial_display_limit: int = 25
     display_increment: int = 25
+    song_list_page_size: int = 100  # 楽曲リストの1ページあたりの表示件数
     
     # ページ設定
     page_title: str = "しのうたタイム"
@@ -41,6 +43,10 @@ class Config:
     # パフォーマンス設定
     enable_cache: bool = True
     cache_ttl: int = 3600  # 秒
+    cache_content_hash: bool = False  # データファイルのコンテンツハッシュをキャッシュキーに含めるか
+    persist_processed_data: bool = False  # パイプラインの処理結果をファイルに保存するか
+    search_cache_size: int = 256  # 検索結果キャッシュの最大エントリ数（0で無効）
+    incremental_search: bool = True  # 入力の確定で検索し、前回の結果から絞り込むか
     
     @classmethod
     def from_env(cls) -> 'Config':
@@ -71,6 +77,10 @@ class Config:
                 "SHINOUTA_SONG_LIST_FILE_PATH",
                 "data/V_SONG_LIST.TSV"
             ),
+            processed_data_file_path=os.getenv(
+                "SHINOUTA_PROCESSED_DATA_FILE_PATH",
+                "data/M_YT_LIVE_PROCESSED.arrow"
+            ),
             tweet_embed_code_path=os.getenv(
                 "SHINOUTA_TWEET_EMBED_CODE_PATH",
                 "data/tweet_embed_code.html"
@@ -92,6 +102,10 @@ class Config:
                 "SHINOUTA_DISPLAY_INCREMENT",
                 "25"
             )),
+            song_list_page_size=int(os.getenv(
+                "SHINOUTA_SONG_LIST_PAGE_SIZE",
+                "100"
+            )),
             # ページ設定
             page_title=os.getenv(
                 "SHINOUTA_PAGE_TITLE",
@@ -113,11 +127,30 @@ class Config:
             cache_ttl=int(os.getenv(
                 "SHINOUTA_CACHE_TTL",
                 "3600"
-            ))
+            )),
+            cache_content_hash=os.getenv(
+                "SHINOUTA_CACHE_CONTENT_HASH",
+                "false"
+            ).lower() in ("true", "1", "yes"),
+            persist_processed_data=os.getenv(
+                "SHINOUTA_PERSIST_PROCESSED_DATA",
+                "false"
+            ).lower() in ("true", "1", "yes"),
+            search_cache_size=int(os.getenv(
+                "SHINOUTA_SEARCH_CACHE_SIZE",
+                "256"
+            )),
+            incremental_search=os.getenv(
+                "SHINOUTA_INCREMENTAL_SEARCH",
+                "true"
+            ).lower() in ("true", "1", "yes")
         )
         
         logger.info("環境変数からの設定読み込みが完了しました")
-        logger.debug(f"設定内容: enable_cache={config.enable_cache}, cache_ttl={config.cache_ttl}")
+        logger.debug(
+            f"設定内容: enable_cache={config.enable_cache}, cache_ttl={config.cache_ttl}, "
+            f"cache_content_hash={config.cache_content_hash}"
+        )
         
         return config
     
@@ -164,6 +197,11 @@ class Config:
                 "display_increment",
                 f"表示増分は正の整数である必要があります: {self.display_increment}"
             )
+        if self.song_list_page_size <= 0:
+            raise ConfigurationError(
+                "song_list_page_size",
+                f"楽曲リストの1ページあたりの表示件数は正の整数である必要があります: {self.song_list_page_size}"
+            )
         
         # ページ設定の検証
         if not self.page_title:
@@ -185,6 +223,11 @@ class Config:
                 "cache_ttl",
                 f"キャッシュTTLは0以上である必要があります: {self.cache_ttl}"
             )
+        if self.search_cache_size < 0:
+            raise ConfigurationError(
+                "search_cache_size",
+                f"検索結果キャッシュの最大エントリ数は0以上である必要があります: {self.search_cache_size}"
+            )
         
         logger.info("設定値の検証が完了しました")
         return True
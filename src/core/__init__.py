@@ -6,17 +6,37 @@
 """
 
 from .data_pipeline import DataPipeline
+from .search_index import SearchIndex
+from .fuzzy_index import FuzzyIndex
+from .live_index import LiveIndex
+from .equality_index import EqualityIndex
+from .search_result_cache import SearchResultCache
 from .utils import (
     convert_timestamp_to_seconds,
+    convert_timestamps_to_seconds,
     generate_youtube_url,
+    generate_youtube_urls,
     generate_song_numbers,
     convert_date_string,
+    normalize_search_text,
+    get_search_key_column,
+    build_search_keys,
 )
 
 __all__ = [
     "DataPipeline",
+    "SearchIndex",
+    "FuzzyIndex",
+    "LiveIndex",
+    "EqualityIndex",
+    "SearchResultCache",
     "convert_timestamp_to_seconds",
+    "convert_timestamps_to_seconds",
     "generate_youtube_url",
+    "generate_youtube_urls",
     "generate_song_numbers",
     "convert_date_string",
+    "normalize_search_text",
+    "get_search_key_column",
+    "build_search_keys",
 ]
@@ -13,16 +13,30 @@ import pandas as pd
 from src.services.data_service import DataService
 from src.config.settings import Config
 from src.core.utils import (
-    convert_timestamp_to_seconds,
-    generate_youtube_url,
+    convert_timestamps_to_seconds,
+    generate_youtube_urls,
     generate_song_numbers,
     convert_date_string,
+    build_search_keys,
+    get_search_key_column,
 )
 from src.exceptions.errors import DataProcessingError, log_error
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 正規化済み検索キーを生成するフィールド
+SEARCH_KEY_FIELDS = ["曲名", "アーティスト", "ライブタイトル"]
+
+# カテゴリ型（値の辞書とコード）に変換するフィールド
+# 同じ値が多くの行で繰り返される列（ライブタイトルは曲数分繰り返される）
+CATEGORICAL_FIELDS = [
+    "アーティスト",
+    "曲名",
+    "ライブタイトル",
+    "元ライブURL",
+] + [get_search_key_column(field) for field in SEARCH_KEY_FIELDS]
+
 
 class DataPipeline:
     """
@@ -198,7 +212,7 @@ class DataPipeline:
         """
         データ変換ステップ
         
-        タイムスタンプ変換、日付変換、URL生成、曲目番号生成を実行します。
+        タイムスタンプ変換、日付変換、URL生成、検索キー生成、カテゴリ型への変換を実行します。
         
         Args:
             df: 変換対象のDataFrame
@@ -213,8 +227,8 @@ class DataPipeline:
             
             # タイムスタンプ変換: HH:MM:SSまたはMM:SS形式を秒数に変換
             logger.debug("タイムスタンプを秒数に変換中")
-            df_result["タイムスタンプ_秒"] = df_result["タイムスタンプ"].apply(
-                convert_timestamp_to_seconds
+            df_result["タイムスタンプ_秒"] = convert_timestamps_to_seconds(
+                df_result["タイムスタンプ"]
             )
             
             # 日付変換: ソート用に配信日を日付型（datetime）に変換
@@ -237,14 +251,19 @@ class DataPipeline:
             
             # YouTubeタイムスタンプ付きURL生成
             logger.debug("YouTubeタイムスタンプ付きURLを生成中")
-            df_result["YouTubeタイムスタンプ付きURL"] = df_result.apply(
-                lambda row: generate_youtube_url(
-                    row["元ライブURL"], 
-                    row["タイムスタンプ_秒"]
-                ),
-                axis=1,
+            df_result["YouTubeタイムスタンプ付きURL"] = generate_youtube_urls(
+                df_result["元ライブURL"],
+                df_result["タイムスタンプ_秒"],
             )
             
+            # 正規化済み検索キー生成: 検索時の文字列処理を不要にする
+            logger.debug("正規化済み検索キーを生成中")
+            df_result = self._add_search_keys(df_result)
+            
+            # カテゴリ型に変換: 重複する文字列を値の辞書とコードで保持する
+            logger.debug("繰り返しの多い列をカテゴリ型に変換中")
+            df_result = self._encode_categories(df_result)
+            
             logger.info("データ変換完了")
             return df_result
             
@@ -253,6 +272,55 @@ class DataPipeline:
             logger.error(error_msg, exc_info=True)
             raise DataProcessingError("transform", str(e))
     
+    def _add_search_keys(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        正規化済み検索キー列を追加する
+        
+        曲名、アーティスト、ライブタイトルに対して、NFKC正規化・casefold・
+        カタカナのひらがな統一を適用した検索キー列（例: 「曲名_検索キー」）を追加します。
+        
+        Args:
+            df: 対象のDataFrame
+        
+        Returns:
+            検索キー列が追加されたDataFrame
+            
+        Note:
+            存在しないフィールドはスキップされます
+        """
+        for field in SEARCH_KEY_FIELDS:
+            if field not in df.columns:
+                logger.debug(f"フィールド '{field}' が存在しないため検索キーの生成をスキップします")
+                continue
+            df[get_search_key_column(field)] = build_search_keys(df[field])
+        
+        return df
+    
+    def _encode_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        繰り返しの多い文字列列をカテゴリ型に変換する
+        
+        ユニークな値の辞書（categories）と各行のコード（codes）で保持することで
+        メモリ使用量を減らし、検索時はユニークな値だけを照合できるようにします。
+        
+        Args:
+            df: 対象のDataFrame
+        
+        Returns:
+            CATEGORICAL_FIELDSの列がカテゴリ型に変換されたDataFrame
+            
+        Note:
+            - 存在しないフィールドはスキップされます
+            - 欠損値はカテゴリに含まれず、コード-1になります
+        """
+        for field in CATEGORICAL_FIELDS:
+            if field not in df.columns:
+                logger.debug(f"フィールド '{field}' が存在しないためカテゴリ型への変換をスキップします")
+                continue
+            df[field] = df[field].astype("category")
+        
+        return df
+    
     def _sort_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         データソートステップ
@@ -0,0 +1,197 @@
+"""
+完全一致インデックスモジュール
+
+アーティスト・LIVE_ID・曲名などの値による完全一致の絞り込みを高速化するための
+ハッシュインデックス（値 → 行位置）を提供します。
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 完全一致で絞り込むことの多いフィールド
+DEFAULT_EQUALITY_FIELDS = ["アーティスト", "LIVE_ID", "曲名"]
+
+
+class EqualityIndex:
+    """
+    完全一致ハッシュインデックス
+
+    フィールドごとに、値をキーとしてその値を持つ行位置の配列（昇順）を保持します。
+    複数条件の絞り込みでは、各条件の行位置の配列を件数の少ない順に積集合を取ることで、
+    条件ごとに全行を比較する処理を回避します。
+
+    行位置はインデックス構築時のDataFrameにおける0始まりの位置（iloc）です。
+
+    Attributes:
+        fields (List[str]): インデックス化されたフィールドのリスト
+        version (str): データセットのバージョン（同一データかどうかの判定に使用）
+
+    Examples:
+        >>> index = EqualityIndex(df, ["アーティスト", "LIVE_ID"])
+        >>> positions = index.get_positions("アーティスト", "LiSA")
+        >>> df.iloc[positions]
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        fields: Sequence[str] = DEFAULT_EQUALITY_FIELDS,
+        version: str = ""
+    ):
+        """
+        EqualityIndexを初期化し、インデックスを構築する
+
+        Args:
+            df: インデックス化するDataFrame
+            fields: インデックス化するフィールドのリスト
+            version: データセットのバージョン（任意）
+
+        Note:
+            - DataFrameに存在しないフィールドはスキップされます
+            - 欠損値はインデックス化されず、どの値にも一致しません
+        """
+        import time
+
+        start_time = time.time()
+
+        self.version = version
+        self.fields: List[str] = []
+        self._num_rows = len(df)
+        self._postings: Dict[str, Dict[Any, np.ndarray]] = {}
+
+        for field in fields:
+            if field not in df.columns:
+                logger.warning(f"フィールド '{field}' が存在しないためインデックス化をスキップします")
+                continue
+
+            self._postings[field] = self._build_postings(df[field])
+            self.fields.append(field)
+
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"完全一致インデックスを構築しました: "
+            f"{ {field: len(self._postings[field]) for field in self.fields} }件、"
+            f"処理時間: {elapsed_time:.3f}秒"
+        )
+
+    @staticmethod
+    def _build_postings(values: pd.Series) -> Dict[Any, np.ndarray]:
+        """
+        値から行位置へのポスティングリストを構築する
+
+        Args:
+            values: インデックス化する列
+
+        Returns:
+            値をキー、行位置の配列（int32、昇順）を値とする辞書
+        """
+        # 欠損値のコードは-1となり、どの値にも含まれない
+        codes, uniques = pd.factorize(values, sort=False)
+        codes = np.asarray(codes)
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+        postings: Dict[Any, np.ndarray] = {}
+        for code, value in enumerate(uniques.tolist()):
+            positions = order[boundaries[code]:boundaries[code + 1]]
+            positions.flags.writeable = False
+            postings[value] = positions
+        return postings
+
+    def is_compatible(self, df: pd.DataFrame) -> bool:
+        """
+        インデックスが指定されたDataFrameに使用できるか判定する
+
+        Args:
+            df: 判定対象のDataFrame
+
+        Returns:
+            行数が一致する場合True
+        """
+        return len(df) == self._num_rows
+
+    def has_field(self, field: str) -> bool:
+        """
+        フィールドがインデックス化されているか判定する
+
+        Args:
+            field: フィールド名
+
+        Returns:
+            インデックス化されている場合True
+        """
+        return field in self._postings
+
+    def get_positions(self, field: str, value: Any) -> np.ndarray:
+        """
+        フィールドの値が一致する行位置を取得する
+
+        Args:
+            field: フィールド名
+            value: 一致させる値
+
+        Returns:
+            行位置の配列（int32、昇順、書き込み不可）
+
+        Raises:
+            KeyError: フィールドがインデックス化されていない場合
+        """
+        if field not in self._postings:
+            raise KeyError(f"フィールド '{field}' はインデックス化されていません")
+
+        try:
+            positions = self._postings[field].get(value)
+        except TypeError:
+            # ハッシュ化できない値はどの値にも一致しない
+            positions = None
+        if positions is None:
+            return np.empty(0, dtype=np.int32)
+        return positions
+
+    def count(self, field: str, value: Any) -> int:
+        """
+        フィールドの値が一致する行数を取得する
+
+        Args:
+            field: フィールド名
+            value: 一致させる値
+
+        Returns:
+            一致する行数
+        """
+        return len(self.get_positions(field, value))
+
+    def intersect(self, conditions: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        全ての条件に一致する行位置を取得する
+
+        各条件の行位置の配列を件数の少ない順に積集合を取り、
+        途中で空になった場合はその時点で終了します。
+
+        Args:
+            conditions: フィールド名と値の辞書（全てインデックス化されたフィールド）
+
+        Returns:
+            行位置の配列（int32、昇順）。条件が空の場合はNone
+
+        Raises:
+            KeyError: インデックス化されていないフィールドが含まれる場合
+        """
+        posting_lists = sorted(
+            (self.get_positions(field, value) for field, value in conditions.items()),
+            key=len
+        )
+        if not posting_lists:
+            return None
+
+        positions = posting_lists[0]
+        for other in posting_lists[1:]:
+            if len(positions) == 0:
+                break
+            positions = np.intersect1d(positions, other, assume_unique=True)
+        return positions.astype(np.int32, copy=False)
@@ -0,0 +1,283 @@
+"""
+あいまい検索インデックスモジュール
+
+入力ミスを含むクエリから、近い曲名・アーティスト名の候補を探すための
+q-gramインデックスを提供します。
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+from src.core.utils import build_search_keys, get_search_key_column, normalize_search_text
+from src.models.search_query_models import FuzzyMatch
+
+try:
+    import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+def default_max_distance(query_length: int) -> int:
+    """
+    クエリの長さに応じた許容する編集距離を返す
+
+    Args:
+        query_length: 正規化後のクエリの文字数
+
+    Returns:
+        許容するレーベンシュタイン距離（2文字以下は0）
+    """
+    if query_length <= 2:
+        return 0
+    if query_length <= 5:
+        return 1
+    if query_length <= 10:
+        return 2
+    return 3
+
+
+class FuzzyIndex:
+    """
+    あいまい検索インデックス
+
+    フィールドごとに重複を除いた値を正規化し、1文字（unigram）と
+    2文字（bigram）から値へのポスティングリストを保持します。
+    検索時はq-gramの共有数と文字数の差で候補を絞り込んでから、
+    候補に対してのみレーベンシュタイン距離を計算します。
+
+    Attributes:
+        fields (List[str]): インデックス化されたフィールドのリスト
+        version (str): データセットのバージョン
+
+    Examples:
+        >>> index = FuzzyIndex(df, ["曲名", "アーティスト"])
+        >>> index.suggest("yoasobl")
+        [FuzzyMatch(text='YOASOBI', field='アーティスト', distance=1, row_count=12)]
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        fields: Sequence[str],
+        version: str = ""
+    ):
+        """
+        FuzzyIndexを初期化し、インデックスを構築する
+
+        Args:
+            df: インデックス化するDataFrame
+            fields: インデックス化するフィールドのリスト（元のフィールド名）
+            version: データセットのバージョン（任意）
+
+        Note:
+            - 正規化済み検索キー列（例: 「曲名_検索キー」）があればそれを使用します
+            - 欠損値と空文字列はインデックス化されません
+        """
+        import time
+
+        start_time = time.time()
+
+        self.version = version
+        self.fields: List[str] = []
+        self._keys: Dict[str, List[str]] = {}
+        self._texts: Dict[str, List[str]] = {}
+        self._rows: Dict[str, List[np.ndarray]] = {}
+        self._key_ids: Dict[str, Dict[str, int]] = {}
+        self._postings: Dict[str, Dict[int, Dict[str, np.ndarray]]] = {}
+
+        for field in fields:
+            if field not in df.columns:
+                logger.warning(f"フィールド '{field}' が存在しないためインデックス化をスキップします")
+                continue
+
+            key_column = get_search_key_column(field)
+            keys = df[key_column] if key_column in df.columns else build_search_keys(df[field])
+
+            # 欠損値のコードは-1となり、どの値にも含まれない
+            codes, uniques = pd.factorize(keys, sort=False)
+            texts = df[field].tolist()
+
+            # 値ごとの行位置と表示用の元の値（最初の出現）
+            order = np.argsort(codes, kind="stable")
+            boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+            field_keys: List[str] = []
+            field_texts: List[str] = []
+            field_rows: List[np.ndarray] = []
+            for code, key in enumerate(uniques):
+                if pd.isna(key) or not key:
+                    continue
+                rows = order[boundaries[code]:boundaries[code + 1]].astype(np.int32)
+                field_keys.append(key)
+                field_texts.append(str(texts[rows[0]]))
+                field_rows.append(rows)
+
+            self._keys[field] = field_keys
+            self._texts[field] = field_texts
+            self._rows[field] = field_rows
+            self._key_ids[field] = {key: key_id for key_id, key in enumerate(field_keys)}
+            self._postings[field] = {
+                1: self._build_postings(field_keys, 1),
+                2: self._build_postings(field_keys, 2),
+            }
+            self.fields.append(field)
+
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"あいまい検索インデックスを構築しました: "
+            f"{ {field: len(self._keys[field]) for field in self.fields} }件、"
+            f"処理時間: {elapsed_time:.3f}秒"
+        )
+
+    @staticmethod
+    def _extract_grams(text: str, q: int) -> set:
+        """
+        文字列からq-gramの集合を抽出する
+
+        Args:
+            text: 対象文字列
+            q: gramの文字数
+
+        Returns:
+            q-gramの集合
+        """
+        return {text[i:i + q] for i in range(len(text) - q + 1)}
+
+    def _build_postings(self, keys: List[str], q: int) -> Dict[str, np.ndarray]:
+        """
+        q-gramから値の番号へのポスティングリストを構築する
+
+        Args:
+            keys: 正規化済みの値のリスト
+            q: gramの文字数
+
+        Returns:
+            q-gramをキー、値の番号の配列（int32）を値とする辞書
+        """
+        postings: Dict[str, List[int]] = {}
+        for key_id, key in enumerate(keys):
+            for gram in self._extract_grams(key, q):
+                postings.setdefault(gram, []).append(key_id)
+
+        return {
+            gram: np.asarray(key_ids, dtype=np.int32)
+            for gram, key_ids in postings.items()
+        }
+
+    def _candidates(self, field: str, query: str, max_distance: int) -> np.ndarray:
+        """
+        編集距離がmax_distance以内になり得る値の番号を取得する
+
+        編集1回で失われるクエリのq-gramは最大q個のため、距離k以内の値は
+        クエリのq-gram集合のうち少なくとも「q-gram数 - q×k」個を含みます。
+        この条件（count filter）と文字数の差で候補を絞り込みます。
+
+        Args:
+            field: フィールド名
+            query: 正規化済みのクエリ
+            max_distance: 許容する編集距離
+
+        Returns:
+            候補となる値の番号の配列
+        """
+        keys = self._keys[field]
+
+        # bigramで閾値が正にならない短いクエリはunigramを使用する
+        for q in (2, 1):
+            query_grams = self._extract_grams(query, q)
+            threshold = len(query_grams) - q * max_distance
+            if threshold > 0:
+                break
+        else:
+            return np.empty(0, dtype=np.int32)
+
+        postings = self._postings[field][q]
+        matched = [postings[gram] for gram in query_grams if gram in postings]
+        if not matched:
+            return np.empty(0, dtype=np.int32)
+
+        counts = np.bincount(np.concatenate(matched), minlength=len(keys))
+        candidate_ids = np.flatnonzero(counts >= threshold)
+
+        query_length = len(query)
+        return np.asarray([
+            key_id for key_id in candidate_ids.tolist()
+            if abs(len(keys[key_id]) - query_length) <= max_distance
+        ], dtype=np.int32)
+
+    def suggest(
+        self,
+        query: str,
+        fields: Optional[Sequence[str]] = None,
+        max_distance: Optional[int] = None,
+        limit: Optional[int] = 5
+    ) -> List[FuzzyMatch]:
+        """
+        クエリに近い値の候補を取得する
+
+        Args:
+            query: 検索クエリ（正規化前）
+            fields: 対象フィールドのリスト（デフォルト: インデックス化された全フィールド）
+            max_distance: 許容する編集距離（デフォルト: クエリの長さに応じて決定）
+            limit: 返す候補の最大数（Noneの場合は全て）
+
+        Returns:
+            距離の近い順（同距離は行数の多い順）の候補リスト。
+            クエリと完全に一致する値は含みません
+        """
+        if Levenshtein is None:
+            logger.warning("python-Levenshteinが利用できないため、あいまい検索を実行できません")
+            return []
+
+        normalized_query = normalize_search_text(query).strip()
+        if max_distance is None:
+            max_distance = default_max_distance(len(normalized_query))
+        if not normalized_query or max_distance <= 0:
+            return []
+
+        matches: List[FuzzyMatch] = []
+        for field in fields if fields is not None else self.fields:
+            if field not in self._keys:
+                continue
+
+            keys = self._keys[field]
+            for key_id in self._candidates(field, normalized_query, max_distance).tolist():
+                distance = Levenshtein.distance(
+                    normalized_query, keys[key_id], score_cutoff=max_distance
+                )
+                if 0 < distance <= max_distance:
+                    matches.append(FuzzyMatch(
+                        text=self._texts[field][key_id],
+                        field=field,
+                        distance=distance,
+                        row_count=len(self._rows[field][key_id])
+                    ))
+
+        matches.sort(key=lambda match: (match.distance, -match.row_count, match.text))
+        return matches[:limit]
+
+    def get_positions(self, matches: Sequence[FuzzyMatch]) -> np.ndarray:
+        """
+        候補の値を持つ行位置を取得する
+
+        Args:
+            matches: suggestで取得した候補のリスト
+
+        Returns:
+            行位置の配列（int32、昇順）
+        """
+        rows = []
+        for match in matches:
+            key_id = self._key_ids.get(match.field, {}).get(normalize_search_text(match.text))
+            if key_id is None:
+                continue
+            rows.append(self._rows[match.field][key_id])
+
+        if not rows:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(rows)).astype(np.int32)
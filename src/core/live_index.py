@@ -0,0 +1,291 @@
+"""
+ライブインデックスモジュール
+
+LIVE_IDごとの行位置を保持し、ライブ単位の検索を行うためのインデックスを提供します。
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+from src.core.utils import (
+    build_search_keys,
+    find_descending_date_slice,
+    get_search_key_column,
+    is_descending_dates,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# ライブタイトルのフィールド名
+LIVE_TITLE_FIELD = "ライブタイトル"
+
+# ソート用の配信日のフィールド名
+LIVE_DATE_FIELD = "ライブ配信日_sortable"
+
+
+class LiveIndex:
+    """
+    ライブインデックス
+
+    楽曲行をLIVE_IDごとにまとめ、各ライブの行位置をCSR形式
+    （ライブ順に並べた行位置の配列と、各ライブの開始オフセット）で保持します。
+    ライブタイトルはライブごとに一つだけ保持するため、ライブタイトルの検索は
+    楽曲行数ではなくライブ数に比例した処理で済みます。
+
+    パイプラインでソート済みのデータ（配信日降順 → LIVE_ID → タイムスタンプ）では
+    各ライブの行が連続するため、ライブの楽曲は行範囲のスライスで取得でき、
+    ライブ単位の配信日も降順に並ぶため、期間内のライブは二分探索で求められます。
+
+    Attributes:
+        version (str): データセットのバージョン
+        live_ids (np.ndarray): ライブごとのLIVE_ID（最初に出現した順）
+        live_dates (Optional[np.ndarray]): ライブごとの配信日（配信日列がない場合はNone）
+        is_contiguous (bool): 全てのライブの行が連続しているか
+
+    Examples:
+        >>> index = LiveIndex(df)
+        >>> positions = index.search_title("歌枠")
+        >>> setlist = index.get_songs(df, live_id)
+        >>> live_ids = index.get_lives_in_date_range("2024-01-01", "2024-01-31")
+    """
+
+    def __init__(self, df: pd.DataFrame, version: str = ""):
+        """
+        LiveIndexを初期化し、インデックスを構築する
+
+        Args:
+            df: インデックス化するDataFrame（LIVE_ID列が必要）
+            version: データセットのバージョン（任意）
+
+        Note:
+            - LIVE_IDが欠損している行はどのライブにも含まれません
+            - ライブタイトルはライブの最初の行の値を使用します
+            - 正規化済み検索キー列（「ライブタイトル_検索キー」）があればそれを使用します
+        """
+        import time
+
+        start_time = time.time()
+
+        self.version = version
+        self._num_rows = len(df)
+
+        codes, live_ids = pd.factorize(df["LIVE_ID"], sort=False)
+        codes = np.asarray(codes)
+        self.live_ids = np.asarray(live_ids)
+
+        # ライブ順に並べた行位置と、各ライブの開始オフセット
+        # 欠損値のコード（-1）の行は先頭に集まり、offsets[0]より前になる
+        self._order = np.argsort(codes, kind="stable").astype(np.int32)
+        self._offsets = np.searchsorted(
+            codes[self._order], np.arange(len(self.live_ids) + 1)
+        ).astype(np.int32)
+        self._numbers: Dict[Any, int] = {
+            live_id: number for number, live_id in enumerate(self.live_ids.tolist())
+        }
+
+        # 各ライブの行が連続していれば、ライブの行位置は先頭行からの範囲になる
+        lengths = np.diff(self._offsets)
+        self._starts = self._order[self._offsets[:-1]]
+        expected_order = (
+            np.repeat(self._starts, lengths)
+            + np.arange(self._offsets[-1] - self._offsets[0])
+            - np.repeat(self._offsets[:-1] - self._offsets[0], lengths)
+        )
+        self.is_contiguous = bool(
+            np.array_equal(self._order[self._offsets[0]:], expected_order)
+        )
+
+        # ライブごとのタイトルと検索キー（各ライブの最初の行）
+        first_rows = self._starts
+        key_column = get_search_key_column(LIVE_TITLE_FIELD)
+        if key_column in df.columns:
+            title_keys = df[key_column]
+        elif LIVE_TITLE_FIELD in df.columns:
+            title_keys = build_search_keys(df[LIVE_TITLE_FIELD])
+        else:
+            title_keys = pd.Series([""] * len(df), index=df.index)
+        self._title_keys: List[str] = [
+            "" if pd.isna(key) else str(key)
+            for key in title_keys.iloc[first_rows].tolist()
+        ]
+
+        # ライブごとの配信日（各ライブの最初の行）
+        self.live_dates: Optional[np.ndarray] = None
+        self._dates_sorted = False
+        if LIVE_DATE_FIELD in df.columns:
+            self.live_dates = df[LIVE_DATE_FIELD].to_numpy()[first_rows]
+            self._dates_sorted = is_descending_dates(self.live_dates)
+
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"ライブインデックスを構築しました: {len(self.live_ids)}ライブ、"
+            f"{self._num_rows}行、処理時間: {elapsed_time:.3f}秒"
+        )
+
+    def __len__(self) -> int:
+        """ライブ数を返す"""
+        return len(self.live_ids)
+
+    def is_compatible(self, df: pd.DataFrame) -> bool:
+        """
+        インデックスが指定されたDataFrameに使用できるか判定する
+
+        Args:
+            df: 判定対象のDataFrame
+
+        Returns:
+            行数が一致する場合True
+        """
+        return len(df) == self._num_rows
+
+    def _get_number(self, live_id: Any) -> int:
+        """
+        LIVE_IDに対応するライブ番号を取得する
+
+        Args:
+            live_id: LIVE_ID
+
+        Returns:
+            ライブ番号（live_idsにおける位置）
+
+        Raises:
+            KeyError: LIVE_IDが存在しない場合
+        """
+        try:
+            return self._numbers[live_id]
+        except KeyError:
+            raise KeyError(f"LIVE_ID '{live_id}' は存在しません") from None
+
+    def get_live_slice(self, live_id: Any) -> slice:
+        """
+        ライブの楽曲行の範囲を取得する
+
+        Args:
+            live_id: LIVE_ID
+
+        Returns:
+            ライブの楽曲行の範囲（iloc用のslice）
+
+        Raises:
+            KeyError: LIVE_IDが存在しない場合
+            ValueError: ライブの行が連続していない場合
+        """
+        if not self.is_contiguous:
+            raise ValueError("ライブの行が連続していないため、範囲で取得できません")
+
+        number = self._get_number(live_id)
+        start = int(self._starts[number])
+        return slice(start, start + int(self._offsets[number + 1] - self._offsets[number]))
+
+    def get_live_positions(self, live_id: Any) -> np.ndarray:
+        """
+        ライブの楽曲行の行位置を取得する
+
+        Args:
+            live_id: LIVE_ID
+
+        Returns:
+            行位置の配列（int32、データの並び順）
+
+        Raises:
+            KeyError: LIVE_IDが存在しない場合
+        """
+        number = self._get_number(live_id)
+        return self._order[self._offsets[number]:self._offsets[number + 1]]
+
+    def get_songs(self, df: pd.DataFrame, live_id: Any) -> pd.DataFrame:
+        """
+        ライブで歌われた楽曲の行を取得する
+
+        行が連続している場合は、全件を走査せずに行範囲のスライスで取得します。
+
+        Args:
+            df: インデックスを構築したDataFrame
+            live_id: LIVE_ID
+
+        Returns:
+            ライブの楽曲行のDataFrame
+
+        Raises:
+            KeyError: LIVE_IDが存在しない場合
+        """
+        if self.is_contiguous:
+            return df.iloc[self.get_live_slice(live_id)]
+        return df.iloc[self.get_live_positions(live_id)]
+
+    def get_lives_in_date_range(
+        self,
+        start: Optional[Union[date, datetime, str]] = None,
+        end: Optional[Union[date, datetime, str]] = None
+    ) -> np.ndarray:
+        """
+        期間内に配信されたライブのLIVE_IDを取得する
+
+        ライブの配信日が降順に並んでいる場合は二分探索で範囲を求めます。
+
+        Args:
+            start: 期間の開始日（Noneの場合は制限なし、この日を含む）
+            end: 期間の終了日（Noneの場合は制限なし、この日を含む）
+
+        Returns:
+            LIVE_IDの配列（配信日の新しい順）。配信日列がない場合は空の配列
+
+        Examples:
+            >>> index.get_lives_in_date_range("2024-01-01", "2024-01-31")
+        """
+        if self.live_dates is None:
+            return self.live_ids[:0]
+
+        if self._dates_sorted:
+            return self.live_ids[find_descending_date_slice(self.live_dates, start, end)]
+
+        # 配信日が並んでいない場合は全ライブを比較する
+        dates = self.live_dates
+        mask = ~np.isnat(dates)
+        if start is not None:
+            mask &= dates >= np.datetime64(pd.Timestamp(start).normalize())
+        if end is not None:
+            end_exclusive = pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+            mask &= dates < np.datetime64(end_exclusive)
+        return self.live_ids[mask]
+
+    def _expand(self, live_numbers: np.ndarray) -> np.ndarray:
+        """
+        ライブ番号の配列を、それらのライブに含まれる行位置に展開する
+
+        Args:
+            live_numbers: ライブ番号（live_idsにおける位置）の配列
+
+        Returns:
+            行位置の配列（int32、昇順）
+        """
+        if len(live_numbers) == 0:
+            return np.empty(0, dtype=np.int32)
+
+        rows = np.concatenate([
+            self._order[self._offsets[number]:self._offsets[number + 1]]
+            for number in live_numbers.tolist()
+        ])
+        return np.sort(rows)
+
+    def search_title(self, normalized_query: str) -> np.ndarray:
+        """
+        ライブタイトルに検索語を含むライブの行位置を取得する
+
+        ライブごとのタイトルを一度だけ照合し、一致したライブの行に展開します。
+
+        Args:
+            normalized_query: 正規化済みの検索語
+
+        Returns:
+            一致したライブに含まれる行位置の配列（int32、昇順）
+        """
+        matched = np.asarray([
+            number for number, key in enumerate(self._title_keys)
+            if normalized_query in key
+        ], dtype=np.int64)
+        return self._expand(matched)
@@ -0,0 +1,113 @@
+"""
+検索クエリ解析モジュール
+
+検索フォームに入力されたクエリ文字列を、AND/OR/除外条件と
+フィールド指定を持つ構造（ParsedQuery）に変換します。
+
+構文:
+    - スペース区切りの検索語はAND条件（全角スペースも区切りとして扱う）
+    - 「OR」（大文字）または「|」で区切るとOR条件（ANDより優先度が低い）
+    - 「-」で始まる検索語は除外条件
+    - 「artist:」「title:」「live:」でフィールドを指定
+    - ダブルクォートで囲むとスペースを含む語句を1つの検索語として扱う
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from src.models.search_query_models import ParsedQuery, QueryTerm
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# フィールド指定のプレフィックスとフィールド名の対応
+FIELD_PREFIXES: Dict[str, str] = {
+    "artist": "アーティスト",
+    "title": "曲名",
+    "live": "ライブタイトル",
+}
+
+# OR条件の区切り
+OR_OPERATORS = ("OR", "|")
+
+# 検索語のパターン（除外記号、フィールド指定、語句または単語）
+_TOKEN_PATTERN = re.compile(
+    r'(?P<negated>-)?'
+    r'(?:(?P<prefix>' + "|".join(FIELD_PREFIXES) + r'):)?'
+    r'(?:"(?P<phrase>[^"]*)"?|(?P<word>\S+))',
+    re.IGNORECASE
+)
+
+
+def parse_query(query: str) -> ParsedQuery:
+    """
+    検索クエリ文字列を解析する
+    
+    Args:
+        query: 検索クエリ文字列
+    
+    Returns:
+        ParsedQuery: 解析済み検索クエリ
+    
+    Examples:
+        >>> parse_query("LiSA -炎")
+        ParsedQuery(clauses=[[QueryTerm(text='LiSA'), QueryTerm(text='炎', negated=True)]])
+        >>> parse_query("artist:YOASOBI OR title:夜")
+        ParsedQuery(clauses=[[QueryTerm(text='YOASOBI', field='アーティスト')],
+                             [QueryTerm(text='夜', field='曲名')]])
+    
+    Notes:
+        - 空の語句（「""」）は無視します
+        - 「-」や「artist:」のみのトークンは通常の検索語として扱います
+        - 前後のどちらかに検索語がないOR演算子（「OR」のみ、「a OR」、「| b」など）は
+          通常の検索語として扱います
+    """
+    # トークン（OR演算子はNone、検索語はQueryTerm）に分割する
+    tokens: List[Tuple[Optional[QueryTerm], str]] = []
+    position = 0
+    
+    while True:
+        # 区切り（空白）を読み飛ばす
+        while position < len(query) and query[position].isspace():
+            position += 1
+        if position >= len(query):
+            break
+        
+        match = _TOKEN_PATTERN.match(query, position)
+        position = match.end()
+        
+        if match.group("word") in OR_OPERATORS and not match.group("negated") \
+                and not match.group("prefix"):
+            tokens.append((None, match.group("word")))
+            continue
+        
+        text = match.group("phrase") if match.group("phrase") is not None else match.group("word")
+        if not text:
+            # 空の語句（「""」）は無視する
+            continue
+        
+        prefix = match.group("prefix")
+        tokens.append((QueryTerm(
+            text=text,
+            field=FIELD_PREFIXES[prefix.lower()] if prefix else None,
+            negated=bool(match.group("negated"))
+        ), text))
+    
+    # 前後に検索語がないOR演算子（先頭・末尾のもの）は通常の検索語として扱う
+    term_indexes = [index for index, (term, _) in enumerate(tokens) if term is not None]
+    first_term = term_indexes[0] if term_indexes else len(tokens)
+    last_term = term_indexes[-1] if term_indexes else -1
+    
+    clauses: List[List[QueryTerm]] = [[]]
+    for index, (term, text) in enumerate(tokens):
+        if term is not None:
+            clauses[-1].append(term)
+        elif first_term < index < last_term:
+            clauses.append([])
+        else:
+            clauses[-1].append(QueryTerm(text=text))
+    
+    parsed = ParsedQuery(clauses=[clause for clause in clauses if clause])
+    logger.debug(f"検索クエリを解析しました: '{query}' -> {parsed}")
+    return parsed
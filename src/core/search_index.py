@@ -0,0 +1,247 @@
+"""
+検索インデックスモジュール
+
+キーワード検索を高速化するための文字n-gram転置インデックスを提供します。
+パイプラインの処理結果から一度だけ構築し、検索時は候補行の絞り込みに使用します。
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class SearchIndex:
+    """
+    文字n-gram転置インデックス
+
+    検索対象フィールドの各値を大文字小文字を畳み込んだ（casefold）文字列に変換し、
+    1文字（unigram）と2文字（bigram）をキーとして行位置のリストを保持します。
+    検索時はクエリのn-gramに対応する行位置の積集合を候補とし、
+    候補行のみで部分一致を検証することで、全行スキャンを回避します。
+
+    行位置はインデックス構築時のDataFrameにおける0始まりの位置（iloc）です。
+
+    Attributes:
+        fields (List[str]): インデックス化されたフィールドのリスト
+        version (str): データセットのバージョン（同一データかどうかの判定に使用）
+
+    Examples:
+        >>> index = SearchIndex(df, ["曲名", "アーティスト"])
+        >>> positions = index.search_field("曲名", "lemon", case_sensitive=False)
+        >>> df.iloc[positions]
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        fields: Sequence[str],
+        version: str = ""
+    ):
+        """
+        SearchIndexを初期化し、インデックスを構築する
+
+        Args:
+            df: インデックス化するDataFrame
+            fields: インデックス化するフィールドのリスト
+            version: データセットのバージョン（任意）
+
+        Note:
+            - DataFrameに存在しないフィールドはスキップされます
+            - 欠損値は空文字列として扱われ、どのクエリにも一致しません
+        """
+        import time
+
+        start_time = time.time()
+
+        self.version = version
+        self.fields: List[str] = []
+        self._num_rows = len(df)
+        self._texts: Dict[str, List[str]] = {}
+        self._folded_texts: Dict[str, List[str]] = {}
+        self._postings: Dict[str, Dict[str, np.ndarray]] = {}
+
+        for field in fields:
+            if field not in df.columns:
+                logger.warning(f"フィールド '{field}' が存在しないためインデックス化をスキップします")
+                continue
+
+            texts = [
+                "" if pd.isna(value) else str(value)
+                for value in df[field].tolist()
+            ]
+            folded_texts = [text.casefold() for text in texts]
+
+            self._texts[field] = texts
+            self._folded_texts[field] = folded_texts
+            self._postings[field] = self._build_postings(folded_texts)
+            self.fields.append(field)
+
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"検索インデックスを構築しました: {self._num_rows}行、"
+            f"フィールド={self.fields}、処理時間: {elapsed_time:.3f}秒"
+        )
+
+    @staticmethod
+    def _extract_grams(text: str) -> set:
+        """
+        文字列からunigramとbigramの集合を抽出する
+
+        Args:
+            text: 対象文字列（casefold済み）
+
+        Returns:
+            n-gramの集合
+        """
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def _build_postings(self, folded_texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        n-gramから行位置へのポスティングリストを構築する
+
+        Args:
+            folded_texts: casefold済みの文字列リスト
+
+        Returns:
+            n-gramをキー、昇順の行位置配列（int32）を値とする辞書
+        """
+        postings: Dict[str, List[int]] = {}
+        for position, text in enumerate(folded_texts):
+            for gram in self._extract_grams(text):
+                postings.setdefault(gram, []).append(position)
+
+        return {
+            gram: np.asarray(positions, dtype=np.int32)
+            for gram, positions in postings.items()
+        }
+
+    def is_compatible(self, df: pd.DataFrame) -> bool:
+        """
+        DataFrameがこのインデックスの構築元と同じ行構成かを判定する
+
+        Args:
+            df: 判定対象のDataFrame
+
+        Returns:
+            行数が一致する場合True
+        """
+        return len(df) == self._num_rows
+
+    def has_field(self, field: str) -> bool:
+        """
+        フィールドがインデックス化されているかを判定する
+
+        Args:
+            field: フィールド名
+
+        Returns:
+            インデックス化されている場合True
+        """
+        return field in self._postings
+
+    def candidates(self, field: str, query: str) -> np.ndarray:
+        """
+        クエリを含む可能性のある行位置（候補）を取得する
+
+        クエリのn-gramすべてを含む行の積集合を返します。
+        結果は実際の一致行の上位集合であり、検証は呼び出し側で行います。
+
+        Args:
+            field: フィールド名
+            query: 検索クエリ
+
+        Returns:
+            昇順の行位置配列
+        """
+        postings = self._postings[field]
+        folded_query = query.casefold()
+
+        if len(folded_query) >= 2:
+            grams = {folded_query[i:i + 2] for i in range(len(folded_query) - 1)}
+        else:
+            grams = {folded_query}
+
+        # 件数の少ないポスティングリストから順に積集合を取る
+        gram_postings: List[np.ndarray] = []
+        for gram in grams:
+            positions = postings.get(gram)
+            if positions is None:
+                return np.empty(0, dtype=np.int32)
+            gram_postings.append(positions)
+        gram_postings.sort(key=len)
+
+        result = gram_postings[0]
+        for positions in gram_postings[1:]:
+            result = np.intersect1d(result, positions, assume_unique=True)
+            if len(result) == 0:
+                break
+
+        return result
+
+    def search_field(
+        self,
+        field: str,
+        query: str,
+        case_sensitive: bool = False
+    ) -> np.ndarray:
+        """
+        フィールド内でクエリを部分一致検索する
+
+        Args:
+            field: フィールド名
+            query: 検索クエリ
+            case_sensitive: 大文字小文字を区別するか（デフォルト: False）
+
+        Returns:
+            一致した行位置の配列（昇順）
+        """
+        candidate_positions = self.candidates(field, query)
+
+        if case_sensitive:
+            texts = self._texts[field]
+            target = query
+        else:
+            texts = self._folded_texts[field]
+            target = query.casefold()
+
+        matched = [
+            position for position in candidate_positions.tolist()
+            if target in texts[position]
+        ]
+        return np.asarray(matched, dtype=np.int32)
+
+    def search(
+        self,
+        query: str,
+        fields: Sequence[str],
+        case_sensitive: bool = False
+    ) -> Optional[np.ndarray]:
+        """
+        複数フィールドに対してOR検索する
+
+        Args:
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか（デフォルト: False）
+
+        Returns:
+            いずれかのフィールドに一致した行位置の配列（昇順）。
+            インデックス化されていないフィールドが含まれる場合はNone
+        """
+        if not all(self.has_field(field) for field in fields):
+            return None
+
+        matched = [
+            self.search_field(field, query, case_sensitive)
+            for field in fields
+        ]
+        if not matched:
+            return np.empty(0, dtype=np.int32)
+
+        return np.unique(np.concatenate(matched)).astype(np.int32)
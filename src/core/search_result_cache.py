@@ -0,0 +1,119 @@
+"""
+検索結果キャッシュモジュール
+
+検索結果（一致した行位置）をLRU方式でキャッシュする機能を提供します。
+複数セッションで共有し、同じクエリの再検索を省略するために使用します。
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+import numpy as np
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCache:
+    """
+    検索結果のLRUキャッシュ
+
+    キーに対応する行位置の配列を保持し、上限を超えた場合は
+    最も長く使われていないエントリから破棄します。
+    Streamlitの複数セッション（スレッド）から同時に使用できるよう、
+    操作はロックで保護されます。
+
+    保存された配列は書き込み不可に設定され、全ての呼び出し元で共有されます。
+
+    Attributes:
+        max_size (int): 保持する最大エントリ数（0の場合はキャッシュしない）
+        hits (int): キャッシュヒット数
+        misses (int): キャッシュミス数
+
+    Examples:
+        >>> cache = SearchResultCache(max_size=256)
+        >>> cache.put(("v1", "lemon", ("曲名",), False), positions)
+        >>> cache.get(("v1", "lemon", ("曲名",), False))
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        SearchResultCacheを初期化する
+
+        Args:
+            max_size: 保持する最大エントリ数（0の場合はキャッシュしない）
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        logger.info(f"SearchResultCacheを初期化しました: 最大エントリ数={max_size}")
+
+    def __len__(self) -> int:
+        """保持しているエントリ数を返す"""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        キャッシュから検索結果を取得する
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            行位置の配列。キャッシュにない場合はNone
+        """
+        with self._lock:
+            positions = self._entries.get(key)
+            if positions is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return positions
+
+    def put(self, key: Hashable, positions: np.ndarray) -> None:
+        """
+        検索結果をキャッシュに保存する
+
+        Args:
+            key: キャッシュキー
+            positions: 行位置の配列
+        """
+        if self.max_size <= 0:
+            return
+
+        positions.flags.writeable = False
+        with self._lock:
+            self._entries[key] = positions
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """キャッシュと統計情報をクリアする"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        logger.info("検索結果キャッシュをクリアしました")
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        キャッシュの統計情報を取得する
+
+        Returns:
+            エントリ数、最大エントリ数、ヒット数、ミス数、ヒット率を含む辞書
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
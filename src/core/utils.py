@@ -6,13 +6,30 @@
 """
 
 import logging
-from typing import Optional
-from datetime import datetime
+import unicodedata
+from typing import Optional, Union
+from datetime import date, datetime
+import numpy as np
 import pandas as pd
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 正規化済み検索キー列の接尾辞
+SEARCH_KEY_SUFFIX = "_検索キー"
+
+# カタカナ（ァ〜ヶ、ヽヾ）をひらがなに変換する変換表
+_KATAKANA_TO_HIRAGANA = {
+    **{code: code - 0x60 for code in range(ord("ァ"), ord("ヶ") + 1)},
+    ord("ヽ"): ord("ゝ"),
+    ord("ヾ"): ord("ゞ"),
+}
+
+
+# 一括変換で高速に処理する標準的なタイムスタンプの形式（各区切りが半角数字のみ）
+# この形式に一致しない文字列は、convert_timestamp_to_secondsで1件ずつ変換する
+_PLAIN_TIMESTAMP_PATTERN = r"([0-9]+):([0-9]+)(?::([0-9]+))?"
+
 
 def convert_timestamp_to_seconds(timestamp_str: str) -> Optional[int]:
     """
@@ -41,6 +58,7 @@ def convert_timestamp_to_seconds(timestamp_str: str) -> Optional[int]:
     
     Notes:
         - 入力がNoneまたは文字列でない場合はNoneを返す
+        - 各区切りはint()で変換できる値を受け付ける（前後の空白、符号、全角数字を含む）
         - コロン区切りが3つでも2つでもない場合はNoneを返す
     """
     if pd.isna(timestamp_str) or not isinstance(timestamp_str, str):
@@ -62,6 +80,66 @@ def convert_timestamp_to_seconds(timestamp_str: str) -> Optional[int]:
         return None
 
 
+def convert_timestamps_to_seconds(timestamps: pd.Series) -> pd.Series:
+    """
+    タイムスタンプ文字列の列を秒数の列に一括変換する
+    
+    convert_timestamp_to_secondsと同じ規則で、HH:MM:SS形式またはMM:SS形式の
+    時間文字列を秒数に変換します。半角数字のみの標準的な形式の行は
+    正規表現による抽出（str.extract）と数値変換で列全体を一括処理し、
+    それ以外の文字列の行（空白や全角数字を含むものなど）のみ
+    convert_timestamp_to_secondsで1件ずつ変換します。
+    
+    Args:
+        timestamps: タイムスタンプ文字列の列
+    
+    Returns:
+        秒数の列（nullable整数型 Int64、入力と同じインデックス）。
+        変換できない行は欠損（<NA>）
+    
+    Examples:
+        >>> convert_timestamps_to_seconds(pd.Series(["1:23:45", "12:34", "invalid", None])).tolist()
+        [5025, 754, <NA>, <NA>]
+    
+    Notes:
+        - 文字列以外の値（数値など）は欠損として扱う
+        - 受け付ける値はconvert_timestamp_to_secondsと完全に同じ
+    """
+    if len(timestamps) == 0:
+        return pd.Series([], index=timestamps.index, dtype="Int64")
+    
+    # 文字列の値のみを対象とする（数値などは欠損として扱う）
+    values = timestamps.to_numpy(dtype=object)
+    is_text = np.fromiter(
+        (isinstance(value, str) for value in values), dtype=bool, count=len(values)
+    )
+    text = pd.Series(
+        np.where(is_text, values, None), index=timestamps.index, dtype="string"
+    )
+    
+    # 「数値:数値」または「数値:数値:数値」の標準的な形式を一括変換する（全体一致）
+    parts = text.str.extract(rf"^{_PLAIN_TIMESTAMP_PATTERN}\Z")
+    numbers = [
+        pd.to_numeric(parts[column], errors="coerce").astype("Int64")
+        for column in range(3)
+    ]
+    
+    has_hours = numbers[2].notna()
+    hms_seconds = numbers[0] * 3600 + numbers[1] * 60 + numbers[2]
+    ms_seconds = numbers[0] * 60 + numbers[1]
+    seconds = hms_seconds.where(has_hours, ms_seconds).astype("Int64")
+    
+    # 標準的な形式に一致しない文字列は、1件ずつの変換と同じ規則で変換する
+    unmatched = is_text & parts[0].isna().to_numpy(dtype=bool)
+    if unmatched.any():
+        seconds.iloc[np.flatnonzero(unmatched)] = pd.array(
+            [convert_timestamp_to_seconds(value) for value in values[unmatched]],
+            dtype="Int64"
+        )
+    
+    return seconds
+
+
 def generate_youtube_url(base_url: str, timestamp_seconds: int) -> str:
     """
     YouTubeタイムスタンプ付きURLを生成する
@@ -97,6 +175,51 @@ def generate_youtube_url(base_url: str, timestamp_seconds: int) -> str:
     return ""
 
 
+def generate_youtube_urls(
+    base_urls: pd.Series,
+    timestamp_seconds: pd.Series
+) -> pd.Series:
+    """
+    YouTubeタイムスタンプ付きURLを列単位で生成する
+    
+    generate_youtube_urlと同じ規則で、配信URLの列とタイムスタンプ（秒）の列から
+    タイムスタンプ付きURLの列を生成します。行ごとの関数呼び出しを行わず、
+    欠損値のマスクと文字列の連結で一括処理します。
+    
+    Args:
+        base_urls: 基本URL（YouTube配信のURL）の列
+        timestamp_seconds: タイムスタンプ（秒）の列。base_urlsと同じインデックスを持つこと
+    
+    Returns:
+        タイムスタンプ付きURLの列（base_urlsと同じインデックス）
+        - base_urlまたはtimestamp_secondsが欠損の行は空文字列
+        - それ以外の行は「base_url&t=秒数s」形式のURL
+    
+    Examples:
+        >>> generate_youtube_urls(
+        ...     pd.Series(["https://www.youtube.com/watch?v=abc123", None]),
+        ...     pd.Series([754, 100]),
+        ... ).tolist()
+        ['https://www.youtube.com/watch?v=abc123&t=754s', '']
+    
+    Notes:
+        - 秒数が小数の場合は、generate_youtube_urlと同様に切り捨てて整数にします
+    """
+    seconds = pd.to_numeric(timestamp_seconds, errors="coerce")
+    valid = (base_urls.notna() & seconds.notna()).to_numpy()
+    
+    urls = np.full(len(base_urls), "", dtype=object)
+    if valid.any():
+        # 小数部を切り捨ててから整数（nullable int）の文字列に変換する
+        seconds_text = (
+            np.trunc(seconds[valid]).astype("Int64").astype(str).to_numpy(dtype=object)
+        )
+        base_text = base_urls[valid].astype(str).to_numpy(dtype=object)
+        urls[valid] = base_text + "&t=" + seconds_text + "s"
+    
+    return pd.Series(urls, index=base_urls.index, dtype=object)
+
+
 def generate_song_numbers(df: pd.DataFrame) -> pd.DataFrame:
     """
     曲目番号を生成する
@@ -127,76 +250,44 @@ def generate_song_numbers(df: pd.DataFrame) -> pd.DataFrame:
         - 3曲目 → "3曲目"
     
     Notes:
-        - 入力DataFrameは変更されず、コピーが返されます
+        - 入力DataFrameは変更されず、コピーが返されます（インデックスは0始まりに振り直されます）
         - LIVE_IDとライブ配信日_sortableカラムが必須です
+        - 各LIVE_IDの配信日は1つであることを前提とします
+        - 配信日が欠損（NaT）の行はライブ番号が欠損となり、「N曲目」形式で表示されます
+        - 行ごとのapplyを使用せず、groupbyの集計と配列演算のみで計算します
     """
-    df_result = df.copy()
+    df_result = df.reset_index(drop=True)
+    dates = df_result["ライブ配信日_sortable"]
     
     # ステップ1: 各配信内での曲順を計算
     # groupby("LIVE_ID").cumcount()により、各配信内で0から始まる連番を生成し、+1で1始まりにする
     df_result["曲順"] = df_result.groupby("LIVE_ID").cumcount() + 1
 
     # ステップ2: 同一日内の配信に番号を振る（ライブ番号）
-    def assign_live_number_per_date(group_df):
-        """
-        同一日付内の各配信に連番（ライブ番号）を振る
-        
-        Args:
-            group_df: 同一日付でグループ化されたDataFrame
-        
-        Returns:
-            DataFrame: LIVE_IDとライブ番号を含むDataFrame
-        """
-        # factorizeにより、LIVE_IDの出現順に0から始まる番号を振り、+1で1始まりにする
-        factor_codes, _ = pd.factorize(group_df["LIVE_ID"])
-        group_df["ライブ番号"] = factor_codes + 1
-        return group_df[["LIVE_ID", "ライブ番号"]]
-
-    # ライブ番号の計算: 日付とLIVE_IDのユニークな組み合わせを抽出
-    temp_live_numbers = (
-        df_result[["ライブ配信日_sortable", "LIVE_ID"]].drop_duplicates().copy()
-    )
-
-    # ソートして、factorizeの順序を安定させる（LIVE_IDの昇順）
-    temp_live_numbers = temp_live_numbers.sort_values(
-        by=["ライブ配信日_sortable", "LIVE_ID"]
-    )
-
-    # 日付ごとにグループ化し、各配信にライブ番号を振る
-    temp_live_numbers = temp_live_numbers.groupby(
-        "ライブ配信日_sortable", group_keys=False
-    ).apply(assign_live_number_per_date, include_groups=False)
-
-    # ステップ3: 元のDataFrameにライブ番号をマージ
-    df_result = pd.merge(
-        df_result,
-        temp_live_numbers[["LIVE_ID", "ライブ番号"]],
-        on=["LIVE_ID"],
-        how="left",
-        suffixes=("", "_new"),
+    # 日付ごとにLIVE_IDの昇順で密な順位（1, 2, ...）を振る。配信日が欠損の行はNaNになる
+    live_numbers = df_result.groupby(dates)["LIVE_ID"].rank(method="dense")
+    has_missing_number = live_numbers.isna().any()
+    df_result["ライブ番号"] = (
+        live_numbers if has_missing_number else live_numbers.astype("int64")
     )
 
-    # マージで重複した列がある場合は新しい方を使用
-    if "ライブ番号_new" in df_result.columns:
-        df_result["ライブ番号"] = df_result["ライブ番号_new"]
-        df_result = df_result.drop(columns=["ライブ番号_new"])
-
-    # ステップ4: 各日付の配信数をカウント
+    # ステップ3: 各日付の配信数をカウント
     # 同一日に複数配信があるかどうかを判定するため
-    live_counts_per_date = df_result.groupby("ライブ配信日_sortable")[
-        "LIVE_ID"
-    ].transform("nunique")
+    live_counts_per_date = df_result.groupby(dates)["LIVE_ID"].transform("nunique")
+    is_multi_live = (live_counts_per_date > 1).to_numpy()
 
-    # ステップ5: 曲目番号の表示形式を決定
+    # ステップ4: 曲目番号の表示形式を決定
     # 同一日に複数配信がある場合: "1-3曲目"（1番目の配信の3曲目）
     # 同一日に単一配信の場合: "3曲目"
-    df_result["曲目"] = df_result.apply(
-        lambda row: (
-            f"{row['ライブ番号']}-{row['曲順']}曲目"
-            if live_counts_per_date.loc[row.name] > 1
-            else f"{row['曲順']}曲目"
-        ),
-        axis=1,
+    song_labels = df_result["曲順"].astype(str).to_numpy(dtype=object) + "曲目"
+    # 配信日が欠損の行は単一配信扱いとなるため、ライブ番号の表示には使用されない
+    live_labels = (
+        live_numbers.fillna(0).astype("int64").astype(str).to_numpy(dtype=object)
+    )
+    df_result["曲目"] = np.where(
+        is_multi_live,
+        live_labels + "-" + song_labels,
+        song_labels,
     )
     
     return df_result
@@ -255,3 +346,152 @@ def convert_date_string(date_str: str) -> Optional[datetime]:
         return None
     except (ValueError, TypeError, AttributeError):
         return None
+
+
+def is_descending_dates(dates: np.ndarray) -> bool:
+    """
+    日時配列が降順（欠損値は末尾）に並んでいるか判定する
+    
+    find_descending_date_sliceの前提条件の確認に使用します。
+    
+    Args:
+        dates: datetime64配列
+    
+    Returns:
+        降順に並び、欠損値（NaT）が全て末尾にある場合True
+    
+    Examples:
+        >>> is_descending_dates(pd.to_datetime(["2024-03-01", "2024-01-05", None]).to_numpy())
+        True
+    """
+    dates = np.asarray(dates)
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        dates = dates.astype("datetime64[ns]")
+    # NaTはint64の最小値のため、欠損値が末尾にあれば整数値として非増加になる
+    values = dates.view("i8")
+    return bool(np.all(values[:-1] >= values[1:]))
+
+
+def find_descending_date_slice(
+    dates: np.ndarray,
+    start: Optional[Union[date, datetime, str]] = None,
+    end: Optional[Union[date, datetime, str]] = None
+) -> slice:
+    """
+    降順に並んだ日時配列から、期間内の要素の範囲を二分探索で求める
+    
+    期間は日単位で、開始日・終了日とも含みます（終了日はその日の終わりまで）。
+    
+    Args:
+        dates: 降順に並び、欠損値（NaT）が末尾にあるdatetime64配列
+        start: 期間の開始日（Noneの場合は制限なし）
+        end: 期間の終了日（Noneの場合は制限なし）
+    
+    Returns:
+        期間内の要素の範囲を表すslice（欠損値は含まない）
+    
+    Examples:
+        >>> dates = pd.to_datetime(["2024-03-01", "2024-02-10", "2024-01-05"]).to_numpy()
+        >>> find_descending_date_slice(dates, "2024-02-01", "2024-02-29")
+        slice(1, 2, None)
+    
+    Notes:
+        - 比較回数は要素数に対して対数オーダーです
+        - 配列が降順でない場合の結果は不定です（is_descending_datesで確認できます）
+    """
+    dates = np.asarray(dates)
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        dates = dates.astype("datetime64[ns]")
+    # 降順の配列をビット反転（~x = -x - 1）により昇順にしてnp.searchsortedで探索する
+    # 符号反転と異なり、NaT（int64の最小値）もオーバーフローせず最大値として末尾に並ぶ
+    ascending = ~dates.view("i8")
+    
+    def to_key(day) -> np.int64:
+        return ~np.datetime64(pd.Timestamp(day).normalize()).astype(dates.dtype).view("i8")
+    
+    # 欠損値は末尾に並ぶため、最初の欠損値の位置までが対象
+    not_a_time = ~np.datetime64("NaT").astype(dates.dtype).view("i8")
+    num_valid = int(np.searchsorted(ascending, not_a_time, side="left"))
+    
+    lower = 0
+    if end is not None:
+        end_exclusive = to_key(pd.Timestamp(end).normalize() + pd.Timedelta(days=1))
+        lower = int(np.searchsorted(ascending[:num_valid], end_exclusive, side="right"))
+    upper = num_valid
+    if start is not None:
+        upper = int(np.searchsorted(ascending[:num_valid], to_key(start), side="right"))
+    
+    return slice(lower, max(lower, upper))
+
+
+def normalize_search_text(text: str) -> str:
+    """
+    検索用に文字列を正規化する
+    
+    表記ゆれを吸収して検索できるように、以下の正規化を順に適用します。
+    
+    1. NFKC正規化（半角カナ・全角英数字などの幅の統一）
+    2. casefold（大文字小文字の畳み込み）
+    3. カタカナをひらがなに統一
+    
+    Args:
+        text: 正規化する文字列
+    
+    Returns:
+        正規化された文字列。入力が欠損値の場合は空文字列
+    
+    Examples:
+        >>> normalize_search_text("ボカロ")
+        'ぼかろ'
+        >>> normalize_search_text("ﾎﾞｶﾛ")
+        'ぼかろ'
+        >>> normalize_search_text("ＬｉＳＡ")
+        'lisa'
+    
+    Notes:
+        - 長音記号（ー）はカタカナ・ひらがな共通のため変換しません
+    """
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return ""
+    
+    normalized = unicodedata.normalize("NFKC", str(text)).casefold()
+    return normalized.translate(_KATAKANA_TO_HIRAGANA)
+
+
+def get_search_key_column(field: str) -> str:
+    """
+    フィールドに対応する正規化済み検索キー列の列名を取得する
+    
+    Args:
+        field: 元のフィールド名（例: "曲名"）
+    
+    Returns:
+        検索キー列の列名（例: "曲名_検索キー"）
+    """
+    return f"{field}{SEARCH_KEY_SUFFIX}"
+
+
+def build_search_keys(series: pd.Series) -> pd.Series:
+    """
+    列全体の正規化済み検索キーを生成する
+    
+    ユニークな値ごとに一度だけnormalize_search_textを適用し、
+    結果を各行に割り当てます。
+    
+    Args:
+        series: 正規化する列
+    
+    Returns:
+        正規化済み検索キーの列（欠損値は空文字列）
+    
+    Examples:
+        >>> build_search_keys(pd.Series(["ボカロ", None, "ボカロ"])).tolist()
+        ['ぼかろ', '', 'ぼかろ']
+    """
+    codes, uniques = pd.factorize(series)
+    # 欠損値のコード（-1）は末尾の空文字列を参照する
+    normalized = np.array(
+        [normalize_search_text(value) for value in uniques] + [""],
+        dtype=object,
+    )
+    return pd.Series(normalized[codes], index=series.index, dtype=object)
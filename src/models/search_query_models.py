@@ -0,0 +1,54 @@
+"""検索クエリのデータモデル
+
+このモジュールは、検索クエリ構文の解析結果を表すデータモデルを定義します。
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class QueryTerm:
+    """検索語
+    
+    Attributes:
+        text: 検索する文字列
+        field: 検索対象フィールド（フィールド指定がない場合はNone）
+        negated: 除外条件かどうか（「-」付きの検索語）
+    """
+    text: str
+    field: Optional[str] = None
+    negated: bool = False
+
+
+@dataclass
+class ParsedQuery:
+    """解析済み検索クエリ
+    
+    OR で区切られた節のリストです。各節は検索語のAND条件を表し、
+    クエリ全体はいずれかの節を満たす行に一致します。
+    
+    Attributes:
+        clauses: 節（検索語のリスト）のリスト
+    """
+    clauses: List[List[QueryTerm]] = field(default_factory=list)
+    
+    def is_empty(self) -> bool:
+        """検索語が1つもない場合True"""
+        return not any(self.clauses)
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """あいまい検索の候補
+    
+    Attributes:
+        text: 候補の文字列（表示用の元の値）
+        field: 候補が含まれるフィールド
+        distance: 正規化後のクエリとのレーベンシュタイン距離
+        row_count: 候補の値を持つ行数
+    """
+    text: str
+    field: str
+    distance: int
+    row_count: int
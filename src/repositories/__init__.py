@@ -10,6 +10,7 @@ from src.repositories.timestamp_repository import TimestampRepository
 from src.repositories.song_list_repository import SongListRepository
 from src.repositories.excel_repository import ExcelRepository
 from src.repositories.tsv_repository import TsvRepository
+from src.repositories.processed_data_repository import ProcessedDataRepository
 
 __all__ = [
     'FileRepository',
@@ -17,5 +18,6 @@ __all__ = [
     'TimestampRepository',
     'SongListRepository',
     'ExcelRepository',
-    'TsvRepository'
+    'TsvRepository',
+    'ProcessedDataRepository'
 ]
@@ -5,7 +5,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 from src.models.artist_sort_models import ArtistSortMapping
 
@@ -15,6 +15,9 @@ class ArtistSortMappingRepository:
     
     TSV形式のファイルからアーティスト名とソート名のマッピングを
     読み込み、保存、削除する機能を提供する。
+    
+    save_mapping()・delete_mapping()でマッピングを変更すると、
+    add_listener()で登録されたリスナーに変更内容を通知する。
     """
     
     def __init__(self, file_path: str):
@@ -25,6 +28,36 @@ class ArtistSortMappingRepository:
         """
         self.file_path = Path(file_path)
         self.logger = logging.getLogger(__name__)
+        self._listeners: List[Callable[[str, Optional[str]], None]] = []
+    
+    def add_listener(self, listener: Callable[[str, Optional[str]], None]) -> None:
+        """マッピングの変更を通知するリスナーを登録
+        
+        Args:
+            listener: アーティスト名（トリム済み）と新しいソート名
+                （削除された場合はNone）を受け取る関数
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[str, Optional[str]], None]) -> None:
+        """登録済みのリスナーを解除
+        
+        Args:
+            listener: add_listener()で登録した関数
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify_listeners(self, artist: str, sort_name: Optional[str]) -> None:
+        """マッピングの変更をリスナーに通知する（内部メソッド）
+        
+        Args:
+            artist: 変更されたアーティスト名
+            sort_name: 新しいソート名（削除された場合はNone）
+        """
+        for listener in list(self._listeners):
+            listener(artist, sort_name)
     
     def load_mappings(self) -> Dict[str, str]:
         """修正マッピングをファイルから読み込む
@@ -145,6 +178,7 @@ class ArtistSortMappingRepository:
             self.logger.info(
                 f"修正マッピングを保存しました: {artist} -> {sort_name}"
             )
+            self._notify_listeners(artist, sort_name)
             
         except PermissionError as e:
             error_msg = "ファイルへの書き込み権限がありません"
@@ -201,6 +235,7 @@ class ArtistSortMappingRepository:
             self.logger.info(
                 f"修正マッピングを削除しました: {artist}"
             )
+            self._notify_listeners(artist, None)
             return True
             
         except PermissionError as e:
@@ -0,0 +1,236 @@
+"""
+処理済みデータリポジトリモジュール
+
+DataPipelineの処理結果を列指向のArrow IPCファイルとして保存・読み込みします。
+ファイルには元データのフィンガープリントを埋め込み、
+元データが変わっていない場合のみ読み込み結果を返します。
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+from src.exceptions.errors import DataSaveError
+from src.utils.file_fingerprint import FileFingerprint
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:
+    pa = None
+    pa_ipc = None
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# スキーマメタデータのキー
+SOURCE_VERSION_KEY = b"shinouta.source_version"
+FORMAT_VERSION_KEY = b"shinouta.format_version"
+PIPELINE_VERSION_KEY = b"shinouta.pipeline_version"
+OBJECT_COLUMNS_KEY = b"shinouta.object_columns"
+
+# 処理済みデータの形式バージョン
+# パイプラインの出力列や型を変更した場合は値を上げ、既存のファイルを無効化する
+PROCESSED_DATA_FORMAT_VERSION = "2"
+
+# 処理済みデータの内容を決めるモジュール
+# これらのソースコードが変わると、形式バージョンを上げなくても既存のファイルは無効になる
+PIPELINE_MODULES = ("src.core.data_pipeline", "src.core.utils")
+
+
+@lru_cache(maxsize=1)
+def compute_pipeline_version() -> str:
+    """
+    処理済みデータを生成するパイプラインのコードのバージョンを計算する
+
+    PIPELINE_MODULESのソースファイルの内容のハッシュから計算するため、
+    パイプラインの処理を変更すると自動的に異なる値になります。
+
+    Returns:
+        str: パイプラインのバージョン（ソースファイルが見つからない場合は"unknown"を含む値）
+    """
+    hasher = hashlib.sha256()
+    for module_name in PIPELINE_MODULES:
+        spec = importlib.util.find_spec(module_name)
+        origin = spec.origin if spec is not None else None
+        hasher.update(module_name.encode("utf-8"))
+        if origin is None or not os.path.exists(origin):
+            hasher.update(b"unknown")
+            continue
+        with open(origin, "rb") as f:
+            hasher.update(f.read())
+    return hasher.hexdigest()[:16]
+
+
+def compute_source_version(source_paths: Sequence[str]) -> str:
+    """
+    処理済みデータのキーとなる元データのバージョンを計算する
+
+    デプロイ時のチェックアウトなどで更新時刻やパスが変わっても一致するよう、
+    ファイルサイズとコンテンツハッシュのみから計算します。
+
+    Args:
+        source_paths: 元データファイルのパスのリスト
+
+    Returns:
+        str: 元データのバージョン
+    """
+    keys = []
+    for path in source_paths:
+        fingerprint = FileFingerprint.from_path(path, include_hash=True)
+        keys.append(f"{fingerprint.size}:{fingerprint.content_hash}")
+    return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:16]
+
+
+class ProcessedDataRepository:
+    """
+    処理済みデータリポジトリ
+
+    処理済みDataFrameをArrow IPCファイルに保存し、
+    起動時にパイプラインを実行せずに読み込むための高速読み込み用ファイルとして使用します。
+
+    読み込み結果は通常のpandas DataFrameとしてメモリ上に展開されます
+    （ファイルをメモリマップしたまま参照し続けるわけではありません）。
+
+    Attributes:
+        file_path (Path): 処理済みデータファイルのパス
+
+    Examples:
+        >>> repository = ProcessedDataRepository("data/processed_data.arrow")
+        >>> version = compute_source_version(["data/M_YT_LIVE.TSV", "data/M_YT_LIVE_TIMESTAMP.TSV"])
+        >>> df = repository.load(version)
+        >>> if df is None:
+        ...     df = pipeline.execute()
+        ...     repository.save(df, version)
+    """
+
+    def __init__(self, file_path: str):
+        """
+        リポジトリを初期化
+
+        Args:
+            file_path: 処理済みデータファイルのパス
+        """
+        self.file_path = Path(file_path)
+        logger.info(f"ProcessedDataRepository initialized with file_path: {file_path}")
+
+    def is_available(self) -> bool:
+        """
+        pyarrowが利用可能かどうかを返す
+
+        Returns:
+            bool: 利用可能な場合True
+        """
+        return pa is not None
+
+    def load(self, source_version: str) -> Optional[pd.DataFrame]:
+        """
+        元データのバージョンが一致する場合に処理済みデータを読み込む
+
+        形式バージョンとパイプラインのバージョン（compute_pipeline_version）も
+        保存時と一致する場合のみ使用します。保存時にobject型だった列はobject型に戻します。
+
+        ファイルはメタデータの確認と読み込みのためにメモリマップで開きますが、
+        to_pandasにより全ての列がDataFrameにコピーされます。
+        呼び出し側でキャッシュする場合も、ファイルとメモリを共有することはありません。
+
+        Args:
+            source_version: 元データのバージョン（compute_source_versionの戻り値）
+
+        Returns:
+            処理済みDataFrame。ファイルが存在しない、バージョンが一致しない、
+            または読み込みに失敗した場合はNone
+        """
+        if not self.is_available():
+            logger.debug("pyarrowが利用できないため処理済みデータを読み込みません")
+            return None
+
+        if not self.file_path.exists():
+            logger.info(f"処理済みデータが存在しません: {self.file_path}")
+            return None
+
+        try:
+            with pa.memory_map(str(self.file_path), "r") as source:
+                reader = pa_ipc.open_file(source)
+                metadata = reader.schema.metadata or {}
+
+                if metadata.get(FORMAT_VERSION_KEY) != PROCESSED_DATA_FORMAT_VERSION.encode():
+                    logger.info(f"処理済みデータの形式バージョンが異なるため使用しません: {self.file_path}")
+                    return None
+                if metadata.get(PIPELINE_VERSION_KEY) != compute_pipeline_version().encode():
+                    logger.info(f"データ処理の内容が変更されているため処理済みデータを使用しません: {self.file_path}")
+                    return None
+                if metadata.get(SOURCE_VERSION_KEY) != source_version.encode():
+                    logger.info(f"元データが更新されているため処理済みデータを使用しません: {self.file_path}")
+                    return None
+
+                table = reader.read_all()
+                df = table.to_pandas()
+
+                # Arrowの往復で文字列型に推論されたobject型の列を元の型（欠損値はNone）に戻す
+                object_columns = json.loads(metadata.get(OBJECT_COLUMNS_KEY, b"[]").decode("utf-8"))
+                for column in object_columns:
+                    if column in df.columns:
+                        df[column] = pd.Series(
+                            table.column(column).to_pylist(), index=df.index, dtype=object
+                        )
+        except Exception as e:
+            logger.warning(f"処理済みデータの読み込みに失敗しました: {self.file_path}: {e}")
+            return None
+
+        logger.info(f"処理済みデータを読み込みました: {self.file_path} ({len(df)}件)")
+        return df
+
+    def save(self, df: pd.DataFrame, source_version: str) -> None:
+        """
+        処理済みデータを保存する
+
+        一時ファイルに書き込んでから置き換えるため、
+        読み込み中のプロセスが書きかけのファイルを読むことはありません。
+
+        Args:
+            df: 処理済みDataFrame
+            source_version: 元データのバージョン
+
+        Raises:
+            DataSaveError: pyarrowが利用できない場合、または書き込みに失敗した場合
+        """
+        if not self.is_available():
+            raise DataSaveError(
+                str(self.file_path),
+                "pyarrowがインストールされていないため処理済みデータを保存できません"
+            )
+
+        temp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[SOURCE_VERSION_KEY] = source_version.encode()
+            metadata[FORMAT_VERSION_KEY] = PROCESSED_DATA_FORMAT_VERSION.encode()
+            metadata[PIPELINE_VERSION_KEY] = compute_pipeline_version().encode()
+            metadata[OBJECT_COLUMNS_KEY] = json.dumps(
+                [str(column) for column in df.columns if df[column].dtype == object],
+                ensure_ascii=False
+            ).encode("utf-8")
+            table = table.replace_schema_metadata(metadata)
+
+            with pa.OSFile(str(temp_path), "wb") as sink:
+                with pa_ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(temp_path, self.file_path)
+        except Exception as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            logger.error(f"処理済みデータの保存に失敗しました: {self.file_path}: {e}")
+            raise DataSaveError(str(self.file_path), str(e)) from e
+
+        logger.info(f"処理済みデータを保存しました: {self.file_path} ({len(df)}件)")
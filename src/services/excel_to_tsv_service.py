@@ -18,6 +18,13 @@ from src.models.excel_to_tsv_models import (
 from src.repositories.excel_repository import ExcelRepository
 from src.repositories.tsv_repository import TsvRepository
 from src.repositories.backup_repository import BackupRepository
+from src.repositories.processed_data_repository import (
+    ProcessedDataRepository,
+    compute_source_version,
+)
+from src.config.settings import Config
+from src.services.data_service import DataService
+from src.core.data_pipeline import DataPipeline
 from src.exceptions.errors import DataLoadError, DataSaveError
 
 
@@ -561,3 +568,56 @@ class ExcelToTsvService:
                 exc_info=True
             )
             return False
+    
+    def build_processed_data(
+        self,
+        live_file: str,
+        timestamp_file: str,
+        output_file: str
+    ) -> bool:
+        """
+        処理済みデータを生成
+        
+        DataPipelineを一度だけ実行し、曲目・タイムスタンプ付きURL・ソート用日付・
+        正規化済み検索キーを含む配信用データを処理済みデータファイルに書き出します。
+        Webアプリは元データと一致する処理済みデータを優先して読み込むため、
+        各レプリカでのパイプライン実行が不要になります。
+        
+        Args:
+            live_file: M_YT_LIVE.TSVファイルのパス
+            timestamp_file: M_YT_LIVE_TIMESTAMP.TSVファイルのパス
+            output_file: 処理済みデータファイルのパス
+            
+        Returns:
+            生成が成功した場合True
+        """
+        try:
+            self.logger.info("処理済みデータを生成します")
+            
+            config = Config(
+                lives_file_path=live_file,
+                songs_file_path=timestamp_file,
+                enable_cache=False
+            )
+            pipeline = DataPipeline(DataService(config), config)
+            df = pipeline.execute()
+            if df is None:
+                self.logger.error("データパイプラインの実行に失敗したため処理済みデータを生成できません")
+                return False
+            
+            repository = ProcessedDataRepository(output_file)
+            repository.save(df, compute_source_version([live_file, timestamp_file]))
+            
+            self.logger.info(f"処理済みデータを生成しました: {output_file} ({len(df)}件)")
+            return True
+        
+        except DataSaveError as e:
+            self.logger.error(f"処理済みデータの保存に失敗しました: {e}")
+            return False
+        
+        except Exception as e:
+            self.logger.error(
+                f"処理済みデータの生成中にエラーが発生しました: {e}",
+                exc_info=True
+            )
+            return False
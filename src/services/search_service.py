@@ -5,12 +5,33 @@
 """
 
 import logging
-from typing import List, Dict, Any
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Hashable, Tuple, Union
+import numpy as np
 import pandas as pd
 
+from src.core.search_index import SearchIndex
+from src.core.equality_index import EqualityIndex
+from src.core.fuzzy_index import FuzzyIndex
+from src.core.live_index import LIVE_DATE_FIELD, LIVE_TITLE_FIELD, LiveIndex
+from src.core.search_result_cache import SearchResultCache
+from src.core.query_parser import FIELD_PREFIXES, parse_query
+from src.models.search_query_models import FuzzyMatch, ParsedQuery
+from src.core.utils import (
+    find_descending_date_slice,
+    is_descending_dates,
+    normalize_search_text,
+    get_search_key_column,
+    build_search_keys,
+)
+
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 期間の指定（開始日, 終了日）。どちらもNoneの場合は制限なし
+DateLike = Union[date, datetime, str]
+DateRange = Tuple[Optional[DateLike], Optional[DateLike]]
+
 
 class SearchService:
     """
@@ -25,8 +46,16 @@ class SearchService:
         >>> filtered = service.filter_by_multiple_conditions(df, {"配信日": "2024-01-01"})
     """
     
-    def __init__(self):
-        """検索サービスの初期化"""
+    def __init__(self, result_cache: Optional[SearchResultCache] = None):
+        """
+        検索サービスの初期化
+        
+        Args:
+            result_cache: 検索結果キャッシュ（任意）。
+                          複数のSearchServiceで共有すると、プロセス全体で
+                          同じクエリの検索結果を再利用できます
+        """
+        self.result_cache = result_cache
         logger.info("SearchServiceを初期化しました")
     
     def search(
@@ -34,7 +63,12 @@ class SearchService:
         df: pd.DataFrame,
         query: str,
         fields: List[str],
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        index: Optional[SearchIndex] = None,
+        normalize: bool = False,
+        use_query_syntax: bool = False,
+        live_index: Optional[LiveIndex] = None,
+        date_range: Optional[DateRange] = None
     ) -> pd.DataFrame:
         """
         データフレームを検索する
@@ -48,14 +82,31 @@ class SearchService:
             query: 検索クエリ（キーワード）
             fields: 検索対象フィールドのリスト
             case_sensitive: 大文字小文字を区別するか（デフォルト: False）
+            index: dfから構築済みの検索インデックス（任意）。
+                   指定された場合、インデックス化されたフィールドは
+                   候補行の絞り込み後に一致を検証します
+            normalize: 正規化検索モードを使用するか（デフォルト: False）。
+                       Trueの場合、クエリと正規化済み検索キー列（例: 「曲名_検索キー」）を
+                       照合し、全角半角・大文字小文字・カタカナひらがなの違いを無視します。
+                       case_sensitiveは無視されます
+            use_query_syntax: クエリ構文を使用するか（デフォルト: False）。
+                              Trueの場合、スペース区切りのAND、「OR」、「-」による除外、
+                              「artist:」「title:」「live:」によるフィールド指定を解釈します
+            live_index: dfから構築済みのライブインデックス（任意）。
+                        正規化検索モードでは、ライブタイトルをライブごとに一度だけ照合し、
+                        一致したライブの行に展開します
+            date_range: 配信日の期間（開始日, 終了日）（任意、両端を含む）。
+                        dfが配信日の降順にソートされていることが前提です
         
         Returns:
             フィルタリングされたDataFrame
             
         Note:
-            - クエリが空文字列の場合、元のDataFrameをそのまま返します
+            - クエリが空文字列で期間の指定もない場合、元のDataFrameをそのまま返します
             - 指定されたフィールドが存在しない場合、そのフィールドはスキップされます
             - デフォルトでは大文字小文字を区別しません
+            - インデックスの行数がdfと一致しない場合、インデックスは使用されません
+            - 正規化検索モードで検索キー列が存在しない場合、その場で正規化します
         
         Examples:
             >>> service = SearchService()
@@ -63,19 +114,461 @@ class SearchService:
             >>> results = service.search(df, "紅蓮華", ["楽曲名", "アーティスト"])
             >>> # 大文字小文字を区別して検索
             >>> results = service.search(df, "LiSA", ["アーティスト"], case_sensitive=True)
+            >>> # 「ﾎﾞｶﾛ」「ぼかろ」でも「ボカロ」に一致させる
+            >>> results = service.search(df, "ﾎﾞｶﾛ", ["曲名"], normalize=True)
+            >>> # LiSAの曲のうち「炎」以外
+            >>> results = service.search(df, "artist:LiSA -炎", ["曲名"], use_query_syntax=True)
+        """
+        positions = self.search_positions(
+            df, query, fields, case_sensitive, index, normalize, use_query_syntax,
+            live_index=live_index, date_range=date_range
+        )
+        if positions is None:
+            return df
+        
+        return df.iloc[positions]
+    
+    def search_positions(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        fields: List[str],
+        case_sensitive: bool = False,
+        index: Optional[SearchIndex] = None,
+        normalize: bool = False,
+        use_query_syntax: bool = False,
+        candidates: Optional[np.ndarray] = None,
+        live_index: Optional[LiveIndex] = None,
+        date_range: Optional[DateRange] = None
+    ) -> Optional[np.ndarray]:
+        """
+        検索に一致する行位置を取得する
+        
+        searchと同じ検索を行い、DataFrameの代わりに一致した行の位置（iloc）を返します。
+        結果をセッション状態などに保持する場合、DataFrameのコピーより小さく済みます。
+        
+        Args:
+            df: 検索対象のDataFrame
+            query: 検索クエリ（キーワード）
+            fields: 検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか（デフォルト: False）
+            index: dfから構築済みの検索インデックス（任意）
+            normalize: 正規化検索モードを使用するか（デフォルト: False）
+            use_query_syntax: クエリ構文を使用するか（デフォルト: False）
+            candidates: 照合対象を限定する行位置の配列（任意、昇順）。
+                        結果がこの中に必ず含まれる場合（is_narrowing_queryがTrueとなる
+                        前回の検索結果など）に指定すると、全件ではなくこの行だけを照合します
+            live_index: dfから構築済みのライブインデックス（任意）
+            date_range: 配信日の期間（開始日, 終了日）（任意、両端を含む）。
+                        dfが配信日の降順にソートされていることが前提です
+        
+        Returns:
+            一致した行位置の配列（int32、昇順）。
+            クエリが空で期間の指定もない場合はNone（全件）
+        
+        Note:
+            - 検索結果キャッシュが設定されていて、バージョン付きの検索インデックスが
+              指定された場合、結果はキャッシュされます。キャッシュから返される配列は
+              書き込み不可です
+            - candidatesを指定した場合、検索インデックスとライブインデックスは使用されません
+            - 期間による絞り込みはキーワード検索の結果（キャッシュされた結果を含む）に
+              二分探索で適用されます
+        
+        Examples:
+            >>> service = SearchService()
+            >>> positions = service.search_positions(df, "紅蓮華", ["曲名"])
+            >>> df.iloc[positions]
+            >>> # 2024年1月に歌われた「紅蓮華」
+            >>> positions = service.search_positions(
+            ...     df, "紅蓮華", ["曲名"], date_range=("2024-01-01", "2024-01-31")
+            ... )
         """
         import time
         
-        # クエリが空の場合は元のDataFrameを返す
+        if date_range is not None:
+            positions = self.search_positions(
+                df, query, fields, case_sensitive, index, normalize, use_query_syntax,
+                candidates=candidates, live_index=live_index
+            )
+            return self._restrict_to_date_range(df, positions, date_range)
+        
+        # クエリが空の場合は全件を表すNoneを返す
         if not query or query.strip() == "":
-            logger.debug("検索クエリが空のため、元のDataFrameを返します")
-            return df
+            logger.debug("検索クエリが空のため、全件を返します")
+            return None
+        
+        parsed_query = parse_query(query) if use_query_syntax else None
+        cache_key = self._make_cache_key(
+            df, query, fields, case_sensitive, index, normalize, parsed_query
+        )
+        if cache_key is not None:
+            cached_positions = self.result_cache.get(cache_key)
+            if cached_positions is not None:
+                logger.debug(f"検索結果をキャッシュから返します: クエリ='{query}'")
+                return cached_positions
         
         start_time = time.time()
         logger.info(f"検索を実行中: クエリ='{query}', フィールド={fields}, 大文字小文字区別={case_sensitive}")
         
+        use_index = index is not None and index.is_compatible(df)
+        if index is not None and not use_index:
+            logger.warning("検索インデックスの行数がDataFrameと一致しないため、全件検索を実行します")
+            index = None
+        if live_index is not None and not live_index.is_compatible(df):
+            logger.warning("ライブインデックスの行数がDataFrameと一致しないため使用しません")
+            live_index = None
+        
+        target_df = df
+        if candidates is not None:
+            # 候補行だけを照合し、結果を元の行位置に戻す
+            target_df = self._select_candidate_rows(df, candidates, fields)
+            index = None
+            use_index = False
+            live_index = None
+        
+        if use_query_syntax:
+            positions = self._search_positions_query_syntax(
+                target_df, parsed_query, fields, case_sensitive, index, normalize,
+                live_index
+            )
+        else:
+            positions = self._match_positions(
+                target_df, query, fields, case_sensitive, index, normalize, live_index
+            )
+        if candidates is not None:
+            positions = np.asarray(candidates)[positions]
+        positions = positions.astype(np.int32, copy=False)
+        
+        modes = []
+        if use_query_syntax:
+            modes.append("クエリ構文")
+        if normalize:
+            modes.append("正規化検索")
+        elif use_index:
+            modes.append("インデックス使用")
+        if candidates is not None:
+            modes.append(f"{len(candidates)}件から絞り込み")
+        mode = "、".join(modes)
+        
+        # パフォーマンス情報をログに記録
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"検索結果{f'（{mode}）' if mode else ''}: {len(positions)}件、"
+            f"処理時間: {elapsed_time:.3f}秒"
+        )
+        
+        if cache_key is not None:
+            self.result_cache.put(cache_key, positions)
+        
+        return positions
+    
+    def get_date_range_slice(
+        self,
+        df: pd.DataFrame,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None
+    ) -> Union[slice, np.ndarray]:
+        """
+        配信日が期間内の行範囲を取得する
+        
+        パイプラインでソート済みのデータは配信日の降順（欠損値は末尾）に並んでいるため、
+        「ライブ配信日_sortable」列を二分探索して範囲の境界を求めます。
+        降順に並んでいない場合は、全行の比較（ブールマスク）で期間内の行位置を求めます。
+        
+        Args:
+            df: 配信日の降順にソートされたDataFrame
+            start: 期間の開始日（Noneの場合は制限なし、この日を含む）
+            end: 期間の終了日（Noneの場合は制限なし、この日を含む）
+        
+        Returns:
+            期間内の行範囲（iloc用のslice）。配信日の降順に並んでいない場合は
+            期間内の行位置の配列（int32、昇順）
+        
+        Note:
+            - 配信日列が存在しない場合は全行の範囲を返します
+        
+        Examples:
+            >>> service = SearchService()
+            >>> df.iloc[service.get_date_range_slice(df, "2024-01-01", "2024-01-31")]
+        """
+        if LIVE_DATE_FIELD not in df.columns:
+            logger.warning(f"フィールド '{LIVE_DATE_FIELD}' が存在しないため、期間で絞り込みません")
+            return slice(0, len(df))
+        
+        dates = df[LIVE_DATE_FIELD].to_numpy()
+        if not is_descending_dates(dates):
+            logger.warning(
+                f"'{LIVE_DATE_FIELD}' が降順に並んでいないため、全行を比較して期間で絞り込みます"
+            )
+            positions = self._find_date_range_positions(df[LIVE_DATE_FIELD], start, end)
+            logger.info(f"期間で絞り込みました: {start}〜{end}、{len(positions)}件")
+            return positions
+        
+        bounds = find_descending_date_slice(dates, start, end)
+        logger.info(
+            f"期間で絞り込みました: {start}〜{end}、{bounds.stop - bounds.start}件"
+        )
+        return bounds
+    
+    @staticmethod
+    def _find_date_range_positions(
+        dates: pd.Series,
+        start: Optional[DateLike],
+        end: Optional[DateLike]
+    ) -> np.ndarray:
+        """
+        配信日が期間内の行位置をブールマスクで求める
+        
+        配信日の降順に並んでいないDataFrameに使用します。
+        
+        Args:
+            dates: 配信日の列
+            start: 期間の開始日（Noneの場合は制限なし、この日を含む）
+            end: 期間の終了日（Noneの場合は制限なし、この日を含む）
+        
+        Returns:
+            期間内の行位置の配列（int32、昇順、欠損値は含まない）
+        """
+        dates = pd.to_datetime(dates)
+        mask = dates.notna()
+        if start is not None:
+            mask &= dates >= pd.Timestamp(start).normalize()
+        if end is not None:
+            mask &= dates < pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+        return np.flatnonzero(mask.to_numpy(dtype=bool)).astype(np.int32)
+    
+    def filter_by_date_range(
+        self,
+        df: pd.DataFrame,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None
+    ) -> pd.DataFrame:
+        """
+        配信日が期間内の行を取得する
+        
+        Args:
+            df: 配信日の降順にソートされたDataFrame
+            start: 期間の開始日（Noneの場合は制限なし、この日を含む）
+            end: 期間の終了日（Noneの場合は制限なし、この日を含む）
+        
+        Returns:
+            期間内の行のDataFrame（ソート済みの場合は行範囲のスライス）
+        """
+        return df.iloc[self.get_date_range_slice(df, start, end)]
+    
+    def _restrict_to_date_range(
+        self,
+        df: pd.DataFrame,
+        positions: Optional[np.ndarray],
+        date_range: DateRange
+    ) -> np.ndarray:
+        """
+        行位置を配信日の期間内に限定する
+        
+        期間内の行は連続した範囲になるため、昇順の行位置を二分探索で切り出します。
+        配信日の降順に並んでいない場合は、期間内の行位置との積集合を取ります。
+        
+        Args:
+            df: 配信日の降順にソートされたDataFrame
+            positions: 昇順の行位置の配列（Noneの場合は全件）
+            date_range: 期間（開始日, 終了日）
+        
+        Returns:
+            期間内の行位置の配列（int32、昇順）
+        """
+        bounds = self.get_date_range_slice(df, *date_range)
+        if not isinstance(bounds, slice):
+            if positions is None:
+                return bounds
+            return np.intersect1d(positions, bounds, assume_unique=True).astype(np.int32)
+        
+        if positions is None:
+            return np.arange(bounds.start, bounds.stop, dtype=np.int32)
+        
+        lower, upper = np.searchsorted(positions, [bounds.start, bounds.stop])
+        return positions[lower:upper]
+    
+    def _match_positions(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        fields: List[str],
+        case_sensitive: bool,
+        index: Optional[SearchIndex],
+        normalize: bool,
+        live_index: Optional[LiveIndex] = None
+    ) -> np.ndarray:
+        """
+        単一の検索語に一致する行位置を取得する
+        
+        検索モードに応じて正規化検索、インデックス検索、全件検索を使い分けます。
+        
+        Args:
+            df: 検索対象のDataFrame
+            query: 検索語
+            fields: 検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか
+            index: dfと行構成が一致する検索インデックス（任意）
+            normalize: 正規化検索モードを使用するか
+            live_index: dfと行構成が一致するライブインデックス（任意）
+        
+        Returns:
+            一致した行位置の配列（昇順）
+        """
+        if normalize:
+            return self._search_positions_normalized(df, query, fields, index, live_index)
+        if index is not None:
+            return self._search_positions_with_index(
+                df, query, fields, case_sensitive, index
+            )
+        return self._search_positions_scan(df, query, fields, case_sensitive)
+    
+    def _search_positions_query_syntax(
+        self,
+        df: pd.DataFrame,
+        parsed_query: ParsedQuery,
+        fields: List[str],
+        case_sensitive: bool,
+        index: Optional[SearchIndex],
+        normalize: bool,
+        live_index: Optional[LiveIndex] = None
+    ) -> np.ndarray:
+        """
+        解析済みクエリに一致する行位置を取得する
+        
+        各検索語を一度だけ評価して行マスクに変換し、
+        節内はAND（除外条件は否定）、節同士はORでビット演算により結合します。
+        
+        Args:
+            df: 検索対象のDataFrame
+            parsed_query: 解析済み検索クエリ
+            fields: フィールド指定のない検索語の検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか
+            index: dfと行構成が一致する検索インデックス（任意）
+            normalize: 正規化検索モードを使用するか
+            live_index: dfと行構成が一致するライブインデックス（任意）
+        
+        Returns:
+            一致した行位置の配列（昇順）
+        """
+        num_rows = len(df)
+        term_masks: Dict[Tuple[Tuple[str, ...], str], np.ndarray] = {}
+        result_mask = np.zeros(num_rows, dtype=bool)
+        
+        for clause in parsed_query.clauses:
+            clause_mask = np.ones(num_rows, dtype=bool)
+            
+            for term in clause:
+                term_fields = [term.field] if term.field else list(fields)
+                mask_key = (tuple(term_fields), term.text)
+                
+                # 同じ検索語は一度だけ評価する
+                if mask_key not in term_masks:
+                    term_mask = np.zeros(num_rows, dtype=bool)
+                    term_mask[self._match_positions(
+                        df, term.text, term_fields, case_sensitive, index, normalize,
+                        live_index
+                    )] = True
+                    term_masks[mask_key] = term_mask
+                
+                if term.negated:
+                    clause_mask &= ~term_masks[mask_key]
+                else:
+                    clause_mask &= term_masks[mask_key]
+            
+            result_mask |= clause_mask
+        
+        return np.flatnonzero(result_mask)
+    
+    def _make_cache_key(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        fields: List[str],
+        case_sensitive: bool,
+        index: Optional[SearchIndex],
+        normalize: bool,
+        parsed_query: Optional[ParsedQuery] = None
+    ) -> Optional[Hashable]:
+        """
+        検索結果キャッシュのキーを作成する
+        
+        データセットのバージョンは検索インデックスから取得します。
+        バージョンが特定できない場合はキャッシュしません。
+        クエリ構文を使用する場合は解析済みクエリからキーを作成するため、
+        空白の違いや「|」と「OR」など、同じ条件に解析されるクエリは同じキーになります。
+        
+        Args:
+            df: 検索対象のDataFrame
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか
+            index: 検索インデックス
+            normalize: 正規化検索モードを使用するか
+            parsed_query: 解析済み検索クエリ（クエリ構文を使用する場合）
+        
+        Returns:
+            (データバージョン, 正規化済みクエリ, フィールド, 大文字小文字区別, 正規化検索,
+            クエリ構文)のタプル。キャッシュできない場合はNone
+        """
+        if self.result_cache is None or index is None or not index.version:
+            return None
+        if not index.is_compatible(df):
+            return None
+        
+        use_query_syntax = parsed_query is not None
+        if use_query_syntax:
+            # 節内はAND、節同士はORのため、検索語と節の順序・重複は結果に影響しない
+            key_query = frozenset(
+                frozenset(
+                    (
+                        term.field,
+                        normalize_search_text(term.text) if normalize else term.text,
+                        term.negated,
+                    )
+                    for term in clause
+                )
+                for clause in parsed_query.clauses
+            )
+            key_case_sensitive = case_sensitive and not normalize
+        elif normalize:
+            # 正規化検索では表記ゆれを吸収したクエリで結果が決まる
+            key_query = normalize_search_text(query)
+            key_case_sensitive = False
+        else:
+            key_query = query
+            key_case_sensitive = case_sensitive
+        
+        return (
+            index.version,
+            key_query,
+            tuple(sorted(fields)),
+            key_case_sensitive,
+            normalize,
+            use_query_syntax,
+        )
+    
+    def _search_positions_scan(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        fields: List[str],
+        case_sensitive: bool
+    ) -> np.ndarray:
+        """
+        全件を走査して一致する行位置を取得する
+        
+        Args:
+            df: 検索対象のDataFrame
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか
+        
+        Returns:
+            一致した行位置の配列（昇順）
+        """
         # 検索条件を構築
-        mask = pd.Series([False] * len(df), index=df.index)
+        mask = np.zeros(len(df), dtype=bool)
         
         for field in fields:
             # フィールドが存在するか確認
@@ -83,31 +576,347 @@ class SearchService:
                 logger.warning(f"フィールド '{field}' が存在しないためスキップします")
                 continue
             
-            # 文字列型に変換してから検索
-            field_data = df[field].astype(str)
+            mask |= self._contains_mask(df[field], query, case_sensitive)
+        
+        return np.flatnonzero(mask)
+    
+    @staticmethod
+    def _contains_mask(
+        values: pd.Series,
+        query: str,
+        case_sensitive: bool
+    ) -> np.ndarray:
+        """
+        クエリを含む行のマスクを取得する
+        
+        カテゴリ型の列では、ユニークな値（categories）だけを一度照合し、
+        その結果を各行のコード（codes）で行に展開します。
+        
+        Args:
+            values: 照合する列
+            query: 検索クエリ
+            case_sensitive: 大文字小文字を区別するか
+        
+        Returns:
+            行ごとの一致を表すブール配列（欠損値はFalse）
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            category_mask = pd.Series(values.cat.categories).astype(str).str.contains(
+                query, case=case_sensitive, na=False, regex=False
+            ).to_numpy(dtype=bool)
+            # 欠損値のコード（-1）は末尾のFalseを参照する
+            return np.append(category_mask, False)[values.cat.codes.to_numpy()]
+        
+        # 文字列型に変換してから検索
+        return values.astype(str).str.contains(
+            query, case=case_sensitive, na=False, regex=False
+        ).to_numpy(dtype=bool)
+    
+    def _search_positions_with_index(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        fields: List[str],
+        case_sensitive: bool,
+        index: SearchIndex
+    ) -> np.ndarray:
+        """
+        検索インデックスを使用して一致する行位置を取得する
+        
+        インデックス化されていないフィールドは、そのフィールドのみ全件検索します。
+        
+        Args:
+            df: 検索対象のDataFrame
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト
+            case_sensitive: 大文字小文字を区別するか
+            index: 検索インデックス
+        
+        Returns:
+            一致した行位置の配列（昇順）
+        """
+        matched = []
+        
+        for field in fields:
+            if index.has_field(field):
+                matched.append(index.search_field(field, query, case_sensitive))
+                continue
             
-            if case_sensitive:
-                # 大文字小文字を区別する検索
-                mask |= field_data.str.contains(query, na=False, regex=False)
+            # フィールドが存在するか確認
+            if field not in df.columns:
+                logger.warning(f"フィールド '{field}' が存在しないためスキップします")
+                continue
+            
+            field_mask = self._contains_mask(df[field], query, case_sensitive)
+            matched.append(np.flatnonzero(field_mask))
+        
+        if not matched:
+            return np.empty(0, dtype=np.int32)
+        
+        return np.unique(np.concatenate(matched))
+    
+    def _search_positions_normalized(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        fields: List[str],
+        index: Optional[SearchIndex],
+        live_index: Optional[LiveIndex] = None
+    ) -> np.ndarray:
+        """
+        正規化済み検索キーを使用して一致する行位置を取得する
+        
+        クエリを正規化し、各フィールドの検索キー列と照合します。
+        検索キー列がインデックス化されている場合はインデックスを使用します。
+        ライブタイトルはライブインデックスがあれば、ライブごとに照合してから
+        LIVE_IDの行に展開します（2段階検索）。
+        
+        Args:
+            df: 検索対象のDataFrame
+            query: 検索クエリ（正規化前）
+            fields: 検索対象フィールドのリスト（元のフィールド名）
+            index: 検索インデックス（任意）
+            live_index: ライブインデックス（任意）
+        
+        Returns:
+            一致した行位置の配列（昇順）
+        """
+        normalized_query = normalize_search_text(query)
+        use_index = index is not None and index.is_compatible(df)
+        matched = []
+        
+        for field in fields:
+            key_column = get_search_key_column(field)
+            
+            if field == LIVE_TITLE_FIELD and live_index is not None:
+                matched.append(live_index.search_title(normalized_query))
+                continue
+            
+            if use_index and index.has_field(key_column):
+                matched.append(
+                    index.search_field(key_column, normalized_query, case_sensitive=True)
+                )
+                continue
+            
+            if key_column in df.columns:
+                keys = df[key_column]
+            elif field in df.columns:
+                # 検索キー列がない場合はその場で正規化する
+                keys = build_search_keys(df[field])
             else:
-                # 大文字小文字を区別しない検索
-                mask |= field_data.str.contains(query, case=False, na=False, regex=False)
+                logger.warning(f"フィールド '{field}' が存在しないためスキップします")
+                continue
+            
+            field_mask = self._contains_mask(keys, normalized_query, case_sensitive=True)
+            matched.append(np.flatnonzero(field_mask))
         
-        result_df = df[mask]
+        if not matched:
+            return np.empty(0, dtype=np.int32)
         
-        # パフォーマンス情報をログに記録
-        elapsed_time = time.time() - start_time
-        logger.info(
-            f"検索結果: {len(result_df)}件、"
-            f"処理時間: {elapsed_time:.3f}秒"
+        return np.unique(np.concatenate(matched))
+    
+    def _select_candidate_rows(
+        self,
+        df: pd.DataFrame,
+        candidates: np.ndarray,
+        fields: List[str]
+    ) -> pd.DataFrame:
+        """
+        検索に必要な列の候補行だけを取り出す
+        
+        Args:
+            df: 検索対象のDataFrame
+            candidates: 候補の行位置の配列
+            fields: 検索対象フィールドのリスト
+        
+        Returns:
+            候補行のDataFrame（行位置は候補配列内の位置になります）
+        """
+        search_fields = set(fields) | set(FIELD_PREFIXES.values())
+        columns = [
+            column for column in df.columns
+            if column in search_fields
+            or any(column == get_search_key_column(field) for field in search_fields)
+        ]
+        return df.iloc[candidates][columns]
+    
+    def is_narrowing_query(
+        self,
+        previous_query: str,
+        query: str,
+        case_sensitive: bool = False,
+        normalize: bool = False,
+        use_query_syntax: bool = False
+    ) -> bool:
+        """
+        クエリが前回のクエリの結果をさらに絞り込むものかを判定する
+        
+        Trueの場合、queryの検索結果は必ずprevious_queryの検索結果に含まれるため、
+        前回の結果をsearch_positionsのcandidatesとして使用できます。
+        
+        Args:
+            previous_query: 前回の検索クエリ
+            query: 今回の検索クエリ
+            case_sensitive: 大文字小文字を区別するか
+            normalize: 正規化検索モードを使用するか
+            use_query_syntax: クエリ構文を使用するか
+        
+        Returns:
+            絞り込みになる場合True
+        
+        Note:
+            クエリ構文では、両方のクエリがORを含まず、前回の各検索語について
+            同じフィールド指定の検索語が今回もあり、それが前回の語を含む
+            （除外条件の場合は前回の語に含まれる）ときに絞り込みと判定します
+        
+        Examples:
+            >>> service = SearchService()
+            >>> service.is_narrowing_query("ボカ", "ボカロ")
+            True
+            >>> service.is_narrowing_query("ボカロ", "ボカロ OR Lemon", use_query_syntax=True)
+            False
+        """
+        if not previous_query or not previous_query.strip() or not query:
+            return False
+        
+        def to_key(text: str) -> str:
+            if normalize:
+                return normalize_search_text(text)
+            return text if case_sensitive else text.lower()
+        
+        if not use_query_syntax:
+            return to_key(previous_query.strip()) in to_key(query.strip())
+        
+        previous_parsed = parse_query(previous_query)
+        parsed = parse_query(query)
+        if len(previous_parsed.clauses) != 1 or len(parsed.clauses) != 1:
+            return False
+        
+        terms = parsed.clauses[0]
+        for previous_term in previous_parsed.clauses[0]:
+            previous_key = to_key(previous_term.text)
+            covered = any(
+                term.field == previous_term.field
+                and term.negated == previous_term.negated
+                and (
+                    to_key(term.text) in previous_key if term.negated
+                    else previous_key in to_key(term.text)
+                )
+                for term in terms
+            )
+            if not covered:
+                return False
+        return True
+    
+    def suggest(
+        self,
+        query: str,
+        fields: List[str],
+        fuzzy_index: FuzzyIndex,
+        limit: int = 5,
+        use_query_syntax: bool = False
+    ) -> List[FuzzyMatch]:
+        """
+        クエリに近い曲名・アーティスト名の候補（もしかして）を取得する
+        
+        あいまい検索インデックスでq-gramを共有する値だけを候補とし、
+        候補に対してのみ編集距離を計算します。
+        
+        Args:
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト（インデックス化されていないフィールドは無視されます）
+            fuzzy_index: あいまい検索インデックス
+            limit: 返す候補の最大数
+            use_query_syntax: クエリ構文を使用するか（デフォルト: False）。
+                              Trueの場合、除外条件を含まない単一の検索語のみを対象とし、
+                              フィールド指定はそのフィールドに限定します
+        
+        Returns:
+            距離の近い順の候補リスト。対象となる検索語がない場合は空のリスト
+        
+        Examples:
+            >>> service = SearchService()
+            >>> service.suggest("yoasobl", ["曲名", "アーティスト"], fuzzy_index)
+            [FuzzyMatch(text='YOASOBI', field='アーティスト', distance=1, row_count=12)]
+        """
+        term = self._resolve_fuzzy_term(query, fields, use_query_syntax)
+        if term is None:
+            return []
+        
+        text, term_fields = term
+        suggestions = fuzzy_index.suggest(text, term_fields, limit=limit)
+        logger.info(f"あいまい検索の候補: クエリ='{query}', 候補={len(suggestions)}件")
+        return suggestions
+    
+    def fuzzy_search_positions(
+        self,
+        query: str,
+        fields: List[str],
+        fuzzy_index: FuzzyIndex,
+        max_distance: Optional[int] = None,
+        use_query_syntax: bool = False
+    ) -> np.ndarray:
+        """
+        クエリに近い曲名・アーティスト名を持つ行位置を取得する（あいまい検索）
+        
+        Args:
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト
+            fuzzy_index: 検索対象のDataFrameから構築したあいまい検索インデックス
+            max_distance: 許容する編集距離（デフォルト: クエリの長さに応じて決定）
+            use_query_syntax: クエリ構文を使用するか（デフォルト: False）
+        
+        Returns:
+            一致した行位置の配列（int32、昇順）
+        """
+        term = self._resolve_fuzzy_term(query, fields, use_query_syntax)
+        if term is None:
+            return np.empty(0, dtype=np.int32)
+        
+        text, term_fields = term
+        matches = fuzzy_index.suggest(
+            text, term_fields, max_distance=max_distance, limit=None
         )
+        positions = fuzzy_index.get_positions(matches)
+        logger.info(f"あいまい検索結果: {len(positions)}件（候補{len(matches)}件）")
+        return positions
+    
+    def _resolve_fuzzy_term(
+        self,
+        query: str,
+        fields: List[str],
+        use_query_syntax: bool
+    ) -> Optional[Tuple[str, List[str]]]:
+        """
+        あいまい検索の対象となる検索語とフィールドを決定する
         
-        return result_df
+        Args:
+            query: 検索クエリ
+            fields: 検索対象フィールドのリスト
+            use_query_syntax: クエリ構文を使用するか
+        
+        Returns:
+            (検索語, 対象フィールドのリスト)。対象とならないクエリの場合はNone
+        """
+        if not query or not query.strip():
+            return None
+        if not use_query_syntax:
+            return query.strip(), list(fields)
+        
+        parsed_query = parse_query(query)
+        if len(parsed_query.clauses) != 1 or len(parsed_query.clauses[0]) != 1:
+            return None
+        
+        term = parsed_query.clauses[0][0]
+        if term.negated:
+            return None
+        return term.text, [term.field] if term.field else list(fields)
     
     def filter_by_multiple_conditions(
         self,
         df: pd.DataFrame,
-        conditions: Dict[str, Any]
+        conditions: Dict[str, Any],
+        equality_index: Optional[EqualityIndex] = None
     ) -> pd.DataFrame:
         """
         複数条件でフィルタリングする
@@ -115,10 +924,16 @@ class SearchService:
         指定された条件（フィールド名と値の辞書）に基づいて
         DataFrameをフィルタリングします。全ての条件を満たす行のみを返します（AND条件）。
         
+        完全一致インデックスが指定された場合、インデックス化されたフィールドの条件は
+        行位置の配列の積集合（件数の少ない順）で求め、残りの条件は
+        絞り込んだ行に対してのみ比較します。
+        
         Args:
             df: フィルタリング対象のDataFrame
             conditions: フィールド名と値の辞書
                        例: {"配信日": "2024-01-01", "アーティスト": "LiSA"}
+            equality_index: 完全一致インデックス（任意）。
+                            行数がDataFrameと一致しない場合は使用されません
         
         Returns:
             フィルタリングされたDataFrame
@@ -133,6 +948,11 @@ class SearchService:
             >>> # 特定の配信日とアーティストでフィルタリング
             >>> conditions = {"配信日": "2024-01-01", "アーティスト": "LiSA"}
             >>> results = service.filter_by_multiple_conditions(df, conditions)
+            >>> # インデックスを使用したアーティスト・ライブの絞り込み
+            >>> index = EqualityIndex(df, ["アーティスト", "LIVE_ID"])
+            >>> results = service.filter_by_multiple_conditions(
+            ...     df, {"アーティスト": "LiSA", "LIVE_ID": 12}, equality_index=index
+            ... )
         """
         # 条件が空の場合は元のDataFrameを返す
         if not conditions:
@@ -141,20 +961,61 @@ class SearchService:
         
         logger.info(f"複数条件でフィルタリング中: {conditions}")
         
-        # フィルタリング条件を構築
-        mask = pd.Series([True] * len(df), index=df.index)
+        positions = self.filter_positions(df, conditions, equality_index)
+        result_df = df if positions is None else df.iloc[positions]
+        logger.info(f"フィルタリング結果: {len(result_df)}件")
+        
+        return result_df
+    
+    def filter_positions(
+        self,
+        df: pd.DataFrame,
+        conditions: Dict[str, Any],
+        equality_index: Optional[EqualityIndex] = None
+    ) -> Optional[np.ndarray]:
+        """
+        全ての条件に一致する行位置を取得する
+        
+        Args:
+            df: フィルタリング対象のDataFrame
+            conditions: フィールド名と値の辞書
+            equality_index: 完全一致インデックス（任意）
         
+        Returns:
+            行位置の配列（int32、昇順）。
+            有効な条件が一つもない場合はNone（全行が対象）
+        """
+        if equality_index is not None and not equality_index.is_compatible(df):
+            logger.warning("完全一致インデックスの行数がDataFrameと一致しないため使用しません")
+            equality_index = None
+        
+        indexed_conditions: Dict[str, Any] = {}
+        scan_conditions: Dict[str, Any] = {}
         for field, value in conditions.items():
             # フィールドが存在するか確認
             if field not in df.columns:
                 logger.warning(f"フィールド '{field}' が存在しないためスキップします")
                 continue
             
-            # 条件を適用（AND条件）
-            mask &= (df[field] == value)
+            if equality_index is not None and equality_index.has_field(field):
+                indexed_conditions[field] = value
+            else:
+                scan_conditions[field] = value
         
-        result_df = df[mask]
-        logger.info(f"フィルタリング結果: {len(result_df)}件")
+        # インデックス化されたフィールドは行位置の積集合で絞り込む
+        positions = equality_index.intersect(indexed_conditions) if indexed_conditions else None
         
-        return result_df
+        # 残りの条件は絞り込み済みの行に対してのみ比較する（AND条件）
+        for field, value in scan_conditions.items():
+            if positions is not None and len(positions) == 0:
+                break
+            
+            if positions is None:
+                mask = (df[field] == value).to_numpy(dtype=bool, na_value=False)
+                positions = np.flatnonzero(mask).astype(np.int32)
+            else:
+                values = df[field].iloc[positions]
+                positions = positions[(values == value).to_numpy(dtype=bool, na_value=False)]
+        
+        return positions
 
@@ -4,11 +4,16 @@
 配信情報とタイムスタンプ情報を結合し、曲リストを生成します。
 """
 
+import dataclasses
 import logging
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, List, Dict, Set, Tuple, Optional
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
 
+import pandas as pd
+
+from src.core.utils import convert_timestamps_to_seconds
 from src.models.song_list_models import (
     LiveInfo, TimestampInfo, SongInfo, SimilarityWarning, DiffResult
 )
@@ -34,7 +39,8 @@ class SongListService:
         self, 
         live_repo: LiveRepository, 
         timestamp_repo: TimestampRepository,
-        mapping_file_path: Optional[str] = None
+        mapping_file_path: Optional[str] = None,
+        sort_cache_file_path: Optional[str] = None
     ):
         """
         サービスを初期化
@@ -43,6 +49,7 @@ class SongListService:
             live_repo: 配信情報リポジトリ
             timestamp_repo: タイムスタンプ情報リポジトリ
             mapping_file_path: 修正マッピングファイルのパス（オプション、デフォルト: data/ARTIST_SORT_MAPPING.TSV）
+            sort_cache_file_path: ソート用読み仮名の永続キャッシュファイルのパス（オプション）
         """
         self.live_repo = live_repo
         self.timestamp_repo = timestamp_repo
@@ -55,7 +62,9 @@ class SongListService:
         self.mapping_repository = ArtistSortMappingRepository(mapping_file_path)
         
         # ArtistSortGeneratorを初期化し、マッピングリポジトリを設定
-        self.artist_sort_generator = ArtistSortGenerator(self.mapping_repository)
+        self.artist_sort_generator = ArtistSortGenerator(
+            self.mapping_repository, cache_file_path=sort_cache_file_path
+        )
         
         self.url_generator = URLGenerator()
         self.similarity_checker = SimilarityChecker()
@@ -71,6 +80,7 @@ class SongListService:
             曲情報のリスト
         """
         # 修正マッピングの読み込み状況をログに記録
+        self.artist_sort_generator.refresh()
         mappings = self.mapping_repository.get_all_mappings()
         if mappings:
             self.logger.info(f"修正マッピングを読み込みました: {len(mappings)}件")
@@ -112,6 +122,189 @@ class SongListService:
         
         return sorted_song_list
     
+    def update_song_list(
+        self,
+        previous_songs: List[SongInfo],
+        since_id: Optional[int] = None,
+        changed_live_ids: Optional[Iterable[int]] = None
+    ) -> List[SongInfo]:
+        """
+        前回の曲リストを差分で更新
+        
+        追加されたタイムスタンプ（IDがsince_idより大きいレコード）と、
+        変更された配信（changed_live_ids）のレコードが属する
+        (アーティスト, 正規化された曲名) のグループだけを再計算し、
+        それ以外の曲は前回の曲リストの内容（ソート用アーティスト名を含む）を再利用します。
+        
+        Args:
+            previous_songs: 前回生成した曲リスト（既存のV_SONG_LIST.TSVの内容）
+            since_id: 前回の生成時点のタイムスタンプIDの最大値（任意）
+            changed_live_ids: レコードが変更・削除された配信IDのリスト（任意）
+            
+        Returns:
+            ソートされた曲情報のリスト（generate_song_listと同じ形式）
+            
+        Note:
+            - 変更された配信から選ばれていた曲のグループも再計算するため、
+              レコードの修正・削除も反映されます
+            - 修正マッピングは再計算しない曲にも適用しますが、
+              マッピングの削除やpykakasiの変換結果の変化を反映するには全件の再生成が必要です
+            - since_idとchanged_live_idsのどちらも指定されない場合は全件を再生成します
+        
+        Examples:
+            >>> previous = SongListRepository("data/V_SONG_LIST.TSV").load_all()
+            >>> songs = service.update_song_list(previous, since_id=1200)
+        """
+        changed_live_set = set(changed_live_ids or [])
+        if since_id is None and not changed_live_set:
+            self.logger.info("差分の指定がないため、曲リストを全件再生成します")
+            return self.generate_song_list()
+        
+        self.artist_sort_generator.refresh()
+        mappings = self.mapping_repository.get_all_mappings()
+        
+        self.logger.info("配信情報を読み込んでいます...")
+        live_infos = self.live_repo.load_all()
+        
+        self.logger.info("タイムスタンプ情報を読み込んでいます...")
+        timestamp_infos = self.timestamp_repo.load_all()
+        
+        live_map: Dict[int, LiveInfo] = {live.id: live for live in live_infos}
+        
+        # 追加・変更されたレコードが属するグループ
+        delta_infos = [
+            ts_info for ts_info in timestamp_infos
+            if (since_id is not None and ts_info.id > since_id)
+            or ts_info.live_id in changed_live_set
+        ]
+        affected_keys: Set[Tuple[str, str]] = {
+            (ts_info.artist, self.normalize_song_name(ts_info.song_name)[0])
+            for ts_info in delta_infos
+            if ts_info.song_name and ts_info.artist
+        }
+        
+        # 変更された配信から選ばれていた曲のグループ（レコードの修正・削除に対応）
+        changed_live_urls = [
+            live_map[live_id].url for live_id in changed_live_set if live_id in live_map
+        ]
+        for song in previous_songs:
+            if any(self._is_url_of_live(song.latest_url, url) for url in changed_live_urls):
+                affected_keys.add((song.artist, self.normalize_song_name(song.song_name)[0]))
+        
+        self.logger.info(
+            f"差分レコード数: {len(delta_infos)}, 再計算するグループ数: {len(affected_keys)}"
+        )
+        
+        # 再計算するグループのレコードのみを結合・選択する
+        affected_artists = {artist for artist, _ in affected_keys}
+        group_infos = [
+            ts_info for ts_info in timestamp_infos
+            if ts_info.artist in affected_artists
+            and (ts_info.artist, self.normalize_song_name(ts_info.song_name)[0]) in affected_keys
+        ]
+        group_data = self._filter_empty_data(self._join_data(group_infos, live_map))
+        updated_songs = self._select_latest_songs_with_normalization(group_data)
+        
+        # 再計算しないグループは前回の内容を再利用する
+        kept_songs = []
+        for song in previous_songs:
+            if (
+                song.artist in affected_artists
+                and (song.artist, self.normalize_song_name(song.song_name)[0]) in affected_keys
+            ):
+                continue
+            mapping = mappings.get(song.artist.strip())
+            if mapping is not None and mapping != song.artist_sort:
+                song = dataclasses.replace(song, artist_sort=mapping)
+            kept_songs.append(song)
+        
+        self.logger.info(
+            f"差分更新: 再利用 {len(kept_songs)}件, 再計算 {len(updated_songs)}件"
+        )
+        
+        sorted_songs = self._sort_songs(kept_songs + updated_songs)
+        return self._order_ties_by_first_appearance(sorted_songs, timestamp_infos, live_map)
+    
+    def _order_ties_by_first_appearance(
+        self,
+        songs: List[SongInfo],
+        timestamp_infos: List[TimestampInfo],
+        live_map: Dict[int, LiveInfo]
+    ) -> List[SongInfo]:
+        """
+        ソートキーが同じ曲を、全件生成時と同じ順序に並べる
+        
+        全件生成では、ソート用アーティスト名と曲名が同じ曲（表記ゆれのある
+        アーティストなど）はタイムスタンプ情報に最初に現れた順に並びます。
+        差分更新でも出力が一致するよう、該当する曲だけ最初の出現位置で並べ替えます。
+        
+        Args:
+            songs: ソート済みの曲情報のリスト
+            timestamp_infos: タイムスタンプ情報のリスト
+            live_map: 配信IDをキーとした配信情報のマップ
+            
+        Returns:
+            並べ替えた曲情報のリスト
+        """
+        # ソートキーが同じ曲の範囲（開始位置, 終了位置）を求める
+        result = list(songs)
+        tie_ranges = []
+        start = 0
+        while start < len(result):
+            end = start + 1
+            sort_key = (result[start].artist_sort, result[start].song_name)
+            while end < len(result) and (result[end].artist_sort, result[end].song_name) == sort_key:
+                end += 1
+            if end - start > 1:
+                tie_ranges.append((start, end))
+            start = end
+        
+        if not tie_ranges:
+            return result
+        
+        # 該当するアーティストのレコードのみを1回走査し、最初の出現位置を求める
+        tie_artists = {song.artist for start, end in tie_ranges for song in result[start:end]}
+        first_positions: Dict[Tuple[str, str], int] = {}
+        for position, ts_info in enumerate(timestamp_infos):
+            if ts_info.artist in tie_artists and ts_info.live_id in live_map and ts_info.song_name:
+                key = (ts_info.artist, self.normalize_song_name(ts_info.song_name)[0])
+                first_positions.setdefault(key, position)
+        
+        def first_appearance(song: SongInfo) -> int:
+            key = (song.artist, self.normalize_song_name(song.song_name)[0])
+            return first_positions.get(key, len(timestamp_infos))
+        
+        for start, end in tie_ranges:
+            result[start:end] = sorted(result[start:end], key=first_appearance)
+        
+        return result
+    
+    @staticmethod
+    def _is_url_of_live(url: str, live_url: str) -> bool:
+        """
+        タイムスタンプ付きURLが配信のURLから生成されたものか判定
+        
+        Args:
+            url: タイムスタンプ付きURL（&t=秒数）
+            live_url: 配信のURL
+            
+        Returns:
+            タイムスタンプパラメータを除いて配信のURLと一致する場合True
+        """
+        if not url or not live_url:
+            return False
+        
+        parsed = urlparse(url)
+        parsed_live = urlparse(live_url)
+        if (parsed.netloc, parsed.path) != (parsed_live.netloc, parsed_live.path):
+            return False
+        
+        query = parse_qs(parsed.query, keep_blank_values=True)
+        query.pop('t', None)
+        live_query = parse_qs(parsed_live.query, keep_blank_values=True)
+        live_query.pop('t', None)
+        return query == live_query
+    
     def _join_data(
         self, 
         timestamp_infos: List[TimestampInfo], 
@@ -225,26 +418,11 @@ class SongListService:
                     song_map[key] = (ts_info, live_info)
         
         # SongInfoオブジェクトに変換
-        song_list = []
-        for (artist, song_name), (ts_info, live_info) in song_map.items():
-            # ソート用アーティスト名を生成
-            artist_sort = self.artist_sort_generator.generate(artist)
-            
-            # タイムスタンプ付きURLを生成
-            latest_url = self.url_generator.generate_timestamped_url(
-                live_info.url, 
-                ts_info.timestamp
-            )
-            
-            song_info = SongInfo(
-                artist=artist,
-                artist_sort=artist_sort,
-                song_name=song_name,
-                latest_url=latest_url
-            )
-            song_list.append(song_info)
-        
-        return song_list
+        selected = [
+            (artist, song_name, ts_info, live_info)
+            for (artist, song_name), (ts_info, live_info) in song_map.items()
+        ]
+        return self._build_song_infos(selected)
     
     def normalize_song_name(self, song_name: str) -> Tuple[str, bool]:
         """
@@ -309,7 +487,7 @@ class SongListService:
             song_groups[key].append((ts_info, live_info, ts_info.song_name, has_variation))
         
         # 各グループから最適なレコードを選択
-        song_list = []
+        selected = []
         for (artist, normalized_name), records in song_groups.items():
             # 正規版（バリエーション表記なし）を優先
             regular_records = [(ts, live, name, var) for ts, live, name, var in records if not var]
@@ -326,23 +504,56 @@ class SongListService:
             
             if selected_record:
                 ts_info, live_info, original_name, _ = selected_record
-                
-                # ソート用アーティスト名を生成
-                artist_sort = self.artist_sort_generator.generate(artist)
-                
-                # タイムスタンプ付きURLを生成
-                latest_url = self.url_generator.generate_timestamped_url(
-                    live_info.url, 
-                    ts_info.timestamp
+                # 元の曲名を使用
+                selected.append((artist, original_name, ts_info, live_info))
+        
+        return self._build_song_infos(selected)
+    
+    def _build_song_infos(
+        self,
+        selected: List[Tuple[str, str, TimestampInfo, LiveInfo]]
+    ) -> List[SongInfo]:
+        """
+        選択されたレコードから曲情報を生成
+        
+        タイムスタンプはconvert_timestamps_to_secondsで一括して秒数に変換し、
+        レコードごとの文字列解析を行いません。
+        
+        Args:
+            selected: (アーティスト, 曲名, TimestampInfo, LiveInfo)のタプルのリスト
+            
+        Returns:
+            曲情報のリスト
+        """
+        seconds_list = convert_timestamps_to_seconds(
+            pd.Series([ts_info.timestamp for _, _, ts_info, _ in selected], dtype=object)
+        ).tolist()
+        
+        song_list = []
+        for (artist, song_name, ts_info, live_info), seconds in zip(selected, seconds_list):
+            # ソート用アーティスト名を生成
+            artist_sort = self.artist_sort_generator.generate(artist)
+            
+            # タイムスタンプ付きURLを生成
+            if pd.isna(seconds):
+                self.logger.warning(
+                    f"タイムスタンプのパースに失敗しました: {ts_info.timestamp} "
+                    f"(タイムスタンプID: {ts_info.id})"
                 )
-                
-                song_info = SongInfo(
-                    artist=artist,
-                    artist_sort=artist_sort,
-                    song_name=original_name,  # 元の曲名を使用
-                    latest_url=latest_url
+                latest_url = live_info.url
+            else:
+                latest_url = self.url_generator.build_timestamped_url(
+                    live_info.url,
+                    int(seconds)
                 )
-                song_list.append(song_info)
+            
+            song_info = SongInfo(
+                artist=artist,
+                artist_sort=artist_sort,
+                song_name=song_name,
+                latest_url=latest_url
+            )
+            song_list.append(song_info)
         
         return song_list
     
@@ -6,14 +6,24 @@ Streamlitで使用する再利用可能なUIコンポーネントを提供しま
 
 from .components import (
     render_search_form,
+    render_date_range_filter,
     render_results_table,
+    render_cached_results_table,
     render_pagination,
+    render_page_navigator,
+    render_suggestions,
     render_twitter_embed,
+    RowHtmlCache,
 )
 
 __all__ = [
     "render_search_form",
+    "render_date_range_filter",
     "render_results_table",
+    "render_cached_results_table",
     "render_pagination",
+    "render_page_navigator",
+    "render_suggestions",
     "render_twitter_embed",
+    "RowHtmlCache",
 ]
@@ -6,9 +6,12 @@ UIコンポーネント
 """
 
 import logging
+from datetime import date, timedelta
 import streamlit as st
 import pandas as pd
-from typing import Tuple, List, Dict, Optional
+from typing import Callable, Tuple, List, Dict, Optional, Sequence
+
+from src.ui.components.results_table import RowHtmlCache
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
@@ -47,6 +50,11 @@ def render_search_form(
         value=default_query,
         key="search_input_box",
         placeholder="ここにキーワードを入力",
+        help=(
+            "スペース区切りで全てを含む曲、「OR」でいずれかを含む曲、"
+            "「-キーワード」で除外して検索できます。"
+            "「artist:」「title:」「live:」でアーティスト・曲名・配信タイトルを指定できます。"
+        ),
     )
     
     # チェックボックス
@@ -66,6 +74,80 @@ def render_search_form(
 
 
 
+# 配信期間フィルターの選択肢
+DATE_RANGE_ALL = "全期間"
+DATE_RANGE_CUSTOM = "期間を指定"
+DATE_RANGE_OPTIONS = [DATE_RANGE_ALL, "今月", "先月", "今年", DATE_RANGE_CUSTOM]
+
+
+def get_preset_date_range(
+    preset: str,
+    today: Optional[date] = None
+) -> Optional[Tuple[date, date]]:
+    """
+    配信期間の選択肢から期間を求める
+    
+    Args:
+        preset: 選択肢（「今月」「先月」「今年」など）
+        today: 基準日（デフォルト: 今日）
+    
+    Returns:
+        (開始日, 終了日)。「全期間」など期間を求められない選択肢の場合はNone
+    
+    Examples:
+        >>> get_preset_date_range("先月", today=date(2024, 3, 15))
+        (datetime.date(2024, 2, 1), datetime.date(2024, 2, 29))
+    """
+    today = today or date.today()
+    first_of_month = today.replace(day=1)
+    
+    if preset == "今月":
+        return first_of_month, today
+    if preset == "先月":
+        last_of_previous = first_of_month - timedelta(days=1)
+        return last_of_previous.replace(day=1), last_of_previous
+    if preset == "今年":
+        return today.replace(month=1, day=1), today
+    return None
+
+
+def render_date_range_filter() -> Optional[Tuple[date, date]]:
+    """
+    配信期間フィルターを表示する
+    
+    選択肢（全期間・今月・先月・今年・期間を指定）を表示し、
+    「期間を指定」の場合は日付の範囲入力を表示します。
+    
+    Returns:
+        Optional[Tuple[date, date]]: (開始日, 終了日)。全期間の場合や、
+            範囲の入力が完了していない場合はNone
+    
+    Examples:
+        >>> date_range = render_date_range_filter()
+        >>> if date_range:
+        ...     start, end = date_range
+    """
+    preset = st.selectbox(
+        "配信期間",
+        DATE_RANGE_OPTIONS,
+        key="date_range_preset",
+    )
+    
+    if preset != DATE_RANGE_CUSTOM:
+        return get_preset_date_range(preset)
+    
+    selected = st.date_input(
+        "期間（開始日〜終了日）",
+        value=(),
+        key="date_range_input",
+        format="YYYY/MM/DD",
+    )
+    # 開始日だけが選ばれている間は絞り込まない
+    if isinstance(selected, (tuple, list)) and len(selected) == 2:
+        return selected[0], selected[1]
+    return None
+
+
 def render_results_table(
     df: pd.DataFrame,
     columns: List[str],
@@ -115,6 +197,43 @@ def render_results_table(
             f"<th>{custom}</th>"
         )
     
+    _write_scrollable_table(html_table)
+    
+    logger.debug("結果テーブルの表示が完了しました")
+
+
+def render_cached_results_table(
+    row_cache: RowHtmlCache,
+    positions: Sequence[int]
+) -> None:
+    """
+    HTMLキャッシュから結果テーブルを表示する
+    
+    事前生成された行ごとのHTML断片を連結してテーブルを表示します。
+    DataFrame.to_htmlを毎回実行するrender_results_tableと同じ見た目になります。
+    
+    Args:
+        row_cache: 全データから構築済みの行HTMLキャッシュ
+        positions: 表示する行位置のシーケンス（表示順）
+    
+    Examples:
+        >>> row_cache = RowHtmlCache(df_display, columns, headers)
+        >>> render_cached_results_table(row_cache, range(25))
+    """
+    logger.debug(f"結果テーブルを表示中（キャッシュ使用）: {len(positions)}件")
+    
+    _write_scrollable_table(row_cache.render_table(positions))
+    
+    logger.debug("結果テーブルの表示が完了しました")
+
+
+def _write_scrollable_table(html_table: str) -> None:
+    """
+    HTMLテーブルをスクロール可能なdivで囲んで表示する
+    
+    Args:
+        html_table: HTMLテーブル文字列
+    """
     # テーブルをスクロール可能なdivで囲む
     scrollable_html = f"""
     <div style="overflow-x: auto; max-width: 100%;">
@@ -124,8 +243,6 @@ def render_results_table(
     
     # 生成したHTMLをStreamlitで表示
     st.write(scrollable_html, unsafe_allow_html=True)
-    
-    logger.debug("結果テーブルの表示が完了しました")
 
 
 
@@ -181,6 +298,98 @@ def render_pagination(
     return None
 
 
+def render_page_navigator(
+    total_count: int,
+    page: int,
+    page_size: int,
+    key: str = "page_navigator"
+) -> Optional[int]:
+    """
+    ページ送りのナビゲーションを表示する
+    
+    「前へ」「次へ」ボタンと、表示中の範囲を表示します。
+    
+    Args:
+        total_count: 総件数
+        page: 現在のページ番号（0始まり）
+        page_size: 1ページあたりの件数
+        key: ウィジェットのキーの接頭辞（同じページに複数表示する場合に指定）
+    
+    Returns:
+        Optional[int]: 新しいページ番号。変更がない場合はNone
+    
+    Examples:
+        >>> new_page = render_page_navigator(total_count=500, page=0, page_size=100)
+        >>> if new_page is not None:
+        ...     st.session_state.page = new_page
+        ...     st.rerun()
+    
+    Notes:
+        - 1ページに収まる場合は何も表示しません
+    """
+    total_pages = max(1, -(-total_count // page_size))
+    if total_pages <= 1:
+        return None
+    
+    start = page * page_size + 1
+    stop = min((page + 1) * page_size, total_count)
+    
+    col_prev, col_status, col_next = st.columns([1, 3, 1])
+    with col_prev:
+        prev_clicked = st.button("◀ 前へ", key=f"{key}_prev", disabled=page <= 0)
+    with col_status:
+        st.markdown(
+            f"ページ {page + 1} / {total_pages}（{start}〜{stop}件目 / 全{total_count}件）"
+        )
+    with col_next:
+        next_clicked = st.button("次へ ▶", key=f"{key}_next", disabled=page >= total_pages - 1)
+    
+    if prev_clicked:
+        return page - 1
+    if next_clicked:
+        return page + 1
+    return None
+
+
+
+def render_suggestions(
+    suggestions: Sequence[str],
+    on_select: Callable[[str], None]
+) -> None:
+    """
+    「もしかして」の候補を表示する
+    
+    候補ごとにボタンを表示し、クリックされた候補をon_selectに渡します。
+    on_selectはボタンのon_clickコールバックとして再実行の前に呼ばれるため、
+    検索入力ボックスなどのセッション状態を更新できます。
+    
+    Args:
+        suggestions: 候補の文字列のシーケンス
+        on_select: 候補がクリックされたときに呼ばれる関数（引数は候補の文字列）
+    
+    Examples:
+        >>> render_suggestions(["YOASOBI", "夜に駆ける"], on_select=apply_suggestion)
+    
+    Notes:
+        - 候補が空の場合は何も表示しません
+    """
+    if not suggestions:
+        return
+    
+    logger.debug(f"検索候補を表示中: {list(suggestions)}")
+    st.write("もしかして:")
+    
+    columns = st.columns(len(suggestions))
+    for i, (column, suggestion) in enumerate(zip(columns, suggestions)):
+        with column:
+            st.button(
+                suggestion,
+                key=f"suggestion_{i}",
+                on_click=on_select,
+                args=(suggestion,),
+            )
+
+
 
 def render_twitter_embed(
     embed_code: str,
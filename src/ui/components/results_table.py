@@ -0,0 +1,134 @@
+"""
+結果テーブルのHTMLキャッシュ
+
+検索結果テーブルの各行を事前に<tr>要素のHTML断片として生成しておき、
+表示時は必要な行の断片を連結するだけでテーブルを組み立てます。
+"""
+
+import logging
+from typing import Dict, List, Sequence
+import pandas as pd
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class RowHtmlCache:
+    """
+    行ごとのHTML断片キャッシュ
+
+    DataFrameの各行を<tr>要素のHTML断片として一度だけ生成し、保持します。
+    生成されるHTMLは DataFrame.to_html(escape=False, index=False, justify="left",
+    classes="dataframe") と同じ構造で、ヘッダーのみカスタムヘッダーに置き換えます。
+
+    行位置はキャッシュ構築時のDataFrameにおける0始まりの位置（iloc）です。
+
+    Examples:
+        >>> cache = RowHtmlCache(df, ["曲名", "アーティスト"], {"曲名": "曲名"})
+        >>> html_table = cache.render_table([0, 1, 2])
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        column_headers: Dict[str, str]
+    ):
+        """
+        RowHtmlCacheを初期化し、全行のHTML断片を生成する
+
+        Args:
+            df: 表示用に整形済みのDataFrame（HTMLタグを含む値はそのまま出力されます）
+            columns: 表示する列のリスト
+            column_headers: 列名のマッピング（元の列名 -> 表示用ヘッダー名）
+        """
+        import time
+
+        start_time = time.time()
+
+        self.columns = list(columns)
+        self._header_html = self._build_header(self.columns, column_headers)
+
+        column_values = [
+            [self._format_cell(value) for value in df[column].tolist()]
+            for column in self.columns
+        ]
+        self._rows: List[str] = [
+            "    <tr>\n"
+            + "".join(f"      <td>{value}</td>\n" for value in values)
+            + "    </tr>\n"
+            for values in zip(*column_values)
+        ]
+
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"結果テーブルのHTMLキャッシュを構築しました: {len(self._rows)}行、"
+            f"処理時間: {elapsed_time:.3f}秒"
+        )
+
+    def __len__(self) -> int:
+        """キャッシュされている行数を返す"""
+        return len(self._rows)
+
+    @staticmethod
+    def _format_cell(value) -> str:
+        """
+        セルの値を文字列に変換する
+
+        Args:
+            value: セルの値
+
+        Returns:
+            表示用の文字列（欠損値は to_html と同じく、Noneは "None"、
+            pd.NAは "<NA>"、NaTは "NaT"、それ以外は "NaN"）
+        """
+        # to_htmlはobject型の列のNoneをそのまま "None" と表示する
+        if value is None:
+            return "None"
+        if value is pd.NA:
+            return "<NA>"
+        if value is pd.NaT:
+            return "NaT"
+        if pd.isna(value):
+            return "NaN"
+        return str(value)
+
+    @staticmethod
+    def _build_header(columns: List[str], column_headers: Dict[str, str]) -> str:
+        """
+        テーブルの開始タグとヘッダー部分のHTMLを生成する
+
+        Args:
+            columns: 表示する列のリスト
+            column_headers: 列名のマッピング
+
+        Returns:
+            <table>から<tbody>開始タグまでのHTML
+        """
+        header_cells = "".join(
+            f"      <th>{column_headers.get(column, column)}</th>\n"
+            for column in columns
+        )
+        return (
+            '<table border="1" class="dataframe dataframe">\n'
+            "  <thead>\n"
+            '    <tr style="text-align: left;">\n'
+            f"{header_cells}"
+            "    </tr>\n"
+            "  </thead>\n"
+            "  <tbody>\n"
+        )
+
+    def render_table(self, positions: Sequence[int]) -> str:
+        """
+        指定された行のHTMLテーブルを組み立てる
+
+        Args:
+            positions: 表示する行位置のシーケンス（表示順）
+
+        Returns:
+            HTMLテーブル文字列
+        """
+        rows = self._rows
+        body = "".join(rows[position] for position in positions)
+        return f"{self._header_html}{body}  </tbody>\n</table>"
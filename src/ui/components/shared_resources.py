@@ -0,0 +1,28 @@
+"""
+ページ間で共有するリソースモジュール
+
+複数のページから使用する、プロセス全体で共有するリソース（st.cache_resource）の
+読み込み処理を提供します。ページモジュール同士の依存を避けるため、
+共有リソースはこのモジュールに定義します。
+"""
+
+import streamlit as st
+
+from src.core.search_result_cache import SearchResultCache
+
+
+@st.cache_resource
+def load_search_result_cache(max_size: int) -> SearchResultCache:
+    """
+    プロセス全体で共有する検索結果キャッシュを取得する
+    
+    キャッシュキーにデータバージョンを含むため、データが更新されても
+    古い結果が返されることはありません。
+    
+    Args:
+        max_size: 保持する最大エントリ数
+    
+    Returns:
+        検索結果キャッシュ
+    """
+    return SearchResultCache(max_size=max_size)
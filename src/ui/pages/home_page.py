@@ -6,48 +6,116 @@
 
 import logging
 import streamlit as st
+import numpy as np
 import pandas as pd
-from typing import Optional
+from datetime import date
+from typing import List, Optional, Tuple
 
 from src.config.settings import Config
 from src.services.data_service import DataService
 from src.core.data_pipeline import DataPipeline
 from src.services.search_service import SearchService
+from src.core.search_index import SearchIndex
+from src.core.fuzzy_index import FuzzyIndex
+from src.core.live_index import LiveIndex
+from src.core.utils import get_search_key_column
+from src.utils.file_fingerprint import compute_data_version
+from src.repositories.processed_data_repository import (
+    ProcessedDataRepository,
+    compute_source_version,
+)
+from src.exceptions.errors import DataSaveError
 from src.ui.components.footer import display_footer
+from src.ui.components.shared_resources import load_search_result_cache
 from src.ui.components import (
     render_search_form,
-    render_results_table,
+    render_date_range_filter,
+    render_cached_results_table,
     render_pagination,
+    render_suggestions,
+    RowHtmlCache,
 )
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 検索インデックスの対象フィールド（正規化済み検索キー列）
+# ライブタイトルはライブインデックスでライブごとに検索する
+SEARCH_INDEX_FIELDS = [
+    get_search_key_column(field)
+    for field in ["曲名", "アーティスト"]
+]
+
+# あいまい検索（もしかして）の対象フィールド
+FUZZY_INDEX_FIELDS = ["曲名", "アーティスト"]
+
+# 結果テーブルに表示する列とヘッダー
+DISPLAY_COLUMNS = [
+    "ライブ配信日",
+    "曲目",
+    "曲名",
+    "アーティスト",
+    "YouTubeリンク",
+]
+COLUMN_HEADERS = {
+    "ライブ配信日": "配信日",
+    "曲目": "No.",
+    "曲名": "曲名",
+    "アーティスト": "アーティスト",
+    "YouTubeリンク": "リンク",
+}
 
-@st.cache_data(ttl=3600, show_spinner="データを読み込み中...")
+
+def get_data_version(config: Config) -> str:
+    """
+    データファイルのフィンガープリントからデータバージョンを計算する
+    
+    配信データと楽曲データのパス、更新時刻、サイズ（設定により
+    コンテンツハッシュも）から計算します。キャッシュキーとして使用することで、
+    データが更新されたときにだけ再処理が行われます。
+    
+    Args:
+        config: アプリケーション設定
+    
+    Returns:
+        データバージョン文字列
+    """
+    return compute_data_version(
+        [config.lives_file_path, config.songs_file_path],
+        include_hash=config.cache_content_hash
+    )
+
+
+@st.cache_data(max_entries=2, show_spinner="データを読み込み中...")
 def load_and_process_data(
     lives_path: str,
     songs_path: str,
-    enable_cache: bool
+    enable_cache: bool,
+    data_version: str
 ) -> Optional[pd.DataFrame]:
     """
     データを読み込み、処理する
     
-    DataPipelineを使用してデータの読み込み、結合、変換、ソートを実行します。
+    元データと一致する処理済みデータファイル（Arrow IPC）があればそれを読み込み、
+    パイプラインの実行を省略します。ない場合はDataPipelineを使用して
+    データの読み込み、結合、変換、ソートを実行します。
     Streamlitのキャッシュ機能により、同じパラメータでの再実行を防ぎます。
     
     Args:
         lives_path: 配信データファイルのパス
         songs_path: 楽曲データファイルのパス
         enable_cache: キャッシュを有効にするかどうか
+        data_version: データファイルのフィンガープリント（get_data_versionの戻り値）
     
     Returns:
         処理済みDataFrame。エラー時はNone
         
     Note:
-        - TTL（Time To Live）は3600秒（1時間）
-        - データファイルのパスが変更された場合、自動的に再読み込みされる
+        - キャッシュはdata_versionをキーとするため、TTLによる期限切れはない
+        - データファイルが更新された場合のみ、自動的に再読み込みされる
+        - 古いバージョンのエントリはmax_entriesにより破棄される
         - キャッシュにより初期表示時間を3秒以内に保つ
+        - persist_processed_dataが有効な場合、処理結果を処理済みデータファイルに保存する
         
     要件: 12.1, 12.2, 12.6
     """
@@ -58,9 +126,166 @@ def load_and_process_data(
     # Config.from_env()は軽量なので許容する
     config = Config.from_env()
     
+    # 処理済みデータファイルが元データと一致すればパイプラインを実行しない
+    repository = ProcessedDataRepository(config.processed_data_file_path)
+    source_version = compute_source_version([lives_path, songs_path])
+    df = repository.load(source_version)
+    if df is not None:
+        return df
+    
     data_service = DataService(config)
     pipeline = DataPipeline(data_service, config)
-    return pipeline.execute()
+    df = pipeline.execute()
+    
+    if df is not None and config.persist_processed_data:
+        try:
+            repository.save(df, source_version)
+        except DataSaveError as e:
+            # 保存に失敗しても処理結果はそのまま使用する
+            logger.warning(f"処理済みデータを保存できませんでした: {e}")
+    
+    return df
+
+
+@st.cache_resource(max_entries=2, show_spinner="検索インデックスを構築中...")
+def load_search_index(
+    lives_path: str,
+    songs_path: str,
+    enable_cache: bool,
+    data_version: str
+) -> Optional[SearchIndex]:
+    """
+    検索インデックスを構築する
+    
+    load_and_process_dataの処理結果から検索インデックスを一度だけ構築し、
+    全セッションで共有します。
+    
+    Args:
+        lives_path: 配信データファイルのパス
+        songs_path: 楽曲データファイルのパス
+        enable_cache: キャッシュを有効にするかどうか
+        data_version: データファイルのフィンガープリント
+    
+    Returns:
+        検索インデックス。データの読み込みに失敗した場合はNone
+        
+    Note:
+        - インデックスはDataFrameではないため、st.cache_resourceで共有する
+        - キーはload_and_process_dataと同一にする
+    """
+    df = load_and_process_data(lives_path, songs_path, enable_cache, data_version)
+    if df is None:
+        return None
+    return SearchIndex(df, SEARCH_INDEX_FIELDS, version=data_version)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_live_index(
+    lives_path: str,
+    songs_path: str,
+    enable_cache: bool,
+    data_version: str
+) -> Optional[LiveIndex]:
+    """
+    ライブインデックスを構築する
+    
+    LIVE_IDごとの行位置とライブタイトルを一度だけ構築し、全セッションで共有します。
+    
+    Args:
+        lives_path: 配信データファイルのパス
+        songs_path: 楽曲データファイルのパス
+        enable_cache: キャッシュを有効にするかどうか
+        data_version: データファイルのフィンガープリント
+    
+    Returns:
+        ライブインデックス。データの読み込みに失敗した場合はNone
+    """
+    df = load_and_process_data(lives_path, songs_path, enable_cache, data_version)
+    if df is None:
+        return None
+    return LiveIndex(df, version=data_version)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_fuzzy_index(
+    lives_path: str,
+    songs_path: str,
+    enable_cache: bool,
+    data_version: str
+) -> Optional[FuzzyIndex]:
+    """
+    あいまい検索インデックスを構築する
+    
+    曲名・アーティストの重複を除いた値から一度だけ構築し、全セッションで共有します。
+    
+    Args:
+        lives_path: 配信データファイルのパス
+        songs_path: 楽曲データファイルのパス
+        enable_cache: キャッシュを有効にするかどうか
+        data_version: データファイルのフィンガープリント
+    
+    Returns:
+        あいまい検索インデックス。データの読み込みに失敗した場合はNone
+    """
+    df = load_and_process_data(lives_path, songs_path, enable_cache, data_version)
+    if df is None:
+        return None
+    return FuzzyIndex(df, FUZZY_INDEX_FIELDS, version=data_version)
+
+
+def build_display_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    結果テーブル表示用にHTMLで装飾したDataFrameを作成する
+    
+    Args:
+        df: 処理済みDataFrame
+    
+    Returns:
+        YouTubeリンク列を追加し、アーティスト列をartist-cellで囲んだDataFrame
+    """
+    df_display = df[["ライブ配信日", "曲目", "曲名"]].copy()
+    
+    # アーティスト列にカスタムCSSクラスを適用
+    df_display["アーティスト"] = (
+        df["アーティスト"]
+        .astype(str)
+        .map(lambda x: f'<div class="artist-cell">{x}</div>')
+    )
+    
+    # YouTubeリンクをHTML形式に変換
+    df_display["YouTubeリンク"] = (
+        df["YouTubeタイムスタンプ付きURL"]
+        .map(lambda url: f'<a href="{url}" target="_blank">YouTubeへ👻</a>')
+    )
+    return df_display
+
+
+@st.cache_resource(max_entries=2, show_spinner="結果テーブルを準備中...")
+def load_row_html_cache(
+    lives_path: str,
+    songs_path: str,
+    enable_cache: bool,
+    data_version: str
+) -> Optional[RowHtmlCache]:
+    """
+    結果テーブルの行HTMLキャッシュを構築する
+    
+    load_and_process_dataの処理結果から全行の<tr>断片を一度だけ生成し、
+    全セッションで共有します。
+    
+    Args:
+        lives_path: 配信データファイルのパス
+        songs_path: 楽曲データファイルのパス
+        enable_cache: キャッシュを有効にするかどうか
+        data_version: データファイルのフィンガープリント
+    
+    Returns:
+        行HTMLキャッシュ。データの読み込みに失敗した場合はNone
+    """
+    df = load_and_process_data(lives_path, songs_path, enable_cache, data_version)
+    if df is None:
+        return None
+    return RowHtmlCache(build_display_frame(df), DISPLAY_COLUMNS, COLUMN_HEADERS)
 
 
 class HomePage:
@@ -73,7 +298,10 @@ class HomePage:
     def __init__(self):
         """初期化"""
         self.config = Config.from_env()
-        self.search_service = SearchService()
+        self.search_service = SearchService(
+            result_cache=load_search_result_cache(self.config.search_cache_size)
+        )
+        self.data_version = ""
         logger.info("HomePage initialized")
 
     def run(self):
@@ -83,11 +311,13 @@ class HomePage:
         self._load_css()
         self._render_header()
         
-        # データ読み込み
+        # データ読み込み（データファイルが更新された場合のみ再処理される）
+        self.data_version = get_data_version(self.config)
         df_full = load_and_process_data(
             self.config.lives_file_path,
             self.config.songs_file_path,
-            self.config.enable_cache
+            self.config.enable_cache,
+            self.data_version
         )
         
         if df_full is not None:
@@ -123,16 +353,24 @@ class HomePage:
         """
         検索処理と結果表示の制御
         
+        検索結果はDataFrameのコピーではなく、全セッションで共有される
+        df_fullへの行位置（int32配列）としてセッション状態に保持します。
+        
         Args:
             df_full: 全データ
         """
         # セッション状態の初期化
         if "search_query" not in st.session_state:
             st.session_state.search_query = ""
-        if "filtered_df" not in st.session_state:
-            st.session_state.filtered_df = df_full.copy()
+        if "filtered_positions" not in st.session_state:
+            # Noneは全件を表す
+            st.session_state.filtered_positions = None
+            st.session_state.filtered_version = self.data_version
         if "include_live_title" not in st.session_state:
             st.session_state.include_live_title = True
+        if "date_range" not in st.session_state:
+            # Noneは全期間を表す
+            st.session_state.date_range = None
         if "display_limit" not in st.session_state:
             st.session_state.display_limit = self.config.initial_display_limit
         
@@ -141,94 +379,278 @@ class HomePage:
             default_query=st.session_state.search_query,
             include_live_title=st.session_state.include_live_title
         )
+        current_date_range = render_date_range_filter()
         
         # 検索ロジック
-        if search_button:
-            self._perform_search(df_full, current_input, current_checkbox_value)
-        elif st.session_state.search_query:
+        # インクリメンタル検索では、入力の確定（Enter・フォーカス移動）で検索する。
+        # テキスト入力は確定時にだけ再実行されるため、キー入力ごとには検索しない
+        input_changed = (
+            current_input != st.session_state.search_query
+            or current_checkbox_value != st.session_state.include_live_title
+            or current_date_range != st.session_state.date_range
+        )
+        if search_button or (self.config.incremental_search and input_changed):
+            self._perform_search(
+                df_full, current_input, current_checkbox_value, current_date_range
+            )
+        elif st.session_state.search_query or st.session_state.date_range:
             # 既に検索済みの状態の表示更新（リロード時など）
-            st.write(
-                f"「{st.session_state.search_query}」で検索した結果: "
-                f"{len(st.session_state.filtered_df)}件"
+            if st.session_state.get("filtered_version") != self.data_version:
+                # データが更新された場合、行位置が変わるため再検索する
+                self._update_filtered_positions(
+                    df_full,
+                    st.session_state.search_query,
+                    st.session_state.include_live_title,
+                    date_range=st.session_state.date_range
+                )
+            self._write_result_count(
+                st.session_state.search_query,
+                st.session_state.date_range,
+                len(st.session_state.filtered_positions)
             )
+            if st.session_state.search_query and len(st.session_state.filtered_positions) == 0:
+                self._render_suggestions(
+                    st.session_state.search_query,
+                    st.session_state.include_live_title
+                )
         else:
             # 未検索（全件）
-            st.session_state.filtered_df = df_full.copy()
+            st.session_state.filtered_positions = None
             st.write("検索キーワードが入力されていません。全件表示します。")
         
         # 結果テーブル表示
-        self._render_results(st.session_state.filtered_df)
+        self._render_results(df_full, st.session_state.filtered_positions)
 
-    def _perform_search(self, df_full: pd.DataFrame, query: str, include_title: bool):
+    def _perform_search(
+        self,
+        df_full: pd.DataFrame,
+        query: str,
+        include_title: bool,
+        date_range: Optional[Tuple[date, date]] = None
+    ):
         """
         検索を実行し、セッション状態を更新する
+        
+        インクリメンタル検索が有効で、クエリが前回のクエリを絞り込むものである場合、
+        全件ではなく前回の検索結果の行だけを照合します。
         """
+        candidates = self._get_incremental_candidates(query, include_title, date_range)
+        
         st.session_state.search_query = query
         st.session_state.include_live_title = include_title
+        st.session_state.date_range = date_range
         st.session_state.display_limit = self.config.initial_display_limit
         
-        if query:
-            search_fields = ["曲名", "アーティスト"]
-            if include_title:
-                search_fields.append("ライブタイトル")
-            
-            st.session_state.filtered_df = self.search_service.search(
-                df_full,
-                query,
-                search_fields,
-                case_sensitive=False
+        if query or date_range:
+            self._update_filtered_positions(
+                df_full, query, include_title, candidates, date_range
             )
-            st.write(
-                f"「{query}」で検索した結果: "
-                f"{len(st.session_state.filtered_df)}件"
+            self._write_result_count(
+                query, date_range, len(st.session_state.filtered_positions)
             )
+            if query and len(st.session_state.filtered_positions) == 0:
+                self._render_suggestions(query, include_title)
         else:
-            st.session_state.filtered_df = df_full.copy()
+            st.session_state.filtered_positions = None
             st.write("検索キーワードが入力されていません。全件表示します。")
 
-    def _render_results(self, df: pd.DataFrame):
-        """結果テーブルとページネーションの表示"""
-        # 表示用データの準備
-        df_to_show = df.copy()
+    def _update_filtered_positions(
+        self,
+        df_full: pd.DataFrame,
+        query: str,
+        include_title: bool,
+        candidates: Optional[np.ndarray] = None,
+        date_range: Optional[Tuple[date, date]] = None
+    ):
+        """
+        検索を実行し、一致した行位置をセッション状態に保存する
+        
+        Args:
+            df_full: 全データ
+            query: 検索クエリ
+            include_title: ライブタイトルを検索対象に含めるか
+            candidates: 照合対象を限定する行位置の配列（任意）
+            date_range: 配信日の期間（開始日, 終了日）（任意）
+        """
+        search_fields = self._get_search_fields(include_title)
+        search_index = load_search_index(
+            self.config.lives_file_path,
+            self.config.songs_file_path,
+            self.config.enable_cache,
+            self.data_version
+        )
+        # 「live:」指定にも使うため、チェックボックスに関わらず取得する
+        live_index = load_live_index(
+            self.config.lives_file_path,
+            self.config.songs_file_path,
+            self.config.enable_cache,
+            self.data_version
+        )
+        st.session_state.filtered_positions = self.search_service.search_positions(
+            df_full,
+            query,
+            search_fields,
+            case_sensitive=False,
+            index=search_index,
+            normalize=True,
+            use_query_syntax=True,
+            candidates=candidates,
+            live_index=live_index,
+            date_range=date_range
+        )
+        st.session_state.filtered_version = self.data_version
+
+    @staticmethod
+    def _write_result_count(
+        query: str,
+        date_range: Optional[Tuple[date, date]],
+        count: int
+    ):
+        """
+        検索結果の件数を表示する
+        
+        Args:
+            query: 検索クエリ
+            date_range: 配信日の期間（開始日, 終了日）
+            count: 件数
+        """
+        if date_range:
+            start, end = date_range
+            period = f"{start:%Y/%m/%d}〜{end:%Y/%m/%d}"
+            if query:
+                st.write(f"「{query}」を{period}の配信から検索した結果: {count}件")
+            else:
+                st.write(f"{period}に配信された曲: {count}件")
+        else:
+            st.write(f"「{query}」で検索した結果: {count}件")
+
+    def _get_incremental_candidates(
+        self,
+        query: str,
+        include_title: bool,
+        date_range: Optional[Tuple[date, date]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        前回の検索結果から絞り込める場合、その行位置を返す
+        
+        Args:
+            query: 今回の検索クエリ
+            include_title: ライブタイトルを検索対象に含めるか
+            date_range: 今回の配信日の期間
+        
+        Returns:
+            前回の検索結果の行位置。絞り込みにならない場合はNone
+        """
+        if not self.config.incremental_search:
+            return None
+        
+        previous_positions = st.session_state.get("filtered_positions")
+        if (
+            previous_positions is None
+            or st.session_state.get("filtered_version") != self.data_version
+            or st.session_state.get("include_live_title") != include_title
+            or st.session_state.get("date_range") != date_range
+        ):
+            return None
+        
+        previous_query = st.session_state.get("search_query", "")
+        if not self.search_service.is_narrowing_query(
+            previous_query, query, normalize=True, use_query_syntax=True
+        ):
+            return None
+        
+        logger.debug(f"前回の検索結果から絞り込みます: '{previous_query}' -> '{query}'")
+        return previous_positions
+
+    @staticmethod
+    def _get_search_fields(include_title: bool) -> List[str]:
+        """
+        検索対象フィールドのリストを返す
         
-        # YouTubeリンクをHTML形式に変換
-        df_to_show["YouTubeリンク"] = df_to_show.apply(
-            lambda row: f'<a href="{row["YouTubeタイムスタンプ付きURL"]}" target="_blank">YouTubeへ👻</a>',
-            axis=1,
+        Args:
+            include_title: ライブタイトルを検索対象に含めるか
+        
+        Returns:
+            検索対象フィールドのリスト
+        """
+        search_fields = ["曲名", "アーティスト"]
+        if include_title:
+            search_fields.append("ライブタイトル")
+        return search_fields
+
+    def _render_suggestions(self, query: str, include_title: bool):
+        """
+        検索結果が0件の場合に「もしかして」の候補を表示する
+        
+        Args:
+            query: 検索クエリ
+            include_title: ライブタイトルを検索対象に含めるか
+        """
+        fuzzy_index = load_fuzzy_index(
+            self.config.lives_file_path,
+            self.config.songs_file_path,
+            self.config.enable_cache,
+            self.data_version
         )
+        if fuzzy_index is None:
+            return
         
-        # アーティスト列にカスタムCSSクラスを適用
-        df_to_show["アーティスト"] = (
-            df_to_show["アーティスト"]
-            .astype(str)
-            .apply(lambda x: f'<div class="artist-cell">{x}</div>')
+        suggestions = self.search_service.suggest(
+            query,
+            self._get_search_fields(include_title),
+            fuzzy_index,
+            use_query_syntax=True
         )
+        # 曲名とアーティストで同じ値の候補は一つにまとめる
+        texts = list(dict.fromkeys(match.text for match in suggestions))
+        render_suggestions(texts, on_select=self._apply_suggestion)
+
+    def _apply_suggestion(self, suggestion: str):
+        """
+        選択された候補で再検索するようにセッション状態を更新する
+        
+        ボタンのon_clickコールバックとして再実行の前に呼ばれます。
+        
+        Args:
+            suggestion: 選択された候補
+        """
+        st.session_state.search_input_box = suggestion
+        st.session_state.search_query = suggestion
+        st.session_state.display_limit = self.config.initial_display_limit
+        # バージョンを無効にして、次の実行で再検索させる
+        st.session_state.filtered_version = None
+
+    def _render_results(self, df: pd.DataFrame, positions: Optional[np.ndarray] = None):
+        """
+        結果テーブルとページネーションの表示
         
-        # 表示件数を制限
-        df_limited_display = df_to_show.head(st.session_state.display_limit)
-        
-        # 表示する列とヘッダーの定義
-        display_columns = [
-            "ライブ配信日",
-            "曲目",
-            "曲名",
-            "アーティスト",
-            "YouTubeリンク",
-        ]
-        column_headers = {
-            "ライブ配信日": "配信日",
-            "曲目": "No.",
-            "曲名": "曲名",
-            "アーティスト": "アーティスト",
-            "YouTubeリンク": "リンク",
-        }
+        Args:
+            df: 全データ
+            positions: 表示する行位置の配列。Noneの場合は全件
+        """
+        display_limit = st.session_state.display_limit
+        
+        # 表示する行だけを選び、事前生成済みの行HTMLを連結して表示する
+        if positions is None:
+            total_count = len(df)
+            page_positions = range(min(display_limit, total_count))
+        else:
+            total_count = len(positions)
+            page_positions = positions[:display_limit].tolist()
+        
+        row_cache = load_row_html_cache(
+            self.config.lives_file_path,
+            self.config.songs_file_path,
+            self.config.enable_cache,
+            self.data_version
+        )
         
         # 結果テーブルの表示
-        render_results_table(df_limited_display, display_columns, column_headers)
+        render_cached_results_table(row_cache, page_positions)
         
         # ページネーションの表示
         new_limit = render_pagination(
-            total_count=len(df),
+            total_count=total_count,
             current_limit=st.session_state.display_limit,
             increment=self.config.display_increment
         )
@@ -0,0 +1,555 @@
+"""
+楽曲リストページ
+
+歌唱楽曲リスト（β版）ページの表示ロジックを担当します。
+"""
+
+import logging
+import unicodedata
+import streamlit as st
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence
+
+from src.config.settings import Config
+from src.services.data_service import DataService
+from src.services.search_service import SearchService
+from src.core.search_index import SearchIndex
+from src.core.utils import build_search_keys, get_search_key_column
+from src.utils.file_fingerprint import compute_data_version
+from src.ui.components.shared_resources import load_search_result_cache
+from src.ui.components.footer import display_footer
+from src.ui.components import RowHtmlCache, render_page_navigator
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 楽曲リストテーブルに表示する列とヘッダー
+DISPLAY_COLUMNS = ["アーティスト", "曲名", "リンク"]
+COLUMN_HEADERS = {
+    "アーティスト": "アーティスト",
+    "曲名": "曲名",
+    "リンク": "リンク",
+}
+
+# 楽曲リストの検索対象フィールド
+SEARCH_FIELDS = ["曲名", "アーティスト", "アーティスト(ソート用)"]
+
+# 検索インデックスの対象フィールド（正規化済み検索キー列）
+SEARCH_INDEX_FIELDS = [get_search_key_column(field) for field in SEARCH_FIELDS]
+
+# 頭文字インデックスの五十音の行（濁点・半濁点は除いて判定する）
+KANA_ROWS = {
+    "あ": "あいうえおぁぃぅぇぉ",
+    "か": "かきくけこ",
+    "さ": "さしすせそ",
+    "た": "たちつてとっ",
+    "な": "なにぬねの",
+    "は": "はひふへほ",
+    "ま": "まみむめも",
+    "や": "やゆよゃゅょ",
+    "ら": "らりるれろ",
+    "わ": "わをんゎ",
+}
+_KANA_TO_ROW = {kana: row for row, kanas in KANA_ROWS.items() for kana in kanas}
+
+# 数字で始まるアーティストと、分類できないアーティストの頭文字
+INITIAL_NUMBER = "#"
+INITIAL_OTHER = "他"
+
+# ページ固有のCSS
+CUSTOM_CSS = """
+/* ================================================= */
+/* アプリケーション全体のレイアウト調整 */
+/* ================================================= */
+/* Streamlitのメインコンテンツエリアの幅を制御し、中央寄せにする */
+.block-container {
+    max-width: 1200px;
+    margin-left: auto;
+    margin-right: auto;
+    padding-top: 2rem;
+    padding-bottom: 2rem;
+}
+
+/* ================================================= */
+/* 特定のStreamlit要素のスタイリング */
+/* ================================================= */
+
+/* タイトルの中央寄せ */
+# h1 {
+#     text-align: center;
+#     margin-bottom: 1.5rem;
+# }
+
+/* 検索結果件数表示のメッセージを左寄せに戻す */
+div[data-testid="stMarkdown"] p {
+    text-align: left;
+    margin-bottom: 1rem;
+}
+
+/* ================================================= */
+/* HTMLテーブルのスタイリング（既存+微調整） */
+/* ================================================= */
+
+/* テーブル内のヘッダーとデータセルに white-space: nowrap; を適用して改行を防ぐ */
+table.dataframe th,
+table.dataframe td {
+    white-space: nowrap;
+    /* デフォルトで改行しない */
+    padding: 8px 12px;
+    text-align: left;
+}
+
+/* アーティスト列のセル内コンテンツにのみ改行を許可 */
+.artist-cell {
+    white-space: normal;
+    /* 通常の改行を許可 */
+    word-break: break-word;
+    /* 長い単語でも強制的に改行 */
+}
+
+table.dataframe {
+    min-width: fit-content;
+    width: 100%;
+    border-collapse: collapse;
+}
+
+table.dataframe th,
+table.dataframe td {
+    border: 1px solid #ddd;
+}
+
+table.dataframe thead th {
+    background-color: #f2f2f2;
+    font-weight: bold;
+}
+"""
+
+
+def get_song_list_version(config: Config) -> str:
+    """
+    楽曲リストファイルのフィンガープリントからデータバージョンを計算する
+
+    Args:
+        config: アプリケーション設定
+
+    Returns:
+        データバージョン文字列
+    """
+    return compute_data_version(
+        [config.song_list_file_path],
+        include_hash=config.cache_content_hash
+    )
+
+
+def prepare_song_list(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    楽曲リストを表示順に整える
+
+    Args:
+        df: V_SONG_LIST.TSVから読み込んだDataFrame
+
+    Returns:
+        アーティスト名が「-」の楽曲を除外し、アーティスト(ソート用)の順に
+        並べ替えたDataFrame（インデックスは0からの連番）
+
+    Note:
+        - ソートは大文字小文字を区別せず、欠損値は最後に配置します
+        - 安定ソート（mergesort）により、同じアーティスト内の曲順を維持します
+
+    要件: 1.1, 1.2, 1.5, 2.1, 8.2, 8.3
+    """
+    df_filtered = df[df["アーティスト"] != "-"]
+    df_sorted = df_filtered.sort_values(
+        by="アーティスト(ソート用)",
+        na_position="last",
+        key=lambda col: col.str.lower(),
+        kind="mergesort"
+    )
+    return df_sorted.reset_index(drop=True)
+
+
+def add_song_list_search_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    楽曲リストに正規化済み検索キー列を追加する
+
+    Args:
+        df: 楽曲リストのDataFrame
+
+    Returns:
+        検索対象フィールドごとに検索キー列（例: 「曲名_検索キー」）を追加したDataFrame
+
+    Note:
+        存在しないフィールドはスキップされます
+    """
+    for field in SEARCH_FIELDS:
+        if field in df.columns:
+            df[get_search_key_column(field)] = build_search_keys(df[field])
+    return df
+
+
+def build_song_list_display_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    楽曲リストテーブル表示用にHTMLで装飾したDataFrameを作成する
+
+    Args:
+        df: prepare_song_listで整えたDataFrame
+
+    Returns:
+        アーティスト列をartist-cellで囲み、最近の歌唱のリンク列を追加したDataFrame
+
+    要件: 8.4
+    """
+    df_display = df[["曲名"]].copy()
+    df_display["アーティスト"] = (
+        df["アーティスト"]
+        .astype(str)
+        .map(lambda x: f'<div class="artist-cell">{x}</div>')
+    )
+    df_display["リンク"] = df["最近の歌唱"].map(
+        lambda url: f'<a href="{url}" target="_blank">YouTubeへ👻</a>' if pd.notna(url) else ""
+    )
+    return df_display
+
+
+def get_artist_initial(sort_name) -> str:
+    """
+    ソート用アーティスト名から頭文字インデックスの見出しを求める
+
+    Args:
+        sort_name: アーティスト(ソート用)の値
+
+    Returns:
+        英字は大文字のアルファベット、かなは五十音の行（あ・か・さ…）、
+        数字は「#」、それ以外（欠損値を含む）は「他」
+
+    Examples:
+        >>> get_artist_initial("yoasobi")
+        'Y'
+        >>> get_artist_initial("ぼかろ")
+        'は'
+    """
+    if pd.isna(sort_name) or not str(sort_name):
+        return INITIAL_OTHER
+
+    # 全角英数字・半角カナを揃え、濁点・半濁点を分離して先頭の文字を取り出す
+    first = unicodedata.normalize("NFKD", str(sort_name))[0]
+    if "ァ" <= first <= "ヶ":
+        # カタカナはひらがなとして扱う
+        first = chr(ord(first) - 0x60)
+
+    if first.isascii() and first.isalpha():
+        return first.upper()
+    if first.isdigit():
+        return INITIAL_NUMBER
+    return _KANA_TO_ROW.get(first, INITIAL_OTHER)
+
+
+def build_initial_index(sort_names: Sequence) -> Dict[str, int]:
+    """
+    頭文字ごとの最初の行位置を求める
+
+    Args:
+        sort_names: 表示順に並んだアーティスト(ソート用)の値
+
+    Returns:
+        頭文字をキー、その頭文字の最初の行位置を値とする辞書（表示順）
+    """
+    initial_index: Dict[str, int] = {}
+    for position, sort_name in enumerate(sort_names):
+        initial_index.setdefault(get_artist_initial(sort_name), position)
+    return initial_index
+
+
+@st.cache_data(max_entries=2, show_spinner="楽曲リストを読み込み中...")
+def load_song_list(song_list_path: str, data_version: str) -> Optional[pd.DataFrame]:
+    """
+    楽曲リストを読み込み、表示順に整える
+
+    Args:
+        song_list_path: 楽曲リストファイルのパス
+        data_version: 楽曲リストファイルのフィンガープリント（get_song_list_versionの戻り値）
+
+    Returns:
+        表示順に整え、検索キー列を追加したDataFrame。読み込みに失敗した場合はNone
+
+    Note:
+        - キャッシュはdata_versionをキーとするため、ファイルが更新された場合のみ再処理される
+        - 古いバージョンのエントリはmax_entriesにより破棄される
+    """
+    config = Config.from_env()
+    df = DataService(config).load_song_list_data()
+    if df is None:
+        return None
+    return add_song_list_search_keys(prepare_song_list(df))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_song_list_search_index(
+    song_list_path: str,
+    data_version: str
+) -> Optional[SearchIndex]:
+    """
+    楽曲リストの検索インデックスを構築する
+
+    曲名・アーティスト・アーティスト(ソート用)の正規化済み検索キーから
+    一度だけ構築し、全セッションで共有します。
+
+    Args:
+        song_list_path: 楽曲リストファイルのパス
+        data_version: 楽曲リストファイルのフィンガープリント
+
+    Returns:
+        検索インデックス。データの読み込みに失敗した場合はNone
+    """
+    df = load_song_list(song_list_path, data_version)
+    if df is None:
+        return None
+    return SearchIndex(df, SEARCH_INDEX_FIELDS, version=data_version)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_song_list_html_cache(
+    song_list_path: str,
+    data_version: str
+) -> Optional[RowHtmlCache]:
+    """
+    楽曲リストテーブルの行HTMLキャッシュを構築する
+
+    load_song_listの処理結果から全行の<tr>断片を一度だけ生成し、全セッションで共有します。
+
+    Args:
+        song_list_path: 楽曲リストファイルのパス
+        data_version: 楽曲リストファイルのフィンガープリント
+
+    Returns:
+        行HTMLキャッシュ。データの読み込みに失敗した場合はNone
+    """
+    df = load_song_list(song_list_path, data_version)
+    if df is None:
+        return None
+    return RowHtmlCache(build_song_list_display_frame(df), DISPLAY_COLUMNS, COLUMN_HEADERS)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_song_list_initial_index(song_list_path: str, data_version: str) -> Dict[str, int]:
+    """
+    楽曲リストの頭文字インデックスを構築する
+
+    Args:
+        song_list_path: 楽曲リストファイルのパス
+        data_version: 楽曲リストファイルのフィンガープリント
+
+    Returns:
+        頭文字をキー、最初の行位置を値とする辞書。データの読み込みに失敗した場合は空の辞書
+
+    Note:
+        - 全セッションで共有されるため、戻り値を変更しないこと
+    """
+    df = load_song_list(song_list_path, data_version)
+    if df is None:
+        return {}
+    return build_initial_index(df["アーティスト(ソート用)"].tolist())
+
+
+class SongListPage:
+    """
+    楽曲リストページクラス
+
+    歌唱楽曲リスト（β版）の描画を管理します。
+    フィルタリング・ソート・HTML生成の結果は楽曲リストファイルの
+    フィンガープリントをキーとしてキャッシュされ、全セッションで共有されます。
+    テーブルはページ単位で送信し、アーティストの頭文字で該当ページに移動できます。
+    曲名・アーティスト・読みがなによる検索は、共有の検索インデックスを使用して
+    サーバー側で行います。
+    """
+
+    def __init__(self):
+        """初期化"""
+        self.config = Config.from_env()
+        self.search_service = SearchService(
+            result_cache=load_search_result_cache(self.config.search_cache_size)
+        )
+        self.data_version = ""
+        logger.info("SongListPage initialized")
+
+    def run(self):
+        """
+        楽曲リストページを実行・表示する
+        """
+        st.markdown(f"<style>{CUSTOM_CSS}</style>", unsafe_allow_html=True)
+        self._render_header()
+
+        # データ読み込み（楽曲リストファイルが更新された場合のみ再処理される）
+        self.data_version = get_song_list_version(self.config)
+        df = load_song_list(self.config.song_list_file_path, self.data_version)
+
+        if df is not None:
+            self._render_song_list(df)
+        else:
+            self._handle_error()
+
+        display_footer()
+
+    def _render_header(self):
+        """ヘッダー領域とβ版の制約の描画"""
+        st.title("しのうたタイム👻🫧")
+        st.subheader("歌唱楽曲リスト(β版)")
+        st.markdown(
+            """
+            こちらはVTuber「[幽音しの](https://www.774.ai/talent/shino-kasukane)」さんの配信で歌われた楽曲をまとめた非公式データベースです。
+            """
+        )
+
+        # 要件: 8.1-8.5に関連する制約事項
+        with st.expander("β版の制約について"):
+            st.info(
+                """
+                - **アーティスト・楽曲の並び順:** 現在、漢字の並び順を調整中です。
+                - **一部楽曲の重複:** 一部の楽曲が重複して表示される場合があります。
+                - **機能の変更:** 今後、予告なくレイアウトや機能が変更・削除されることがあります。
+                """
+            )
+        st.markdown("---")
+
+    def _render_song_list(self, df: pd.DataFrame):
+        """
+        検索フォーム、楽曲リストの件数と、現在のページのテーブルの描画
+
+        テーブルは1ページ分の行だけをキャッシュ済みの行HTMLから組み立てて送信します。
+        検索は共有の検索インデックスを使用してサーバー側で行い、
+        一致した行のみをページに分けて表示します。
+
+        Args:
+            df: 表示順に整えた楽曲リスト
+        """
+        # セッション状態の初期化（データが更新された場合は先頭ページに戻す）
+        if (
+            "song_list_page" not in st.session_state
+            or st.session_state.get("song_list_version") != self.data_version
+        ):
+            st.session_state.song_list_page = 0
+            st.session_state.song_list_version = self.data_version
+            st.session_state.song_list_searched_query = ""
+
+        query = st.text_input(
+            "曲名・アーティストで検索",
+            key="song_list_query",
+            placeholder="曲名・アーティスト・読みがなを入力してEnter",
+        ).strip()
+        if query != st.session_state.song_list_searched_query:
+            # 検索条件が変わった場合は先頭ページに戻す
+            st.session_state.song_list_page = 0
+            st.session_state.song_list_searched_query = query
+
+        if query:
+            positions = self._search(df, query)
+            if len(positions) == 0:
+                st.info(f"「{query}」に一致する楽曲は見つかりませんでした。")
+                return
+            st.markdown(f"**「{query}」の検索結果: {len(positions)} 件**")
+        else:
+            # 要件: 1.4（フィルタリング後の正確な件数を表示）, 8.5
+            st.markdown(f"**全 {len(df)} 件**")
+
+            # 頭文字の行位置は全件の並びにおける位置のため、検索していない場合のみ表示する
+            initial_index = load_song_list_initial_index(
+                self.config.song_list_file_path, self.data_version
+            )
+            self._render_initial_jump(initial_index)
+            positions = np.arange(len(df), dtype=np.int32)
+
+        self._render_page(positions)
+
+    def _search(self, df: pd.DataFrame, query: str) -> np.ndarray:
+        """
+        楽曲リストを検索する
+
+        Args:
+            df: 表示順に整えた楽曲リスト
+            query: 検索クエリ
+
+        Returns:
+            一致した行位置の配列（int32、表示順）
+        """
+        search_index = load_song_list_search_index(
+            self.config.song_list_file_path, self.data_version
+        )
+        positions = self.search_service.search_positions(
+            df, query, SEARCH_FIELDS, index=search_index, normalize=True
+        )
+        if positions is None:
+            return np.arange(len(df), dtype=np.int32)
+        return positions
+
+    def _render_initial_jump(self, initial_index: Dict[str, int]):
+        """
+        頭文字によるジャンプの描画
+
+        Args:
+            initial_index: 頭文字をキー、最初の行位置を値とする辞書
+        """
+        if not initial_index:
+            return
+
+        st.selectbox(
+            "頭文字で移動",
+            options=list(initial_index),
+            index=None,
+            placeholder="アーティストの頭文字を選択",
+            key="song_list_initial",
+            on_change=self._jump_to_initial,
+            args=(initial_index,),
+        )
+
+    def _jump_to_initial(self, initial_index: Dict[str, int]):
+        """
+        選択された頭文字を含むページに移動する（selectboxのon_changeコールバック）
+
+        Args:
+            initial_index: 頭文字をキー、最初の行位置を値とする辞書
+        """
+        initial = st.session_state.get("song_list_initial")
+        if initial in initial_index:
+            st.session_state.song_list_page = (
+                initial_index[initial] // self.config.song_list_page_size
+            )
+        # 同じ頭文字を再度選択できるよう、選択を解除する
+        st.session_state.song_list_initial = None
+
+    def _render_page(self, positions: np.ndarray):
+        """
+        現在のページの行とページ送りの描画
+
+        Args:
+            positions: 表示対象の行位置（表示順）
+        """
+        page_size = self.config.song_list_page_size
+        total_count = len(positions)
+        last_page = max(0, (total_count - 1) // page_size)
+        page = min(st.session_state.song_list_page, last_page)
+
+        top_page = render_page_navigator(total_count, page, page_size, key="song_list_top")
+
+        html_cache = load_song_list_html_cache(
+            self.config.song_list_file_path, self.data_version
+        )
+        if html_cache is not None:
+            window = positions[page * page_size:(page + 1) * page_size]
+            st.write(html_cache.render_table(window.tolist()), unsafe_allow_html=True)
+
+        bottom_page = render_page_navigator(total_count, page, page_size, key="song_list_bottom")
+
+        new_page = top_page if top_page is not None else bottom_page
+        if new_page is not None:
+            st.session_state.song_list_page = new_page
+            st.rerun()
+
+    def _handle_error(self):
+        """エラー時の表示"""
+        # キャッシュされた関数からはエラー内容を受け取れないため、失敗時のみ再度読み込む
+        data_service = DataService(self.config)
+        if data_service.load_song_list_data() is None and data_service.get_last_error():
+            st.error(f"エラー: {data_service.get_last_error()}")
+            st.info(f"`{self.config.song_list_file_path}` が正しく配置されているか確認してください。")
+        st.warning("楽曲データが読み込めませんでした。")
@@ -2,8 +2,14 @@
 アーティスト名からソート用読み仮名を生成するモジュール
 """
 import re
+import json
 import logging
-from typing import Optional, TYPE_CHECKING
+import os
+import tempfile
+from importlib import metadata
+from typing import Dict, Optional, Set, TYPE_CHECKING
+
+from src.utils.file_fingerprint import FileFingerprint
 
 if TYPE_CHECKING:
     from src.repositories.artist_sort_mapping_repository import ArtistSortMappingRepository
@@ -15,6 +21,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 永続キャッシュファイルの形式バージョン（形式を変更した場合に更新する）
+_CACHE_FORMAT_VERSION = 1
+
+
+def _get_pykakasi_version() -> str:
+    """
+    インストールされているpykakasiのバージョンを取得
+    
+    Returns:
+        バージョン文字列（pykakasiが利用できない場合は"unavailable"）
+    """
+    if pykakasi is None:
+        return "unavailable"
+    try:
+        return metadata.version("pykakasi")
+    except metadata.PackageNotFoundError:
+        return getattr(pykakasi, "__version__", "unknown")
+
 
 class ArtistSortGenerator:
     """
@@ -22,24 +46,52 @@ class ArtistSortGenerator:
     
     日本語が含まれる場合はひらがなに変換し、英数字のみの場合はそのまま返す。
     修正マッピングリポジトリが設定されている場合は、マッピングを優先的に適用する。
+    
+    生成結果はアーティスト名ごとにメモ化され、リポジトリ経由でマッピングが変更された
+    場合は該当アーティストの分を、refresh()で修正マッピングファイルの
+    フィンガープリントが変わったことを検知した場合は全てを破棄する。pykakasiによる読み仮名は
+    キャッシュファイルを指定すると永続化され、pykakasiのバージョンが一致する
+    場合のみ次回以降に再利用される。
     """
     
-    def __init__(self, mapping_repository: Optional['ArtistSortMappingRepository'] = None):
+    def __init__(
+        self,
+        mapping_repository: Optional['ArtistSortMappingRepository'] = None,
+        cache_file_path: Optional[str] = None
+    ):
         """
         ArtistSortGeneratorを初期化
         
         Args:
             mapping_repository: 修正マッピングリポジトリ（オプション）
+            cache_file_path: 読み仮名の永続キャッシュファイルのパス（オプション）
         
         pykakasiが利用可能な場合は初期化する。
         """
         self._kakasi = None
-        self._mapping_repository = mapping_repository
+        self._mapping_repository = None
         if pykakasi is not None:
             try:
                 self._kakasi = pykakasi.kakasi()
             except Exception as e:
                 logger.warning(f"pykakasiの初期化に失敗しました: {e}")
+        
+        # アーティスト名 -> ソート用アーティスト名のメモ（マッピング適用後）
+        self._memo: Dict[str, str] = {}
+        self._mappings: Dict[str, str] = {}
+        self._mapping_version: Optional[str] = None
+        
+        # アーティスト名 -> pykakasiによる読み仮名（マッピングに依存しない）
+        self._cache_file_path = cache_file_path
+        self._cache_key = f"{_CACHE_FORMAT_VERSION}:pykakasi={_get_pykakasi_version()}"
+        self._readings: Dict[str, str] = {}
+        self._used_readings: Set[str] = set()
+        self._readings_dirty = False
+        if cache_file_path is not None:
+            self._load_cache()
+        
+        if mapping_repository is not None:
+            self.set_mapping_repository(mapping_repository)
     
     def set_mapping_repository(self, repository: 'ArtistSortMappingRepository') -> None:
         """
@@ -48,7 +100,31 @@ class ArtistSortGenerator:
         Args:
             repository: 修正マッピングリポジトリ
         """
+        if self._mapping_repository is not None:
+            self._mapping_repository.remove_listener(self._on_mapping_changed)
         self._mapping_repository = repository
+        self._mapping_version = None
+        repository.add_listener(self._on_mapping_changed)
+    
+    def _on_mapping_changed(self, artist: str, sort_name: Optional[str]) -> None:
+        """
+        リポジトリでマッピングが変更された場合に、該当アーティストのメモを破棄
+        
+        Args:
+            artist: 変更されたアーティスト名（トリム済み）
+            sort_name: 新しいソート名（削除された場合はNone）
+        """
+        if self._mapping_version is None:
+            # マッピング未読み込みの場合は次回のgenerate()で最新の内容を読み込む
+            return
+        
+        if sort_name is None:
+            self._mappings.pop(artist, None)
+        else:
+            self._mappings[artist] = sort_name
+        # メモのキーはトリム前の名前のため、トリム後に一致するものを全て破棄する
+        for name in [name for name in self._memo if name.strip() == artist]:
+            del self._memo[name]
     
     def generate(self, artist_name: str) -> str:
         """
@@ -73,19 +149,67 @@ class ArtistSortGenerator:
         if not artist_name:
             return artist_name
         
+        # マッピングが未読み込みの場合のみ読み込む（更新の検知はrefresh()で行う）
+        if self._mapping_version is None:
+            self.refresh()
+        
+        sort_name = self._memo.get(artist_name)
+        if sort_name is None:
+            sort_name = self._generate_uncached(artist_name)
+            self._memo[artist_name] = sort_name
+        return sort_name
+    
+    def _generate_uncached(self, artist_name: str) -> str:
+        """
+        メモを使用せずにソート用アーティスト名を生成
+        
+        Args:
+            artist_name: 元のアーティスト名
+            
+        Returns:
+            ソート用アーティスト名
+        """
         # マッピングリポジトリが設定されている場合、まずマッピングを確認
-        if self._mapping_repository is not None:
-            mapping = self._mapping_repository.get_mapping(artist_name)
-            if mapping is not None:
-                logger.info(f"修正マッピングを適用: {artist_name} -> {mapping}")
-                return mapping
+        mapping = self._mappings.get(artist_name.strip())
+        if mapping is not None:
+            logger.debug(f"修正マッピングを適用: {artist_name} -> {mapping}")
+            return mapping
         
         # 英数字のみかチェック（スペース、ハイフン、アンダースコアなども許可）
         if self._is_ascii_only(artist_name):
             return artist_name
         
-        # 日本語が含まれる場合は読み仮名に変換
-        return self._convert_to_hiragana(artist_name)
+        # 日本語が含まれる場合は読み仮名に変換（永続キャッシュを優先）
+        reading = self._readings.get(artist_name)
+        if reading is None:
+            reading = self._convert_to_hiragana(artist_name)
+        self._used_readings.add(artist_name)
+        return reading
+    
+    def refresh(self) -> None:
+        """
+        修正マッピングファイルのフィンガープリントが変わった場合にマッピングを再読み込み
+        
+        generate()は呼び出しごとにファイルを確認しないため、曲リストの生成処理の
+        開始時など、一連の生成の前に呼び出す。フィンガープリントが変わった場合のみ
+        マッピングを読み込み直し、メモを破棄する。
+        """
+        if self._mapping_repository is None:
+            version = ""
+        else:
+            version = FileFingerprint.from_path(
+                str(self._mapping_repository.file_path)
+            ).to_key()
+        
+        if version == self._mapping_version:
+            return
+        
+        self._mappings = (
+            self._mapping_repository.get_all_mappings()
+            if self._mapping_repository is not None else {}
+        )
+        self._memo.clear()
+        self._mapping_version = version
     
     def _is_ascii_only(self, text: str) -> bool:
         """
@@ -119,7 +243,90 @@ class ArtistSortGenerator:
             result = self._kakasi.convert(text)
             # 各要素のhiraフィールドを結合
             hiragana = ''.join([item['hira'] for item in result])
-            return hiragana
         except Exception as e:
             logger.warning(f"読み仮名の生成に失敗しました（元の名前を使用）: {text}, エラー: {e}")
             return text
+        
+        # 変換に成功した読み仮名のみ永続キャッシュの対象とする
+        self._readings[text] = hiragana
+        self._readings_dirty = True
+        return hiragana
+    
+    def _load_cache(self) -> None:
+        """
+        読み仮名の永続キャッシュファイルを読み込む
+        
+        ファイルが存在しない、形式が不正、またはpykakasiのバージョンが
+        一致しない場合は空のキャッシュから開始する。
+        """
+        try:
+            with open(self._cache_file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"読み仮名キャッシュの読み込みに失敗しました（再生成します）: {e}")
+            return
+        
+        if not isinstance(data, dict) or data.get("cache_key") != self._cache_key \
+                or not isinstance(data.get("readings"), dict):
+            logger.info("読み仮名キャッシュのバージョンが一致しないため、再生成します")
+            return
+        
+        # 文字列以外の読み仮名は破棄し、次回の保存で取り除く
+        self._readings = {
+            artist: reading for artist, reading in data["readings"].items()
+            if isinstance(reading, str)
+        }
+        if len(self._readings) != len(data["readings"]):
+            logger.warning("読み仮名キャッシュに不正な値が含まれていたため、該当する項目を破棄しました")
+            self._readings_dirty = True
+        logger.debug(f"読み仮名キャッシュを読み込みました: {len(self._readings)}件")
+    
+    def save_cache(self, prune: bool = False) -> None:
+        """
+        読み仮名を永続キャッシュファイルに保存
+        
+        キャッシュファイルが指定されていない場合、または新しい読み仮名が
+        ない場合は何もしない。書き込みに失敗しても例外は送出しない。
+        
+        Args:
+            prune: 今回使用しなかった読み仮名を取り除くかどうか。
+                全てのアーティストを生成した場合（全件生成）のみTrueにする
+        """
+        if self._cache_file_path is None:
+            return
+        
+        if prune:
+            unused = set(self._readings) - self._used_readings
+            for artist in unused:
+                del self._readings[artist]
+            if unused:
+                logger.debug(f"使用されなかった読み仮名をキャッシュから取り除きました: {len(unused)}件")
+                self._readings_dirty = True
+        
+        if not self._readings_dirty:
+            return
+        
+        directory = os.path.dirname(os.path.abspath(self._cache_file_path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # 書き込み途中のファイルが読まれないよう、一時ファイルから置き換える
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        {"cache_key": self._cache_key, "readings": self._readings},
+                        f, ensure_ascii=False, sort_keys=True
+                    )
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, self._cache_file_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"読み仮名キャッシュの保存に失敗しました: {e}")
+            return
+        
+        self._readings_dirty = False
+        logger.debug(f"読み仮名キャッシュを保存しました: {len(self._readings)}件")
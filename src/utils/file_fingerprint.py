@@ -0,0 +1,155 @@
+"""
+ファイルフィンガープリントのユーティリティモジュール
+
+データファイルの更新検知に使用するフィンガープリント（パス、更新時刻、サイズ、
+任意でコンテンツハッシュ）を計算する機能を提供します。
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# コンテンツハッシュ計算時の読み込みチャンクサイズ
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# パスごとのコンテンツハッシュのメモ（パス -> (statのキー, ハッシュ)）
+# Streamlitの再実行ごとにファイル全体を読み直さないよう、
+# ファイルのstatが変わった場合のみハッシュを再計算する
+_content_hash_memo: Dict[str, Tuple[Tuple[int, int, int, int], str]] = {}
+
+
+def _compute_content_hash(path: str) -> str:
+    """
+    ファイルのコンテンツのSHA-256ハッシュを計算する
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        str: 16進数のハッシュ文字列
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _get_content_hash(path: str, stat: os.stat_result) -> str:
+    """
+    ファイルのコンテンツハッシュをメモを使用して取得する
+
+    inode、サイズ、更新時刻、状態変更時刻（ctime）のいずれかが変わった場合のみ
+    再計算します。ctimeは書き込みやos.utimeによる更新時刻の変更でも更新されるため、
+    同じサイズ・更新時刻のまま内容が書き換えられた場合も検知できます。
+
+    Args:
+        path: ファイルパス
+        stat: ファイルのstat結果
+
+    Returns:
+        str: 16進数のハッシュ文字列
+    """
+    stat_key = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+    memo = _content_hash_memo.get(path)
+    if memo is not None and memo[0] == stat_key:
+        return memo[1]
+
+    content_hash = _compute_content_hash(path)
+    _content_hash_memo[path] = (stat_key, content_hash)
+    return content_hash
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """
+    ファイルフィンガープリント
+
+    ファイルの内容が変わったかどうかを安価に判定するための値オブジェクトです。
+    ファイルが存在しない場合、mtime_nsとsizeは-1になります。
+
+    Attributes:
+        path (str): ファイルパス
+        mtime_ns (int): 最終更新時刻（ナノ秒）
+        size (int): ファイルサイズ（バイト）
+        content_hash (Optional[str]): コンテンツのSHA-256ハッシュ（計算しない場合はNone）
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: Optional[str] = None
+
+    @classmethod
+    def from_path(cls, path: str, include_hash: bool = False) -> 'FileFingerprint':
+        """
+        ファイルからフィンガープリントを計算する
+
+        Args:
+            path: ファイルパス
+            include_hash: コンテンツハッシュを計算するかどうか（デフォルト: False）
+
+        Returns:
+            FileFingerprint: 計算されたフィンガープリント
+
+        Note:
+            コンテンツハッシュはファイルのstatが変わらない限りプロセス内で再利用されます
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            logger.debug(f"ファイルが存在しないためフィンガープリントを空にします: {path}")
+            return cls(path=path, mtime_ns=-1, size=-1)
+
+        content_hash = None
+        if include_hash:
+            content_hash = _get_content_hash(path, stat)
+
+        return cls(
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash
+        )
+
+    def to_key(self) -> str:
+        """
+        フィンガープリントを文字列キーに変換する
+
+        Returns:
+            str: "パス:更新時刻:サイズ[:ハッシュ]" 形式の文字列
+        """
+        key = f"{self.path}:{self.mtime_ns}:{self.size}"
+        if self.content_hash is not None:
+            key += f":{self.content_hash}"
+        return key
+
+
+def compute_data_version(paths: Sequence[str], include_hash: bool = False) -> str:
+    """
+    複数ファイルのフィンガープリントからデータバージョンを計算する
+
+    いずれかのファイルのパス、更新時刻、サイズ（またはコンテンツ）が変わると
+    異なる値になります。キャッシュキーやインデックスのバージョンとして使用します。
+
+    Args:
+        paths: 対象ファイルパスのリスト
+        include_hash: コンテンツハッシュを含めるかどうか（デフォルト: False）
+
+    Returns:
+        str: データバージョン（16文字の16進数文字列）
+
+    Examples:
+        >>> compute_data_version(["data/M_YT_LIVE.TSV", "data/M_YT_LIVE_TIMESTAMP.TSV"])
+        '3f2a...'
+    """
+    keys = [
+        FileFingerprint.from_path(path, include_hash=include_hash).to_key()
+        for path in paths
+    ]
+    return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:16]
@@ -1,11 +1,12 @@
 """
 タイムスタンプ付きURLを生成するモジュール
 """
-import re
 import logging
 from typing import Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
+from src.core.utils import convert_timestamp_to_seconds
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +45,31 @@ class URLGenerator:
             logger.warning(f"タイムスタンプのパースに失敗しました: {timestamp}")
             return base_url
         
+        return self.build_timestamped_url(base_url, seconds)
+    
+    def build_timestamped_url(self, base_url: str, seconds: Optional[int]) -> str:
+        """
+        変換済みの秒数からタイムスタンプ付きURLを生成
+        
+        タイムスタンプの解析を呼び出し側でまとめて行う場合に使用します
+        （例: convert_timestamps_to_secondsで一括変換した秒数）。
+        
+        Args:
+            base_url: ベースとなるYouTube URL
+            seconds: タイムスタンプ（秒）。Noneの場合はベースURLをそのまま返す
+            
+        Returns:
+            タイムスタンプパラメータ（&t=秒数）が付加されたURL
+            
+        Examples:
+            >>> generator = URLGenerator()
+            >>> generator.build_timestamped_url("https://youtube.com/watch?v=abc", 754)
+            'https://youtube.com/watch?v=abc&t=754'
+        """
+        if not base_url or seconds is None:
+            logger.warning(f"URLまたは秒数が空です: url={base_url}, seconds={seconds}")
+            return base_url
+        
         # URLをパース
         parsed = urlparse(base_url)
         
@@ -65,6 +91,10 @@ class URLGenerator:
         """
         タイムスタンプ文字列を秒数に変換
         
+        データ処理パイプラインと同じ規則（convert_timestamp_to_seconds）で変換します。
+        複数のタイムスタンプをまとめて変換する場合は、
+        convert_timestamps_to_secondsで一括変換してからbuild_timestamped_urlを使用してください。
+        
         Args:
             timestamp: タイムスタンプ文字列（"HH:MM:SS"、"H:MM:SS"、"MM:SS"形式）
             
@@ -83,24 +113,7 @@ class URLGenerator:
         if not timestamp:
             return None
         
-        # タイムスタンプのパターンをチェック
-        # HH:MM:SS または H:MM:SS 形式
-        pattern_hms = r'^(\d{1,2}):(\d{1,2}):(\d{1,2})$'
-        # MM:SS 形式
-        pattern_ms = r'^(\d{1,2}):(\d{1,2})$'
-        
-        match_hms = re.match(pattern_hms, timestamp)
-        if match_hms:
-            hours = int(match_hms.group(1))
-            minutes = int(match_hms.group(2))
-            seconds = int(match_hms.group(3))
-            return hours * 3600 + minutes * 60 + seconds
-        
-        match_ms = re.match(pattern_ms, timestamp)
-        if match_ms:
-            minutes = int(match_ms.group(1))
-            seconds = int(match_ms.group(2))
-            return minutes * 60 + seconds
-        
-        logger.warning(f"タイムスタンプの形式が不正です: {timestamp}")
-        return None
+        seconds = convert_timestamp_to_seconds(timestamp)
+        if seconds is None:
+            logger.warning(f"タイムスタンプの形式が不正です: {timestamp}")
+        return seconds
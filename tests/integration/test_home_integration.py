@@ -5,7 +5,7 @@ Streamlitアプリのデータ処理部分をテストします。
 """
 import pytest
 import pandas as pd
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, ANY
 import sys
 import os
 
@@ -108,6 +108,7 @@ class TestHomeIntegration:
             value='デフォルト',
             key="search_input_box",
             placeholder="ここにキーワードを入力",
+            help=ANY,
         )
         mock_checkbox.assert_called_once_with(
             "検索対象にライブ配信タイトルを含める",
@@ -158,9 +159,9 @@ class TestHomeIntegration:
 
             # 初回実行
             from src.ui.pages.home_page import load_and_process_data
-            result1 = load_and_process_data('lives.tsv', 'songs.tsv', True)
+            result1 = load_and_process_data('lives.tsv', 'songs.tsv', True, 'v1')
             assert result1 is not None
 
             # 同じパラメータで2回目実行（キャッシュから）
-            result2 = load_and_process_data('lives.tsv', 'songs.tsv', True)
+            result2 = load_and_process_data('lives.tsv', 'songs.tsv', True, 'v1')
             assert result2 is not None
\ No newline at end of file
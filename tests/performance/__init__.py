@@ -0,0 +1,5 @@
+"""
+パフォーマンステストパッケージ
+
+処理速度のベンチマークと、高速化前後の出力一致を検証するテストを含みます。
+"""
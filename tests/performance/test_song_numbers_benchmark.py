@@ -0,0 +1,132 @@
+"""
+曲目番号生成のベンチマーク
+
+ベクトル化したgenerate_song_numbersが、行ごとのapplyを使用していた
+従来実装と同一の出力を返すことを検証します。
+
+処理時間の比較は実行環境の負荷に左右されるため、環境変数
+SHINOUTA_RUN_BENCHMARKS=1 を指定した場合のみ実行します。
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.utils import generate_song_numbers
+
+
+def legacy_generate_song_numbers(df: pd.DataFrame) -> pd.DataFrame:
+    """従来実装（groupby.apply + merge + 行ごとのapply）の参照用コピー"""
+    df_result = df.copy()
+    df_result["曲順"] = df_result.groupby("LIVE_ID").cumcount() + 1
+
+    def assign_live_number_per_date(group_df):
+        factor_codes, _ = pd.factorize(group_df["LIVE_ID"])
+        group_df["ライブ番号"] = factor_codes + 1
+        return group_df[["LIVE_ID", "ライブ番号"]]
+
+    temp_live_numbers = (
+        df_result[["ライブ配信日_sortable", "LIVE_ID"]].drop_duplicates().copy()
+    )
+    temp_live_numbers = temp_live_numbers.sort_values(
+        by=["ライブ配信日_sortable", "LIVE_ID"]
+    )
+    temp_live_numbers = temp_live_numbers.groupby(
+        "ライブ配信日_sortable", group_keys=False
+    ).apply(assign_live_number_per_date, include_groups=False)
+
+    df_result = pd.merge(
+        df_result,
+        temp_live_numbers[["LIVE_ID", "ライブ番号"]],
+        on=["LIVE_ID"],
+        how="left",
+        suffixes=("", "_new"),
+    )
+    if "ライブ番号_new" in df_result.columns:
+        df_result["ライブ番号"] = df_result["ライブ番号_new"]
+        df_result = df_result.drop(columns=["ライブ番号_new"])
+
+    live_counts_per_date = df_result.groupby("ライブ配信日_sortable")[
+        "LIVE_ID"
+    ].transform("nunique")
+    df_result["曲目"] = df_result.apply(
+        lambda row: (
+            f"{row['ライブ番号']}-{row['曲順']}曲目"
+            if live_counts_per_date.loc[row.name] > 1
+            else f"{row['曲順']}曲目"
+        ),
+        axis=1,
+    )
+    return df_result
+
+
+def create_sorted_song_frame(num_lives: int, seed: int = 0) -> pd.DataFrame:
+    """パイプラインのソート後と同じ並びの合成データを生成する"""
+    rng = np.random.default_rng(seed)
+    live_ids = np.arange(1, num_lives + 1)
+    # 約3割の配信が他の配信と同じ日になるように日付を割り当てる
+    day_offsets = np.cumsum(rng.random(num_lives) > 0.3)
+    live_dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(day_offsets, unit="D")
+    songs_per_live = rng.integers(1, 20, size=num_lives)
+
+    df = pd.DataFrame({
+        "LIVE_ID": np.repeat(live_ids, songs_per_live),
+        "ライブ配信日_sortable": np.repeat(live_dates, songs_per_live),
+    })
+    df["タイムスタンプ_秒"] = df.groupby("LIVE_ID").cumcount() * 240
+    return df.sort_values(
+        by=["ライブ配信日_sortable", "LIVE_ID", "タイムスタンプ_秒"],
+        ascending=[False, True, True],
+    ).reset_index(drop=True)
+
+
+def best_of(func, df: pd.DataFrame, repeat: int = 3) -> float:
+    """複数回実行した最短時間（秒）を返す"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestGenerateSongNumbersBenchmark:
+    """generate_song_numbersの出力一致とベンチマーク"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_output_identical_to_legacy(self, seed):
+        """従来実装と値・型・インデックスが一致することを確認"""
+        df = create_sorted_song_frame(num_lives=200, seed=seed)
+
+        expected = legacy_generate_song_numbers(df)
+        actual = generate_song_numbers(df)
+
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_output_identical_with_non_range_index(self):
+        """入力のインデックスが連番でない場合も従来実装と一致することを確認"""
+        df = create_sorted_song_frame(num_lives=50)
+        df.index = df.index * 3 + 7
+
+        pd.testing.assert_frame_equal(
+            generate_song_numbers(df), legacy_generate_song_numbers(df)
+        )
+
+    @pytest.mark.skipif(
+        os.getenv("SHINOUTA_RUN_BENCHMARKS") != "1",
+        reason="処理時間の計測はSHINOUTA_RUN_BENCHMARKS=1の場合のみ実行"
+    )
+    def test_vectorized_is_faster(self):
+        """ベクトル化実装が従来実装より高速であることを確認"""
+        df = create_sorted_song_frame(num_lives=1500)
+
+        legacy_time = best_of(legacy_generate_song_numbers, df)
+        vectorized_time = best_of(generate_song_numbers, df)
+
+        assert vectorized_time * 3 < legacy_time, (
+            f"曲目番号生成 {len(df)}行: 従来 {legacy_time * 1000:.1f}ms, "
+            f"ベクトル化 {vectorized_time * 1000:.1f}ms"
+        )
@@ -1,10 +1,12 @@
 """
 ArtistSortGeneratorのユニットテスト
 """
+import json
 import pytest
 import tempfile
 import os
-from src.utils.artist_sort_generator import ArtistSortGenerator
+from unittest.mock import patch
+from src.utils.artist_sort_generator import ArtistSortGenerator, pykakasi
 from src.repositories.artist_sort_mapping_repository import ArtistSortMappingRepository
 
 
@@ -124,3 +126,154 @@ class TestArtistSortGeneratorWithMapping:
         # マッピングが適用される
         result_after = generator.generate("米津玄師")
         assert result_after == "よねづけんし"
+
+
+class TestArtistSortGeneratorCache:
+    """ArtistSortGeneratorのメモ化と永続キャッシュのテストクラス"""
+    
+    @pytest.fixture
+    def mapping_file(self, tmp_path):
+        """テスト用のマッピングファイル"""
+        path = tmp_path / "ARTIST_SORT_MAPPING.TSV"
+        path.write_text("アーティスト名\tソート名\n米津玄師\tよねづけんし\n", encoding="utf-8")
+        return path
+    
+    @pytest.fixture
+    def cache_key(self):
+        """現在の環境での読み仮名キャッシュのキー"""
+        return ArtistSortGenerator()._cache_key
+    
+    def test_mapping_file_read_once(self, mapping_file):
+        """マッピングファイルは更新されない限り再読み込みされない"""
+        repository = ArtistSortMappingRepository(str(mapping_file))
+        generator = ArtistSortGenerator(mapping_repository=repository)
+        
+        with patch.object(repository, "get_all_mappings", wraps=repository.get_all_mappings) as mock_get:
+            for _ in range(3):
+                assert generator.generate("米津玄師") == "よねづけんし"
+                assert generator.generate("Vaundy") == "Vaundy"
+        
+        assert mock_get.call_count == 1
+    
+    def test_mapping_update_invalidates_memo(self, mapping_file):
+        """リポジトリでマッピングを変更した場合は該当アーティストのメモが破棄される"""
+        repository = ArtistSortMappingRepository(str(mapping_file))
+        generator = ArtistSortGenerator(mapping_repository=repository)
+        assert generator.generate("Vaundy") == "Vaundy"
+        assert generator.generate(" Vaundy ") == " Vaundy "
+        assert generator.generate("米津玄師") == "よねづけんし"
+        
+        # refresh()を呼ばなくても変更後の内容を返す
+        repository.save_mapping("Vaundy", "ばうんでぃ")
+        assert generator.generate("Vaundy") == "ばうんでぃ"
+        assert generator.generate(" Vaundy ") == "ばうんでぃ"
+        
+        assert repository.delete_mapping("米津玄師")
+        assert generator.generate("米津玄師") != "よねづけんし"
+    
+    def test_mapping_file_update_invalidates_memo_on_refresh(self, mapping_file):
+        """リポジトリを経由せずにファイルが更新された場合はrefresh()でメモが破棄される"""
+        repository = ArtistSortMappingRepository(str(mapping_file))
+        generator = ArtistSortGenerator(mapping_repository=repository)
+        assert generator.generate("Vaundy") == "Vaundy"
+        
+        ArtistSortMappingRepository(str(mapping_file)).save_mapping("Vaundy", "ばうんでぃ")
+        generator.refresh()
+        
+        assert generator.generate("Vaundy") == "ばうんでぃ"
+    
+    def test_set_mapping_repository_replaces_listener(self, mapping_file, tmp_path):
+        """リポジトリを差し替えた場合は古いリポジトリの変更を通知されない"""
+        old_repository = ArtistSortMappingRepository(str(mapping_file))
+        generator = ArtistSortGenerator(mapping_repository=old_repository)
+        new_repository = ArtistSortMappingRepository(str(tmp_path / "NEW_MAPPING.TSV"))
+        generator.set_mapping_repository(new_repository)
+        assert generator.generate("Vaundy") == "Vaundy"
+        
+        old_repository.save_mapping("Vaundy", "ばうんでぃ")
+        
+        assert generator.generate("Vaundy") == "Vaundy"
+    
+    def test_generate_does_not_stat_mapping_file(self, mapping_file):
+        """generate()ではマッピングファイルのフィンガープリントを確認しない"""
+        repository = ArtistSortMappingRepository(str(mapping_file))
+        generator = ArtistSortGenerator(mapping_repository=repository)
+        generator.refresh()
+        
+        with patch("src.utils.artist_sort_generator.FileFingerprint.from_path") as mock_from_path:
+            for _ in range(3):
+                generator.generate("米津玄師")
+                generator.generate("Vaundy")
+        
+        mock_from_path.assert_not_called()
+    
+    def test_conversion_memoized(self):
+        """同じアーティスト名の読み仮名変換は一度だけ行われる"""
+        generator = ArtistSortGenerator()
+        
+        with patch.object(generator, "_convert_to_hiragana", return_value="よるしか") as mock_convert:
+            assert generator.generate("ヨルシカ") == "よるしか"
+            assert generator.generate("ヨルシカ") == "よるしか"
+        
+        mock_convert.assert_called_once_with("ヨルシカ")
+    
+    @pytest.mark.skipif(pykakasi is None, reason="pykakasiが利用できない環境")
+    def test_persistent_cache_reused(self, tmp_path):
+        """保存した読み仮名は次回以降に変換せずに再利用される"""
+        cache_file = tmp_path / "cache" / "readings.json"
+        generator = ArtistSortGenerator(cache_file_path=str(cache_file))
+        expected = generator.generate("米津玄師")
+        generator.save_cache()
+        
+        reloaded = ArtistSortGenerator(cache_file_path=str(cache_file))
+        with patch.object(reloaded._kakasi, "convert") as mock_convert:
+            assert reloaded.generate("米津玄師") == expected
+        
+        mock_convert.assert_not_called()
+    
+    def test_persistent_cache_version_mismatch(self, tmp_path, cache_key):
+        """pykakasiのバージョンが異なるキャッシュや不正なファイルは使用されない"""
+        cache_file = tmp_path / "readings.json"
+        cache_file.write_text(
+            json.dumps({"cache_key": "0:pykakasi=0.0", "readings": {"米津玄師": "古い読み"}}),
+            encoding="utf-8"
+        )
+        assert ArtistSortGenerator(cache_file_path=str(cache_file)).generate("米津玄師") != "古い読み"
+        
+        cache_file.write_text(
+            json.dumps({"cache_key": cache_key, "readings": {"米津玄師": 1, "ヨルシカ": "よるしか"}}),
+            encoding="utf-8"
+        )
+        generator = ArtistSortGenerator(cache_file_path=str(cache_file))
+        # 文字列以外の値は使用しない
+        assert generator._readings == {"ヨルシカ": "よるしか"}
+        
+        cache_file.write_text("{壊れたJSON", encoding="utf-8")
+        generator = ArtistSortGenerator(cache_file_path=str(cache_file))
+        assert generator.generate("Vaundy") == "Vaundy"
+    
+    def test_save_cache_prune(self, tmp_path, cache_key):
+        """prune=Trueの場合は今回使用しなかった読み仮名を取り除く"""
+        cache_file = tmp_path / "readings.json"
+        cache_file.write_text(
+            json.dumps({
+                "cache_key": cache_key,
+                "readings": {"ヨルシカ": "よるしか", "削除された歌手": "さくじょされたかしゅ"},
+            }),
+            encoding="utf-8"
+        )
+        generator = ArtistSortGenerator(cache_file_path=str(cache_file))
+        generator.generate("ヨルシカ")
+        
+        generator.save_cache()
+        assert "削除された歌手" in json.loads(cache_file.read_text(encoding="utf-8"))["readings"]
+        
+        generator.save_cache(prune=True)
+        assert json.loads(cache_file.read_text(encoding="utf-8"))["readings"] == {"ヨルシカ": "よるしか"}
+    
+    def test_save_cache_without_path(self):
+        """キャッシュファイルが指定されていない場合は保存しない"""
+        generator = ArtistSortGenerator()
+        generator.generate("ヨルシカ")
+        
+        generator.save_cache()  # 例外が発生しないこと
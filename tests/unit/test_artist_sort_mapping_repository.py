@@ -313,3 +313,36 @@ class TestArtistSortMappingRepository:
                 mappings = repo.get_all_mappings()
                 assert mappings == {}
 
+
+    def test_listeners_notified_on_change(self):
+        """マッピングの保存・削除がリスナーに通知されるテスト"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "test_mapping.tsv"
+            repo = ArtistSortMappingRepository(str(file_path))
+            changes = []
+            repo.add_listener(lambda artist, sort_name: changes.append((artist, sort_name)))
+            
+            repo.save_mapping(' Vaundy ', ' ばうんでぃ ')
+            repo.delete_mapping('Vaundy')
+            # 該当するマッピングがない場合は通知しない
+            repo.delete_mapping('Nonexistent')
+            
+            assert changes == [('Vaundy', 'ばうんでぃ'), ('Vaundy', None)]
+
+    def test_listeners_not_notified_on_write_error(self):
+        """書き込みに失敗した場合はリスナーに通知されないテスト"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "test_mapping.tsv"
+            repo = ArtistSortMappingRepository(str(file_path))
+            changes = []
+            listener = lambda artist, sort_name: changes.append((artist, sort_name))
+            repo.add_listener(listener)
+            
+            with patch.object(ArtistSortMappingRepository, '_write_mappings', side_effect=OSError("Disk Error")):
+                with pytest.raises(IOError):
+                    repo.save_mapping('Vaundy', 'ばうんでぃ')
+            
+            repo.remove_listener(listener)
+            repo.save_mapping('Vaundy', 'ばうんでぃ')
+            
+            assert changes == []
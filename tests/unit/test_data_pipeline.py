@@ -107,8 +107,21 @@ class TestDataPipelineExecution:
         assert "YouTubeタイムスタンプ付きURL" in result.columns
         assert "ライブ配信日_sortable" in result.columns
         
-        # タイムスタンプが秒数に変換されている
-        assert result["タイムスタンプ_秒"].dtype in [int, float]
+        # 正規化済み検索キー列が生成されている
+        for field in ["曲名", "ライブタイトル"]:
+            assert f"{field}_検索キー" in result.columns
+        assert (result["曲名_検索キー"] == result["曲名"].str.casefold()).any()
+        
+        # タイムスタンプが秒数（nullable整数型）に変換されている
+        assert result["タイムスタンプ_秒"].dtype == "Int64"
+        
+        # 繰り返しの多い列はカテゴリ型に変換され、値は変わらない
+        for field in ["曲名", "ライブタイトル", "元ライブURL", "曲名_検索キー"]:
+            assert isinstance(result[field].dtype, pd.CategoricalDtype)
+        assert sorted(result["ライブタイトル"].astype(object).dropna().unique()) == sorted(
+            merged_df["ライブタイトル"].dropna().unique()
+        )
+        assert len(result["ライブタイトル"].cat.categories) < len(result)
     
     def test_execute_sort_processing(self):
         """ソート処理が正しく行われることをテスト"""
@@ -378,9 +391,10 @@ class TestDataPipelineErrorHandling:
         pipeline = DataPipeline(data_service, config)
         result = pipeline.execute()
         
-        # 検証：空のDataFrameの場合、generate_song_numbersでエラーが発生してNoneが返される
-        # これは期待される動作
-        assert result is None
+        # 検証：空のDataFrameの場合も、曲目番号の列を持つ空のDataFrameが返される
+        assert result is not None
+        assert len(result) == 0
+        assert "曲目" in result.columns
     
     def test_validate_step_result_empty_dataframe(self):
         """_validate_step_resultが空のDataFrameを処理することをテスト"""
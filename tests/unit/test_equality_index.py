@@ -0,0 +1,75 @@
+"""
+完全一致インデックスのテスト
+
+src/core/equality_index.pyのEqualityIndexクラスが正しく動作することを確認するテストです。
+"""
+
+import pandas as pd
+import pytest
+
+from src.core.equality_index import EqualityIndex
+
+
+class TestEqualityIndex:
+    """EqualityIndexクラスのテスト"""
+
+    @pytest.fixture
+    def sample_df(self):
+        """アーティスト・LIVE_ID・曲名を持つDataFrame"""
+        return pd.DataFrame({
+            "LIVE_ID": [2, 2, 2, 1, 1],
+            "曲名": ["Lemon", "紅蓮華", "炎", "Lemon", None],
+            "アーティスト": ["米津玄師", "LiSA", "LiSA", "米津玄師", "LiSA"],
+        })
+
+    def test_get_positions(self, sample_df):
+        """値が一致する行位置が昇順で返されることを確認"""
+        index = EqualityIndex(sample_df)
+
+        positions = index.get_positions("アーティスト", "LiSA")
+
+        assert positions.dtype.name == "int32"
+        assert positions.tolist() == [1, 2, 4]
+        assert index.get_positions("LIVE_ID", 1).tolist() == [3, 4]
+        assert index.count("曲名", "Lemon") == 2
+
+    def test_missing_values_not_indexed(self, sample_df):
+        """欠損値や存在しない値はどの行にも一致しないことを確認"""
+        index = EqualityIndex(sample_df)
+
+        assert index.get_positions("曲名", None).tolist() == []
+        assert index.get_positions("曲名", "存在しない曲").tolist() == []
+        # ハッシュ化できない値も例外にならない
+        assert index.get_positions("曲名", ["Lemon"]).tolist() == []
+
+    def test_categorical_column(self, sample_df):
+        """カテゴリ型の列もインデックス化できることを確認"""
+        df = sample_df.astype({"アーティスト": "category"})
+        index = EqualityIndex(df)
+
+        assert index.get_positions("アーティスト", "米津玄師").tolist() == [0, 3]
+
+    def test_unknown_field(self, sample_df):
+        """存在しないフィールドはスキップされ、参照するとKeyErrorになることを確認"""
+        index = EqualityIndex(sample_df, ["アーティスト", "存在しない列"])
+
+        assert index.fields == ["アーティスト"]
+        assert not index.has_field("存在しない列")
+        with pytest.raises(KeyError):
+            index.get_positions("存在しない列", "値")
+
+    def test_intersect(self, sample_df):
+        """全ての条件に一致する行位置が返されることを確認"""
+        index = EqualityIndex(sample_df)
+
+        assert index.intersect({"アーティスト": "LiSA", "LIVE_ID": 2}).tolist() == [1, 2]
+        assert index.intersect({"曲名": "Lemon", "LIVE_ID": 1}).tolist() == [3]
+        assert index.intersect({"曲名": "紅蓮華", "LIVE_ID": 1}).tolist() == []
+        assert index.intersect({}) is None
+
+    def test_is_compatible(self, sample_df):
+        """行数が一致する場合のみ使用可能と判定されることを確認"""
+        index = EqualityIndex(sample_df)
+
+        assert index.is_compatible(sample_df)
+        assert not index.is_compatible(sample_df.head(2))
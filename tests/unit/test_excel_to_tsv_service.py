@@ -466,3 +466,73 @@ class TestExcelToTsvServiceSongListGenerator:
             
             # 結果を検証（失敗するがエラーは発生しない）
             assert result is False
+
+
+class TestExcelToTsvServiceProcessedData:
+    """処理済みデータ生成のテスト"""
+    
+    def test_build_processed_data_success(self):
+        """処理済みデータが生成され、元データのバージョンで読み込めること"""
+        pytest.importorskip("pyarrow")
+        from src.repositories.processed_data_repository import (
+            ProcessedDataRepository,
+            compute_source_version,
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            live_file = tmpdir_path / "M_YT_LIVE.TSV"
+            timestamp_file = tmpdir_path / "M_YT_LIVE_TIMESTAMP.TSV"
+            output_file = tmpdir_path / "M_YT_LIVE_PROCESSED.arrow"
+            
+            live_file.write_text(
+                "ID\t配信日\tタイトル\tURL\n"
+                "1\t2024/1/1\tテスト配信\thttps://www.youtube.com/watch?v=abc\n",
+                encoding='utf-8'
+            )
+            timestamp_file.write_text(
+                "ID\tLIVE_ID\tタイムスタンプ\t曲名\tアーティスト\n"
+                "1\t1\t0:01:30\tテスト曲\tテストアーティスト\n",
+                encoding='utf-8'
+            )
+            
+            excel_repo = ExcelRepository(str(tmpdir_path / "test.xlsx"))
+            tsv_repo = TsvRepository(str(tmpdir_path))
+            backup_repo = BackupRepository(str(tmpdir_path / "backups"))
+            service = ExcelToTsvService(excel_repo, tsv_repo, backup_repo)
+            
+            result = service.build_processed_data(
+                str(live_file),
+                str(timestamp_file),
+                str(output_file)
+            )
+            
+            assert result is True
+            df = ProcessedDataRepository(str(output_file)).load(
+                compute_source_version([str(live_file), str(timestamp_file)])
+            )
+            assert df is not None
+            assert df.iloc[0]["曲目"] == "1曲目"
+            assert df.iloc[0]["YouTubeタイムスタンプ付きURL"].endswith("t=90s")
+            assert "曲名_検索キー" in df.columns
+    
+    def test_build_processed_data_missing_files(self):
+        """存在しないファイルでは失敗するが例外は発生しないこと"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            output_file = tmpdir_path / "M_YT_LIVE_PROCESSED.arrow"
+            
+            excel_repo = ExcelRepository(str(tmpdir_path / "test.xlsx"))
+            tsv_repo = TsvRepository(str(tmpdir_path))
+            backup_repo = BackupRepository(str(tmpdir_path / "backups"))
+            service = ExcelToTsvService(excel_repo, tsv_repo, backup_repo)
+            
+            result = service.build_processed_data(
+                str(tmpdir_path / "nonexistent_live.tsv"),
+                str(tmpdir_path / "nonexistent_timestamp.tsv"),
+                str(output_file)
+            )
+            
+            assert result is False
+            assert not output_file.exists()
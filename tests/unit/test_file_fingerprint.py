@@ -0,0 +1,100 @@
+"""
+FileFingerprintのユニットテスト
+"""
+import os
+import pytest
+from unittest.mock import patch
+from src.utils import file_fingerprint
+from src.utils.file_fingerprint import FileFingerprint, compute_data_version
+
+
+class TestFileFingerprint:
+    """FileFingerprintのテストクラス"""
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        """テスト用のデータファイル"""
+        path = tmp_path / "data.tsv"
+        path.write_text("ID\tタイトル\n1\tライブ1\n", encoding="utf-8")
+        return path
+
+    def test_from_path(self, data_file):
+        """ファイルの更新時刻とサイズが取得できることを確認"""
+        fingerprint = FileFingerprint.from_path(str(data_file))
+
+        stat = os.stat(data_file)
+        assert fingerprint.path == str(data_file)
+        assert fingerprint.mtime_ns == stat.st_mtime_ns
+        assert fingerprint.size == stat.st_size
+        assert fingerprint.content_hash is None
+
+    def test_from_path_with_hash(self, data_file):
+        """コンテンツハッシュを計算できることを確認"""
+        fingerprint = FileFingerprint.from_path(str(data_file), include_hash=True)
+
+        assert fingerprint.content_hash is not None
+        assert len(fingerprint.content_hash) == 64
+        assert fingerprint.content_hash in fingerprint.to_key()
+
+    def test_hash_reused_while_file_unchanged(self, data_file):
+        """ファイルが変わらない限りコンテンツハッシュを再計算しないことを確認"""
+        with patch.object(
+            file_fingerprint, "_compute_content_hash",
+            wraps=file_fingerprint._compute_content_hash
+        ) as mock_hash:
+            first = FileFingerprint.from_path(str(data_file), include_hash=True)
+            second = FileFingerprint.from_path(str(data_file), include_hash=True)
+            assert mock_hash.call_count == 1
+
+            data_file.write_text("ID\tタイトル\n2\tライブ2\n", encoding="utf-8")
+            third = FileFingerprint.from_path(str(data_file), include_hash=True)
+
+        assert first == second
+        assert mock_hash.call_count == 2
+        assert third.content_hash != first.content_hash
+
+    def test_from_path_missing_file(self, tmp_path):
+        """存在しないファイルは-1になることを確認"""
+        fingerprint = FileFingerprint.from_path(str(tmp_path / "missing.tsv"))
+
+        assert fingerprint.mtime_ns == -1
+        assert fingerprint.size == -1
+
+    def test_equal_for_unchanged_file(self, data_file):
+        """変更されていないファイルのフィンガープリントは等しい"""
+        assert FileFingerprint.from_path(str(data_file)) == FileFingerprint.from_path(str(data_file))
+
+
+class TestComputeDataVersion:
+    """compute_data_versionのテストクラス"""
+
+    def test_changes_when_size_changes(self, tmp_path):
+        """ファイルサイズが変わるとバージョンが変わる"""
+        path = tmp_path / "data.tsv"
+        path.write_text("a", encoding="utf-8")
+        version1 = compute_data_version([str(path)])
+
+        path.write_text("ab", encoding="utf-8")
+        assert compute_data_version([str(path)]) != version1
+
+    def test_changes_when_content_changes_with_hash(self, tmp_path):
+        """同じサイズ・更新時刻でも内容が変わればハッシュ付きのバージョンは変わる"""
+        path = tmp_path / "data.tsv"
+        path.write_text("a", encoding="utf-8")
+        stat = os.stat(path)
+        version1 = compute_data_version([str(path)], include_hash=True)
+
+        path.write_text("b", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert compute_data_version([str(path)]) == compute_data_version([str(path)])
+        assert compute_data_version([str(path)], include_hash=True) != version1
+
+    def test_depends_on_paths(self, tmp_path):
+        """対象ファイルの組み合わせが変わるとバージョンが変わる"""
+        path1 = tmp_path / "a.tsv"
+        path2 = tmp_path / "b.tsv"
+        path1.write_text("a", encoding="utf-8")
+        path2.write_text("a", encoding="utf-8")
+
+        assert compute_data_version([str(path1)]) != compute_data_version([str(path2)])
+        assert len(compute_data_version([str(path1), str(path2)])) == 16
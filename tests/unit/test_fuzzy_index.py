@@ -0,0 +1,96 @@
+"""
+あいまい検索インデックスのテスト
+
+src/core/fuzzy_index.pyのFuzzyIndexクラスが正しく動作することを確認するテストです。
+"""
+
+import pandas as pd
+import pytest
+
+from src.core import fuzzy_index as fuzzy_index_module
+from src.core.fuzzy_index import FuzzyIndex, default_max_distance
+
+
+class TestFuzzyIndex:
+    """FuzzyIndexクラスのテスト"""
+
+    @pytest.fixture
+    def sample_df(self):
+        """テスト用のDataFrame（重複・欠損値を含む）"""
+        return pd.DataFrame({
+            "曲名": ["Lemon", "残響散歌", "Lemon", "ロキ", None, "夜に駆ける"],
+            "アーティスト": ["米津玄師", "Aimer", "米津玄師", "みきとP", "YOASOBI", "YOASOBI"],
+        })
+
+    @pytest.fixture
+    def index(self, sample_df):
+        """曲名とアーティストのインデックス"""
+        return FuzzyIndex(sample_df, ["曲名", "アーティスト"], version="v1")
+
+    def test_suggest_typo(self, index):
+        """1文字違いのクエリから候補が返されることを確認"""
+        suggestions = index.suggest("yoasobl")
+
+        assert len(suggestions) == 1
+        assert suggestions[0].text == "YOASOBI"
+        assert suggestions[0].field == "アーティスト"
+        assert suggestions[0].distance == 1
+        assert suggestions[0].row_count == 2
+
+    def test_suggest_normalizes_query(self, index):
+        """クエリが正規化されてから比較されることを確認"""
+        # カタカナ・全角英字のクエリもひらがな・小文字に正規化される
+        assert [match.text for match in index.suggest("ミキトＱ")] == ["みきとP"]
+        assert [match.text for match in index.suggest("ＬＥＭＯＭ")] == ["Lemon"]
+
+    def test_suggest_excludes_exact_and_distant(self, index):
+        """完全一致と距離の遠い値は候補に含まれないことを確認"""
+        assert index.suggest("lemon") == []
+        assert index.suggest("abcdefg") == []
+
+    def test_suggest_short_query(self, index):
+        """短すぎるクエリでは候補を返さないことを確認"""
+        assert index.suggest("ロ") == []
+        assert index.suggest("") == []
+
+    def test_suggest_restricted_fields_and_limit(self, index):
+        """対象フィールドと最大件数が反映されることを確認"""
+        assert index.suggest("yoasobl", fields=["曲名"]) == []
+        assert index.suggest("Aimar", fields=["アーティスト", "存在しない"])[0].text == "Aimer"
+        assert len(index.suggest("Lemom", limit=0)) == 0
+
+    def test_suggest_ordered_by_distance(self):
+        """距離の近い順に並ぶことを確認"""
+        df = pd.DataFrame({"曲名": ["abcdef", "abcxef", "abxxef"]})
+        index = FuzzyIndex(df, ["曲名"])
+
+        suggestions = index.suggest("abcdeg", max_distance=2)
+
+        assert [match.text for match in suggestions] == ["abcdef", "abcxef"]
+
+    def test_get_positions(self, index):
+        """候補の値を持つ行位置が返されることを確認"""
+        positions = index.get_positions(index.suggest("Lemom") + index.suggest("yoasobl"))
+
+        assert positions.dtype.name == "int32"
+        assert positions.tolist() == [0, 2, 4, 5]
+        assert index.get_positions([]).tolist() == []
+
+    def test_missing_field_is_skipped(self, sample_df):
+        """存在しないフィールドはスキップされることを確認"""
+        index = FuzzyIndex(sample_df, ["曲名", "存在しない"])
+
+        assert index.fields == ["曲名"]
+
+    def test_without_levenshtein(self, index, monkeypatch):
+        """python-Levenshteinがない場合は空のリストを返すことを確認"""
+        monkeypatch.setattr(fuzzy_index_module, "Levenshtein", None)
+
+        assert index.suggest("Lemom") == []
+
+    def test_default_max_distance(self):
+        """クエリの長さに応じて許容距離が増えることを確認"""
+        assert default_max_distance(2) == 0
+        assert default_max_distance(4) == 1
+        assert default_max_distance(8) == 2
+        assert default_max_distance(20) == 3
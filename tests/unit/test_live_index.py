@@ -0,0 +1,116 @@
+"""
+ライブインデックスのテスト
+
+src/core/live_index.pyのLiveIndexクラスが正しく動作することを確認するテストです。
+"""
+
+import pandas as pd
+import pytest
+
+from src.core.live_index import LiveIndex
+from src.core.utils import build_search_keys, get_search_key_column
+
+
+class TestLiveIndex:
+    """LiveIndexクラスのテスト"""
+
+    @pytest.fixture
+    def sample_df(self):
+        """ライブごとに連続した楽曲行を持つDataFrame"""
+        df = pd.DataFrame({
+            "LIVE_ID": [3, 3, 3, 1, 1, 2],
+            "曲名": ["A", "B", "C", "D", "E", "F"],
+            "ライブタイトル": ["歌枠リレー", "歌枠リレー", "歌枠リレー", "誕生日ライブ", "誕生日ライブ", "ｳﾀﾜｸ"],
+            "ライブ配信日_sortable": pd.to_datetime([
+                "2024-03-01", "2024-03-01", "2024-03-01", "2024-02-10", "2024-02-10", None
+            ]),
+        })
+        df[get_search_key_column("ライブタイトル")] = build_search_keys(df["ライブタイトル"])
+        return df
+
+    def test_len(self, sample_df):
+        """ライブ数を返すことを確認"""
+        index = LiveIndex(sample_df)
+
+        assert len(index) == 3
+        assert index.live_ids.tolist() == [3, 1, 2]
+
+    def test_search_title_expands_rows(self, sample_df):
+        """一致したライブの全ての行位置が返されることを確認"""
+        index = LiveIndex(sample_df)
+
+        positions = index.search_title("歌枠")
+
+        assert positions.dtype.name == "int32"
+        assert positions.tolist() == [0, 1, 2]
+        # 正規化済みのキーと照合する
+        assert index.search_title("うたわく").tolist() == [5]
+        assert index.search_title("存在しない").tolist() == []
+
+    def test_search_title_non_contiguous(self):
+        """ライブの行が連続していなくても正しく展開されることを確認"""
+        df = pd.DataFrame({
+            "LIVE_ID": [1, 2, 1, None],
+            "ライブタイトル": ["歌枠", "雑談", "歌枠", "歌枠"],
+        })
+        index = LiveIndex(df)
+
+        # LIVE_IDが欠損している行はどのライブにも含まれない
+        assert index.search_title("歌枠").tolist() == [0, 2]
+
+    def test_is_compatible(self, sample_df):
+        """行数が一致する場合のみ互換と判定されることを確認"""
+        index = LiveIndex(sample_df)
+
+        assert index.is_compatible(sample_df)
+        assert not index.is_compatible(sample_df.head(2))
+
+    def test_get_songs_by_slice(self, sample_df):
+        """ソート済みのデータではライブの楽曲を行範囲で取得できることを確認"""
+        index = LiveIndex(sample_df)
+
+        assert index.is_contiguous
+        assert index.get_live_slice(1) == slice(3, 5)
+        assert index.get_songs(sample_df, 1)["曲名"].tolist() == ["D", "E"]
+        assert index.get_live_positions(3).tolist() == [0, 1, 2]
+
+    def test_get_songs_non_contiguous(self):
+        """行が連続していない場合は行位置で取得することを確認"""
+        df = pd.DataFrame({"LIVE_ID": [1, 2, 1], "曲名": ["A", "B", "C"]})
+        index = LiveIndex(df)
+
+        assert not index.is_contiguous
+        assert index.get_songs(df, 1)["曲名"].tolist() == ["A", "C"]
+        with pytest.raises(ValueError):
+            index.get_live_slice(1)
+
+    def test_unknown_live_id(self, sample_df):
+        """存在しないLIVE_IDはKeyErrorになることを確認"""
+        index = LiveIndex(sample_df)
+
+        with pytest.raises(KeyError):
+            index.get_songs(sample_df, 99)
+
+    def test_get_lives_in_date_range(self, sample_df):
+        """期間内のライブが配信日の新しい順に返されることを確認"""
+        index = LiveIndex(sample_df)
+
+        assert index.get_lives_in_date_range("2024-02-01", "2024-03-31").tolist() == [3, 1]
+        assert index.get_lives_in_date_range(end="2024-02-29").tolist() == [1]
+        assert index.get_lives_in_date_range("2025-01-01").tolist() == []
+
+    def test_get_lives_in_date_range_unsorted(self):
+        """配信日が並んでいない場合も正しく絞り込むことを確認"""
+        df = pd.DataFrame({
+            "LIVE_ID": [1, 2, 3],
+            "ライブ配信日_sortable": pd.to_datetime(["2024-01-01", "2024-03-01", "2024-02-01"]),
+        })
+        index = LiveIndex(df)
+
+        assert index.get_lives_in_date_range("2024-02-01").tolist() == [2, 3]
+
+    def test_get_lives_without_date_column(self):
+        """配信日列がない場合は空の配列を返すことを確認"""
+        index = LiveIndex(pd.DataFrame({"LIVE_ID": [1]}))
+
+        assert index.get_lives_in_date_range("2024-01-01").tolist() == []
@@ -0,0 +1,145 @@
+"""ProcessedDataRepositoryのユニットテスト"""
+
+import os
+import pytest
+import pandas as pd
+from pathlib import Path
+from unittest.mock import patch
+
+from src.repositories.processed_data_repository import (
+    ProcessedDataRepository,
+    compute_source_version,
+)
+from src.exceptions.errors import DataSaveError
+
+pytest.importorskip("pyarrow")
+
+
+class TestProcessedDataRepository:
+    """ProcessedDataRepositoryクラスのテスト"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """ProcessedDataRepositoryインスタンスを作成"""
+        return ProcessedDataRepository(str(tmp_path / "processed.arrow"))
+
+    @pytest.fixture
+    def processed_df(self):
+        """処理済みデータのサンプル"""
+        return pd.DataFrame({
+            "LIVE_ID": [2, 1],
+            "曲名": ["曲B", "曲A"],
+            "タイムスタンプ_秒": pd.array([30, None], dtype="Int64"),
+            "ライブ配信日_sortable": pd.to_datetime(["2024-01-02", None]),
+            "曲目": ["1-1", "2-1"],
+        })
+
+    def test_save_and_load(self, repository, processed_df):
+        """保存したデータを同じバージョンで読み込めることを確認"""
+        repository.save(processed_df, "v1")
+
+        loaded = repository.load("v1")
+
+        assert loaded is not None
+        pd.testing.assert_frame_equal(loaded, processed_df, check_dtype=False)
+        assert loaded["タイムスタンプ_秒"].dtype == "Int64"
+
+    def test_load_version_mismatch(self, repository, processed_df):
+        """元データのバージョンが異なる場合はNoneを返す"""
+        repository.save(processed_df, "v1")
+
+        assert repository.load("v2") is None
+
+    def test_load_missing_file(self, repository):
+        """ファイルが存在しない場合はNoneを返す"""
+        assert repository.load("v1") is None
+
+    def test_load_corrupted_file(self, repository):
+        """壊れたファイルの場合はNoneを返す"""
+        repository.file_path.write_bytes(b"not an arrow file")
+
+        assert repository.load("v1") is None
+
+    def test_load_format_version_mismatch(self, repository, processed_df):
+        """形式バージョンが異なる場合はNoneを返す"""
+        repository.save(processed_df, "v1")
+
+        with patch(
+            "src.repositories.processed_data_repository.PROCESSED_DATA_FORMAT_VERSION",
+            "999"
+        ):
+            assert repository.load("v1") is None
+
+    def test_load_rejects_v1_artifact(self, repository, processed_df):
+        """カテゴリ型導入前（形式バージョン1）のファイルは使用しないことを確認"""
+        with patch(
+            "src.repositories.processed_data_repository.PROCESSED_DATA_FORMAT_VERSION",
+            "1"
+        ):
+            repository.save(processed_df, "v1")
+
+        assert repository.load("v1") is None
+
+    def test_load_pipeline_version_mismatch(self, repository, processed_df):
+        """パイプラインのコードが変わった場合はNoneを返す"""
+        repository.save(processed_df, "v1")
+
+        with patch(
+            "src.repositories.processed_data_repository.compute_pipeline_version",
+            return_value="changed"
+        ):
+            assert repository.load("v1") is None
+
+    def test_round_trip_preserves_dtypes(self, repository):
+        """パイプラインの出力と同じ型（カテゴリ・object・nullable整数・日時）で読み込めることを確認"""
+        df = pd.DataFrame({
+            "アーティスト": pd.Categorical(["LiSA", "Aimer", "LiSA"]),
+            "YouTubeタイムスタンプ付きURL": pd.Series(["url1", None, "url3"], dtype=object),
+            "タイムスタンプ_秒": pd.array([30, None, 90], dtype="Int64"),
+            "ライブ配信日_sortable": pd.to_datetime(["2024-01-02", None, "2024-01-01"]),
+        })
+        repository.save(df, "v1")
+
+        loaded = repository.load("v1")
+
+        pd.testing.assert_frame_equal(loaded, df)
+
+    def test_save_creates_directory(self, tmp_path, processed_df):
+        """出力ディレクトリが存在しない場合は作成する"""
+        repository = ProcessedDataRepository(str(tmp_path / "sub" / "processed.arrow"))
+
+        repository.save(processed_df, "v1")
+
+        assert repository.file_path.exists()
+        assert not Path(str(repository.file_path) + ".tmp").exists()
+
+    def test_save_without_pyarrow(self, repository, processed_df):
+        """pyarrowが利用できない場合はDataSaveErrorを送出する"""
+        with patch("src.repositories.processed_data_repository.pa", None):
+            with pytest.raises(DataSaveError):
+                repository.save(processed_df, "v1")
+            assert repository.load("v1") is None
+
+
+class TestComputeSourceVersion:
+    """compute_source_versionのテスト"""
+
+    def test_same_content_same_version(self, tmp_path):
+        """内容が同じであれば更新時刻やパスが違っても同じバージョンになる"""
+        path1 = tmp_path / "lives1.tsv"
+        path2 = tmp_path / "lives2.tsv"
+        path1.write_text("ID\n1\n", encoding="utf-8")
+        path2.write_text("ID\n1\n", encoding="utf-8")
+        os.utime(path2, (0, 0))
+
+        assert compute_source_version([str(path1)]) == compute_source_version([str(path2)])
+
+    def test_different_content_different_version(self, tmp_path):
+        """内容が変わるとバージョンが変わる"""
+        path = tmp_path / "lives.tsv"
+        path.write_text("ID\n1\n", encoding="utf-8")
+        version1 = compute_source_version([str(path)])
+
+        path.write_text("ID\n2\n", encoding="utf-8")
+
+        assert compute_source_version([str(path)]) != version1
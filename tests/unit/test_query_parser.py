@@ -0,0 +1,75 @@
+"""
+検索クエリ解析のテスト
+
+src/core/query_parser.pyのparse_query関数が正しく動作することを確認するテストです。
+"""
+
+from src.core.query_parser import parse_query
+from src.models.search_query_models import QueryTerm
+
+
+class TestParseQuery:
+    """parse_query関数のテスト"""
+
+    def test_single_term(self):
+        """単一の検索語"""
+        assert parse_query("Lemon").clauses == [[QueryTerm("Lemon")]]
+
+    def test_and_terms(self):
+        """スペース区切りはAND条件（全角スペースを含む）"""
+        assert parse_query("LiSA 炎　紅蓮華").clauses == [
+            [QueryTerm("LiSA"), QueryTerm("炎"), QueryTerm("紅蓮華")]
+        ]
+
+    def test_or_terms(self):
+        """ORと「|」はOR条件で、ANDより優先度が低い"""
+        assert parse_query("a b OR c | d").clauses == [
+            [QueryTerm("a"), QueryTerm("b")],
+            [QueryTerm("c")],
+            [QueryTerm("d")],
+        ]
+
+    def test_lowercase_or_is_term(self):
+        """小文字のorは通常の検索語として扱う"""
+        assert parse_query("a or b").clauses == [
+            [QueryTerm("a"), QueryTerm("or"), QueryTerm("b")]
+        ]
+
+    def test_exclusion(self):
+        """「-」で始まる検索語は除外条件"""
+        assert parse_query("LiSA -炎").clauses == [
+            [QueryTerm("LiSA"), QueryTerm("炎", negated=True)]
+        ]
+
+    def test_field_prefixes(self):
+        """フィールド指定（大文字小文字を区別しない）"""
+        assert parse_query("artist:LiSA Title:炎 -live:歌枠").clauses == [[
+            QueryTerm("LiSA", field="アーティスト"),
+            QueryTerm("炎", field="曲名"),
+            QueryTerm("歌枠", field="ライブタイトル", negated=True),
+        ]]
+
+    def test_unknown_prefix_is_term(self):
+        """未知のプレフィックスは検索語の一部として扱う"""
+        assert parse_query("re:zero").clauses == [[QueryTerm("re:zero")]]
+
+    def test_quoted_phrase(self):
+        """ダブルクォートで囲んだ語句は1つの検索語"""
+        assert parse_query('artist:"Official 髭男" -"夜 に"').clauses == [[
+            QueryTerm("Official 髭男", field="アーティスト"),
+            QueryTerm("夜 に", negated=True),
+        ]]
+
+    def test_lone_operators(self):
+        """「-」のみは検索語、空の語句は空のクエリ"""
+        assert parse_query("-").clauses == [[QueryTerm("-")]]
+        assert parse_query('""').is_empty()
+
+    def test_dangling_or_operators_are_terms(self):
+        """前後に検索語がないOR演算子は通常の検索語として扱う"""
+        assert parse_query("OR").clauses == [[QueryTerm("OR")]]
+        assert parse_query("|").clauses == [[QueryTerm("|")]]
+        assert parse_query("a OR").clauses == [[QueryTerm("a"), QueryTerm("OR")]]
+        assert parse_query("| b").clauses == [[QueryTerm("|"), QueryTerm("b")]]
+        # 検索語に挟まれた連続する演算子は1つの区切りとして扱う
+        assert parse_query("a OR | b").clauses == [[QueryTerm("a")], [QueryTerm("b")]]
@@ -0,0 +1,83 @@
+"""
+検索インデックスのテスト
+
+src/core/search_index.pyのSearchIndexクラスが正しく動作することを確認するテストです。
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.core.search_index import SearchIndex
+
+
+class TestSearchIndex:
+    """SearchIndexクラスのテスト"""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """テスト用のサンプルDataFrameを提供するフィクスチャ"""
+        return pd.DataFrame({
+            "曲名": ["Lemon", "Pretender", "紅蓮華", None, "夜に駆ける"],
+            "アーティスト": ["米津玄師", "Official髭男dism", "LiSA", "LiSA", "YOASOBI"],
+        })
+    
+    def test_build_skips_missing_field(self, sample_df):
+        """存在しないフィールドはインデックス化されないことを確認"""
+        index = SearchIndex(sample_df, ["曲名", "存在しない列"])
+        
+        assert index.fields == ["曲名"]
+        assert index.has_field("曲名")
+        assert not index.has_field("存在しない列")
+    
+    def test_candidates_are_superset_of_matches(self, sample_df):
+        """候補行が実際の一致行を必ず含むことを確認"""
+        index = SearchIndex(sample_df, ["曲名"])
+        
+        candidates = index.candidates("曲名", "re")
+        matches = index.search_field("曲名", "re")
+        
+        assert set(matches.tolist()) <= set(candidates.tolist())
+        assert matches.tolist() == [1]
+    
+    def test_search_field_case_insensitive(self, sample_df):
+        """大文字小文字を区別しない検索を確認"""
+        index = SearchIndex(sample_df, ["アーティスト"])
+        
+        assert index.search_field("アーティスト", "lisa").tolist() == [2, 3]
+        assert index.search_field("アーティスト", "lisa", case_sensitive=True).tolist() == []
+    
+    def test_single_character_query(self, sample_df):
+        """1文字のクエリでも検索できることを確認"""
+        index = SearchIndex(sample_df, ["曲名"])
+        
+        assert index.search_field("曲名", "夜").tolist() == [4]
+    
+    def test_missing_values_never_match(self, sample_df):
+        """欠損値の行が一致しないことを確認"""
+        index = SearchIndex(sample_df, ["曲名"])
+        
+        assert 3 not in index.search_field("曲名", "n").tolist()
+        assert index.search_field("曲名", "None").tolist() == []
+    
+    def test_search_multiple_fields(self, sample_df):
+        """複数フィールドのOR検索で昇順の行位置を返すことを確認"""
+        index = SearchIndex(sample_df, ["曲名", "アーティスト"])
+        
+        result = index.search("o", ["曲名", "アーティスト"])
+        
+        assert result.tolist() == [0, 1, 4]
+        assert result.dtype == np.int32
+    
+    def test_search_unindexed_field_returns_none(self, sample_df):
+        """インデックス化されていないフィールドを含む場合はNoneを返すことを確認"""
+        index = SearchIndex(sample_df, ["曲名"])
+        
+        assert index.search("Lemon", ["曲名", "アーティスト"]) is None
+    
+    def test_is_compatible(self, sample_df):
+        """行数による互換性判定を確認"""
+        index = SearchIndex(sample_df, ["曲名"])
+        
+        assert index.is_compatible(sample_df)
+        assert not index.is_compatible(sample_df.head(2))
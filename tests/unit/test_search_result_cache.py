@@ -0,0 +1,80 @@
+"""
+検索結果キャッシュのテスト
+
+src/core/search_result_cache.pyのSearchResultCacheクラスが正しく動作することを確認するテストです。
+"""
+
+import numpy as np
+import pytest
+
+from src.core.search_result_cache import SearchResultCache
+
+
+class TestSearchResultCache:
+    """SearchResultCacheクラスのテスト"""
+
+    @staticmethod
+    def _positions(*values):
+        """テスト用の行位置配列を作成する"""
+        return np.array(values, dtype=np.int32)
+
+    def test_get_miss_and_hit(self):
+        """未登録のキーはミス、登録済みのキーはヒットになることを確認"""
+        cache = SearchResultCache(max_size=2)
+
+        assert cache.get("a") is None
+        cache.put("a", self._positions(1, 2))
+
+        assert cache.get("a").tolist() == [1, 2]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction(self):
+        """最大エントリ数を超えると最も長く使われていないエントリが破棄されることを確認"""
+        cache = SearchResultCache(max_size=2)
+        cache.put("a", self._positions(1))
+        cache.put("b", self._positions(2))
+
+        # "a"を使用して"b"を最も古いエントリにする
+        cache.get("a")
+        cache.put("c", self._positions(3))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_stored_positions_are_read_only(self):
+        """保存された配列が書き込み不可になることを確認"""
+        cache = SearchResultCache(max_size=2)
+        positions = self._positions(1, 2)
+        cache.put("a", positions)
+
+        with pytest.raises(ValueError):
+            cache.get("a")[0] = 5
+
+    def test_zero_size_disables_cache(self):
+        """最大エントリ数が0の場合は保存しないことを確認"""
+        cache = SearchResultCache(max_size=0)
+        cache.put("a", self._positions(1))
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+    def test_clear_and_stats(self):
+        """統計情報の取得とクリアを確認"""
+        cache = SearchResultCache(max_size=4)
+        cache.put("a", self._positions(1))
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.get_stats()
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+        cache.clear()
+        assert cache.get_stats() == {
+            "size": 0, "max_size": 4, "hits": 0, "misses": 0, "hit_rate": 0.0
+        }
@@ -5,9 +5,16 @@ src/services/search_service.pyのSearchServiceクラスが正しく動作する
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 
 from src.services.search_service import SearchService
+from src.core.search_index import SearchIndex
+from src.core.fuzzy_index import FuzzyIndex
+from src.core.equality_index import EqualityIndex
+from src.core.live_index import LiveIndex
+from src.core.search_result_cache import SearchResultCache
+from src.core.utils import build_search_keys, get_search_key_column
 
 
 class TestSearchService:
@@ -108,6 +115,28 @@ class TestSearchService:
         # "アニソン特集"が2件
         assert len(result) == 2
     
+    # ========================================
+    # search_positions メソッドのテスト
+    # ========================================
+    
+    def test_search_positions_returns_int32_positions(self, search_service, sample_df):
+        """一致した行位置がint32の配列で返されることを確認"""
+        positions = search_service.search_positions(sample_df, "lisa", ["アーティスト"])
+        
+        assert positions.dtype == np.int32
+        assert positions.tolist() == [2, 3]
+    
+    def test_search_positions_empty_query(self, search_service, sample_df):
+        """クエリが空の場合は全件を表すNoneを返すことを確認"""
+        assert search_service.search_positions(sample_df, "", ["曲名"]) is None
+    
+    def test_search_positions_matches_search(self, search_service, sample_df):
+        """行位置で取得した結果がsearchの結果と一致することを確認"""
+        positions = search_service.search_positions(sample_df, "歌枠", ["ライブタイトル"])
+        result = search_service.search(sample_df, "歌枠", ["ライブタイトル"])
+        
+        pd.testing.assert_frame_equal(sample_df.iloc[positions], result)
+    
     # ========================================
     # filter_by_multiple_conditions メソッドのテスト
     # ========================================
@@ -162,6 +191,33 @@ class TestSearchService:
         assert len(result) == 2
         assert all(result["配信日"] == "2024-01-03")
     
+    def test_filter_with_equality_index_matches_scan(self, search_service, sample_df):
+        """完全一致インデックス使用時の結果が全件比較と一致することを確認"""
+        index = EqualityIndex(sample_df, ["アーティスト", "曲名"])
+        
+        for conditions in [
+            {"アーティスト": "LiSA"},
+            {"アーティスト": "LiSA", "曲名": "炎"},
+            {"アーティスト": "LiSA", "ライブタイトル": "アニソン特集", "配信日": "2024-01-03"},
+            {"アーティスト": "LiSA", "曲名": "Lemon"},
+            {"ライブタイトル": "歌枠1", "存在しない列": "値"},
+        ]:
+            expected = search_service.filter_by_multiple_conditions(sample_df, conditions)
+            result = search_service.filter_by_multiple_conditions(
+                sample_df, conditions, equality_index=index
+            )
+            assert result.index.tolist() == expected.index.tolist()
+    
+    def test_filter_with_incompatible_equality_index(self, search_service, sample_df):
+        """行数が一致しない完全一致インデックスは使用されないことを確認"""
+        index = EqualityIndex(sample_df.head(2), ["アーティスト"])
+        
+        result = search_service.filter_by_multiple_conditions(
+            sample_df, {"アーティスト": "LiSA"}, equality_index=index
+        )
+        
+        assert result.index.tolist() == [2, 3]
+    
     # ========================================
     # エッジケースのテスト
     # ========================================
@@ -193,3 +249,479 @@ class TestSearchService:
         result = search_service.filter_by_multiple_conditions(df, {"曲名": "Lemon"})
         
         assert len(result) == 0
+    
+    # ========================================
+    # 検索インデックス使用時のテスト
+    # ========================================
+    
+    def test_search_with_index_matches_full_scan(self, search_service, sample_df):
+        """インデックス使用時の検索結果が全件検索と一致することを確認"""
+        fields = ["曲名", "アーティスト", "ライブタイトル"]
+        index = SearchIndex(sample_df, fields)
+        
+        for query in ["lisa", "LiSA", "歌枠", "e", "アニソン特集", "存在しない"]:
+            for case_sensitive in [False, True]:
+                expected = search_service.search(sample_df, query, fields, case_sensitive)
+                actual = search_service.search(
+                    sample_df, query, fields, case_sensitive, index=index
+                )
+                assert actual.index.tolist() == expected.index.tolist()
+    
+    def test_search_with_index_unindexed_field(self, search_service, sample_df):
+        """インデックス化されていないフィールドは全件検索で補完されることを確認"""
+        index = SearchIndex(sample_df, ["曲名"])
+        
+        result = search_service.search(
+            sample_df, "2024-01-03", ["曲名", "配信日"], index=index
+        )
+        
+        assert len(result) == 2
+    
+    def test_search_with_incompatible_index(self, search_service, sample_df):
+        """行数が一致しないインデックスは使用されないことを確認"""
+        index = SearchIndex(sample_df.head(2), ["曲名"])
+        
+        result = search_service.search(sample_df, "夜に駆ける", ["曲名"], index=index)
+        
+        assert len(result) == 1
+        assert result.iloc[0]["曲名"] == "夜に駆ける"
+
+    
+    # ========================================
+    # 正規化検索モードのテスト
+    # ========================================
+    
+    @pytest.fixture
+    def kana_df(self):
+        """表記ゆれを含むテスト用DataFrameを提供するフィクスチャ"""
+        df = pd.DataFrame({
+            "曲名": ["ボカロメドレー", "ぼかろ縛り", "ﾎﾞｶﾛ曲", "Lemon"],
+            "アーティスト": ["Various", "Various", "Various", "米津玄師"],
+        })
+        for field in ["曲名", "アーティスト"]:
+            df[get_search_key_column(field)] = build_search_keys(df[field])
+        return df
+    
+    def test_search_normalized_kana_variants(self, search_service, kana_df):
+        """カタカナ・半角カナ・ひらがなのクエリが同じ行に一致することを確認"""
+        for query in ["ボカロ", "ﾎﾞｶﾛ", "ぼかろ"]:
+            result = search_service.search(kana_df, query, ["曲名"], normalize=True)
+            assert result.index.tolist() == [0, 1, 2]
+    
+    def test_search_normalized_fullwidth_and_case(self, search_service, kana_df):
+        """全角英字・大文字小文字の違いを無視することを確認"""
+        result = search_service.search(kana_df, "ＬＥＭＯＮ", ["曲名"], normalize=True)
+        
+        assert result.index.tolist() == [3]
+    
+    def test_search_normalized_without_key_columns(self, search_service, sample_df):
+        """検索キー列がない場合もその場で正規化して検索できることを確認"""
+        result = search_service.search(sample_df, "ｌｉｓａ", ["アーティスト"], normalize=True)
+        
+        assert len(result) == 2
+    
+    def test_search_normalized_with_index(self, search_service, kana_df):
+        """検索キー列のインデックスを使用した結果が全件検索と一致することを確認"""
+        key_columns = [get_search_key_column(field) for field in ["曲名", "アーティスト"]]
+        index = SearchIndex(kana_df, key_columns)
+        
+        for query in ["ﾎﾞｶﾛ", "various", "米津", "x"]:
+            expected = search_service.search(
+                kana_df, query, ["曲名", "アーティスト"], normalize=True
+            )
+            actual = search_service.search(
+                kana_df, query, ["曲名", "アーティスト"], normalize=True, index=index
+            )
+            assert actual.index.tolist() == expected.index.tolist()
+    
+    # ========================================
+    # クエリ構文のテスト
+    # ========================================
+    
+    def test_query_syntax_and(self, search_service, sample_df):
+        """スペース区切りの検索語が全て含まれる行のみ一致することを確認"""
+        result = search_service.search(
+            sample_df, "LiSA 紅", ["曲名", "アーティスト"], use_query_syntax=True
+        )
+        
+        assert result["曲名"].tolist() == ["紅蓮華"]
+    
+    def test_query_syntax_or(self, search_service, sample_df):
+        """ORで区切った検索語のいずれかを含む行が一致することを確認"""
+        result = search_service.search(
+            sample_df, "Lemon OR 炎", ["曲名"], use_query_syntax=True
+        )
+        
+        assert result["曲名"].tolist() == ["Lemon", "炎"]
+    
+    def test_query_syntax_dangling_operator(self, search_service):
+        """前後に検索語がないOR演算子は文字列として検索されることを確認"""
+        df = pd.DataFrame({"曲名": ["A|B", "OR ELSE", "Lemon"]})
+        
+        assert search_service.search(df, "|", ["曲名"], use_query_syntax=True)["曲名"].tolist() == ["A|B"]
+        assert search_service.search(df, "OR", ["曲名"], use_query_syntax=True)["曲名"].tolist() == ["OR ELSE"]
+    
+    def test_query_syntax_exclusion(self, search_service, sample_df):
+        """除外条件に一致する行が除かれることを確認"""
+        result = search_service.search(
+            sample_df, "LiSA -炎", ["曲名", "アーティスト"], use_query_syntax=True
+        )
+        
+        assert result["曲名"].tolist() == ["紅蓮華"]
+    
+    def test_query_syntax_exclusion_only(self, search_service, sample_df):
+        """除外条件のみの場合は除外対象以外の全行が一致することを確認"""
+        result = search_service.search(
+            sample_df, "-LiSA", ["アーティスト"], use_query_syntax=True
+        )
+        
+        assert len(result) == 3
+    
+    def test_query_syntax_field_prefix(self, search_service, sample_df):
+        """フィールド指定は検索対象フィールド外でも指定フィールドのみを検索することを確認"""
+        result = search_service.search(
+            sample_df, "live:アニソン", ["曲名"], use_query_syntax=True
+        )
+        
+        assert result["曲名"].tolist() == ["紅蓮華", "炎"]
+    
+    def test_query_syntax_with_normalize_and_index(self, search_service, kana_df):
+        """正規化検索とインデックスを併用できることを確認"""
+        fields = [get_search_key_column("曲名"), get_search_key_column("アーティスト")]
+        index = SearchIndex(kana_df, fields)
+        
+        result = search_service.search(
+            kana_df, "ﾎﾞｶﾛ -メドレー", ["曲名"],
+            index=index, normalize=True, use_query_syntax=True
+        )
+        
+        assert result["曲名"].tolist() == ["ぼかろ縛り", "ﾎﾞｶﾛ曲"]
+    
+    # ========================================
+    # 検索結果キャッシュのテスト
+    # ========================================
+    
+    @pytest.fixture
+    def versioned_index(self, kana_df):
+        """バージョン付きの検索インデックス"""
+        fields = [get_search_key_column("曲名")]
+        return SearchIndex(kana_df, fields, version="v1")
+    
+    def test_search_result_cache_hit(self, kana_df, versioned_index):
+        """同じクエリの2回目はキャッシュから返されることを確認"""
+        cache = SearchResultCache(max_size=8)
+        service = SearchService(result_cache=cache)
+        
+        first = service.search_positions(kana_df, "ボカロ", ["曲名"], index=versioned_index, normalize=True)
+        # 正規化後に同じクエリになる表記ゆれもキャッシュにヒットする
+        second = service.search_positions(kana_df, "ﾎﾞｶﾛ", ["曲名"], index=versioned_index, normalize=True)
+        
+        assert second is first
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_search_result_cache_keyed_on_parsed_query(self, kana_df, versioned_index):
+        """同じ条件に解析されるクエリ構文はキャッシュにヒットすることを確認"""
+        cache = SearchResultCache(max_size=8)
+        service = SearchService(result_cache=cache)
+        
+        first = service.search_positions(
+            kana_df, "ボカロ -メドレー OR lemon", ["曲名"],
+            index=versioned_index, normalize=True, use_query_syntax=True
+        )
+        # 空白の違い、「|」と「OR」、正規化後に同じになる表記ゆれ、検索語の順序
+        for query in ["ボカロ  -メドレー | lemon", "LEMON OR ﾎﾞｶﾛ -ﾒﾄﾞﾚｰ", "-メドレー　ぼかろ | Lemon"]:
+            result = service.search_positions(
+                kana_df, query, ["曲名"],
+                index=versioned_index, normalize=True, use_query_syntax=True
+            )
+            assert result is first
+        
+        # 除外条件や節の区切りが異なるクエリは別のキーになる
+        service.search_positions(
+            kana_df, "ボカロ メドレー OR lemon", ["曲名"],
+            index=versioned_index, normalize=True, use_query_syntax=True
+        )
+        service.search_positions(
+            kana_df, "ボカロ -メドレー lemon", ["曲名"],
+            index=versioned_index, normalize=True, use_query_syntax=True
+        )
+        
+        assert first.tolist() == [1, 2, 3]
+        assert cache.hits == 3
+        assert cache.misses == 3
+    
+    def test_search_result_cache_query_syntax_case_sensitive(self, kana_df, versioned_index):
+        """大文字小文字を区別する場合は大文字小文字の異なる検索語を別のキーにすることを確認"""
+        cache = SearchResultCache(max_size=8)
+        service = SearchService(result_cache=cache)
+        
+        first = service.search_positions(
+            kana_df, "Lemon", ["曲名"], case_sensitive=True,
+            index=versioned_index, use_query_syntax=True
+        )
+        second = service.search_positions(
+            kana_df, "lemon", ["曲名"], case_sensitive=True,
+            index=versioned_index, use_query_syntax=True
+        )
+        
+        assert first.tolist() == [3]
+        assert second.tolist() == []
+        assert cache.hits == 0
+    
+    def test_search_result_cache_keyed_on_version(self, kana_df, versioned_index):
+        """データバージョンが異なる場合はキャッシュを使わないことを確認"""
+        cache = SearchResultCache(max_size=8)
+        service = SearchService(result_cache=cache)
+        other_index = SearchIndex(kana_df, [get_search_key_column("曲名")], version="v2")
+        
+        service.search_positions(kana_df, "ボカロ", ["曲名"], index=versioned_index, normalize=True)
+        service.search_positions(kana_df, "ボカロ", ["曲名"], index=other_index, normalize=True)
+        
+        assert cache.hits == 0
+        assert cache.misses == 2
+    
+    def test_search_result_cache_without_version(self, kana_df):
+        """データバージョンが特定できない場合はキャッシュしないことを確認"""
+        cache = SearchResultCache(max_size=8)
+        service = SearchService(result_cache=cache)
+        
+        service.search_positions(kana_df, "ボカロ", ["曲名"], normalize=True)
+        
+        assert len(cache) == 0
+        assert cache.misses == 0
+    
+    # ========================================
+    # カテゴリ型の列のテスト
+    # ========================================
+    
+    @pytest.mark.parametrize("normalize", [False, True])
+    @pytest.mark.parametrize("query", ["ボカロ", "lemon", "various", "存在しない"])
+    def test_search_categorical_matches_object(self, search_service, kana_df, query, normalize):
+        """カテゴリ型の列でもオブジェクト型と同じ行に一致することを確認"""
+        categorical_df = kana_df.copy()
+        for column in categorical_df.columns:
+            categorical_df[column] = categorical_df[column].astype("category")
+        
+        expected = search_service.search_positions(
+            kana_df, query, ["曲名", "アーティスト"], normalize=normalize
+        )
+        result = search_service.search_positions(
+            categorical_df, query, ["曲名", "アーティスト"], normalize=normalize
+        )
+        
+        assert result.tolist() == expected.tolist()
+    
+    def test_search_categorical_with_missing_values(self, search_service):
+        """カテゴリ型の欠損値は一致しないことを確認"""
+        df = pd.DataFrame({"曲名": pd.Series(["Lemon", None, "Lemon"], dtype="category")})
+        
+        assert search_service.search_positions(df, "lemon", ["曲名"]).tolist() == [0, 2]
+        assert search_service.search_positions(df, "nan", ["曲名"]).tolist() == []
+    
+    # ========================================
+    # ライブ単位の検索のテスト
+    # ========================================
+    
+    @pytest.fixture
+    def live_df(self):
+        """ライブごとに連続した楽曲行を持つDataFrame"""
+        df = pd.DataFrame({
+            "LIVE_ID": [2, 2, 1, 1],
+            "曲名": ["Lemon", "ロキ", "Lemon", "残響散歌"],
+            "アーティスト": ["米津玄師", "みきとP", "米津玄師", "Aimer"],
+            "ライブタイトル": ["歌枠リレー", "歌枠リレー", "誕生日ライブ", "誕生日ライブ"],
+        })
+        for field in ["曲名", "アーティスト", "ライブタイトル"]:
+            df[get_search_key_column(field)] = build_search_keys(df[field])
+        return df
+    
+    def test_search_with_live_index(self, search_service, live_df):
+        """ライブインデックスを使用しても同じ結果になることを確認"""
+        live_index = LiveIndex(live_df)
+        fields = ["曲名", "ライブタイトル"]
+        
+        for query in ["うたわく", "誕生日", "lemon", "live:歌枠 lemon"]:
+            expected = search_service.search_positions(
+                live_df, query, fields, normalize=True, use_query_syntax=True
+            )
+            result = search_service.search_positions(
+                live_df, query, fields, normalize=True, use_query_syntax=True,
+                live_index=live_index
+            )
+            assert result.tolist() == expected.tolist()
+    
+    def test_search_with_incompatible_live_index(self, search_service, live_df):
+        """行数が一致しないライブインデックスは使用されないことを確認"""
+        live_index = LiveIndex(live_df.head(2))
+        
+        result = search_service.search_positions(
+            live_df, "誕生日", ["ライブタイトル"], normalize=True, live_index=live_index
+        )
+        
+        assert result.tolist() == [2, 3]
+    
+    # ========================================
+    # 期間による絞り込みのテスト
+    # ========================================
+    
+    @pytest.fixture
+    def dated_df(self):
+        """配信日の降順（欠損値は末尾）にソートされたDataFrame"""
+        return pd.DataFrame({
+            "曲名": ["Lemon", "ロキ", "Lemon", "残響散歌", "Lemon"],
+            "ライブ配信日_sortable": pd.to_datetime(pd.Series([
+                "2024-03-01", "2024-02-15", "2024-02-01", "2024-01-10", None
+            ])),
+        })
+    
+    def test_get_date_range_slice(self, search_service, dated_df):
+        """期間内の行範囲が返されることを確認"""
+        assert search_service.get_date_range_slice(dated_df, "2024-02-01", "2024-02-29") == slice(1, 3)
+        assert search_service.filter_by_date_range(dated_df, end="2024-01-31")["曲名"].tolist() == ["残響散歌"]
+    
+    def test_date_range_on_unsorted_frame(self, search_service, dated_df):
+        """配信日の降順に並んでいない場合も正しい行を返すことを確認"""
+        unsorted_df = dated_df.iloc[[4, 2, 0, 3, 1]].reset_index(drop=True)
+        
+        positions = search_service.get_date_range_slice(unsorted_df, "2024-02-01", "2024-02-29")
+        
+        assert positions.tolist() == [1, 4]
+        assert search_service.filter_by_date_range(unsorted_df, end="2024-01-31")["曲名"].tolist() == ["残響散歌"]
+        result = search_service.search_positions(
+            unsorted_df, "lemon", ["曲名"], date_range=("2024-02-01", None)
+        )
+        assert result.tolist() == [1, 2]
+    
+    def test_get_date_range_slice_without_date_column(self, search_service, sample_df):
+        """配信日列がない場合は全行の範囲を返すことを確認"""
+        assert search_service.get_date_range_slice(sample_df, "2024-01-01") == slice(0, len(sample_df))
+    
+    def test_search_positions_with_date_range(self, search_service, dated_df):
+        """キーワード検索と期間による絞り込みを組み合わせられることを確認"""
+        result = search_service.search_positions(
+            dated_df, "lemon", ["曲名"], date_range=("2024-02-01", None)
+        )
+        
+        assert result.tolist() == [0, 2]
+    
+    def test_search_positions_date_range_only(self, search_service, dated_df):
+        """クエリが空でも期間を指定すると期間内の行位置を返すことを確認"""
+        result = search_service.search_positions(
+            dated_df, "", ["曲名"], date_range=("2024-02-01", "2024-02-29")
+        )
+        
+        assert result.dtype == np.int32
+        assert result.tolist() == [1, 2]
+    
+    def test_date_range_applied_to_cached_result(self, dated_df):
+        """キャッシュされた検索結果にも期間が適用されることを確認"""
+        for field in ["曲名"]:
+            dated_df[get_search_key_column(field)] = build_search_keys(dated_df[field])
+        index = SearchIndex(dated_df, [get_search_key_column("曲名")], version="v1")
+        cache = SearchResultCache(max_size=8)
+        service = SearchService(result_cache=cache)
+        
+        full = service.search_positions(dated_df, "lemon", ["曲名"], index=index, normalize=True)
+        narrowed = service.search_positions(
+            dated_df, "lemon", ["曲名"], index=index, normalize=True,
+            date_range=("2024-02-01", "2024-02-29")
+        )
+        
+        assert full.tolist() == [0, 2, 4]
+        assert narrowed.tolist() == [2]
+        assert cache.hits == 1
+    
+    # ========================================
+    # インクリメンタル検索のテスト
+    # ========================================
+    
+    def test_search_positions_with_candidates(self, search_service, kana_df):
+        """候補行を指定しても全件検索と同じ結果になることを確認"""
+        full = search_service.search_positions(kana_df, "ボカロ", ["曲名"], normalize=True)
+        narrowed = search_service.search_positions(
+            kana_df, "ボカロ曲", ["曲名"], normalize=True, candidates=full
+        )
+        
+        assert narrowed.dtype == np.int32
+        assert narrowed.tolist() == search_service.search_positions(
+            kana_df, "ボカロ曲", ["曲名"], normalize=True
+        ).tolist() == [2]
+    
+    def test_search_positions_with_candidates_query_syntax(self, search_service, kana_df):
+        """クエリ構文とフィールド指定でも候補行から正しく絞り込むことを確認"""
+        candidates = np.array([0, 3], dtype=np.int32)
+        
+        result = search_service.search_positions(
+            kana_df, "artist:various -メドレー", ["曲名"],
+            normalize=True, use_query_syntax=True, candidates=candidates
+        )
+        
+        assert result.tolist() == []
+        result = search_service.search_positions(
+            kana_df, "artist:米津", ["曲名"],
+            normalize=True, use_query_syntax=True, candidates=candidates
+        )
+        assert result.tolist() == [3]
+    
+    def test_is_narrowing_query(self, search_service):
+        """前回のクエリを含むクエリを絞り込みと判定することを確認"""
+        assert search_service.is_narrowing_query("ボカ", "ボカロ")
+        assert search_service.is_narrowing_query("lemon", "LEMON", case_sensitive=False)
+        assert not search_service.is_narrowing_query("lemon", "LEMON", case_sensitive=True)
+        assert search_service.is_narrowing_query("ボカ", "ﾎﾞｶﾛ", normalize=True)
+        assert not search_service.is_narrowing_query("ボカロ", "ボカ")
+        assert not search_service.is_narrowing_query("", "ボカロ")
+    
+    def test_is_narrowing_query_syntax(self, search_service):
+        """クエリ構文で結果が広がる変更は絞り込みと判定しないことを確認"""
+        def narrowing(previous, query):
+            return search_service.is_narrowing_query(
+                previous, query, normalize=True, use_query_syntax=True
+            )
+        
+        assert narrowing("ボカ", "ボカロ メドレー")
+        assert narrowing("ボカロ", "ボカロ -メドレー")
+        assert narrowing("ボカロ -メドレー", "ボカロ -メド")
+        assert narrowing("artist:米", "artist:米津 Lemon")
+        assert not narrowing("ボカロ", "ボカロ OR Lemon")
+        assert not narrowing("ボカロ -メド", "ボカロ -メドレー")
+        assert not narrowing("art", "artist:米津")
+        assert not narrowing("ボカロ Lemon", "ボカロ")
+    
+    # ========================================
+    # あいまい検索のテスト
+    # ========================================
+    
+    @pytest.fixture
+    def fuzzy_index(self, kana_df):
+        """曲名とアーティストのあいまい検索インデックス"""
+        return FuzzyIndex(kana_df, ["曲名", "アーティスト"])
+    
+    def test_suggest(self, search_service, fuzzy_index):
+        """入力ミスのあるクエリから候補が返されることを確認"""
+        suggestions = search_service.suggest("Lemom", ["曲名", "アーティスト"], fuzzy_index)
+        
+        assert [match.text for match in suggestions] == ["Lemon"]
+    
+    def test_suggest_with_query_syntax(self, search_service, fuzzy_index):
+        """クエリ構文ではフィールド指定を反映し、複数の検索語は対象外になることを確認"""
+        assert search_service.suggest(
+            "title:Lemom", ["アーティスト"], fuzzy_index, use_query_syntax=True
+        )[0].text == "Lemon"
+        assert search_service.suggest(
+            "artist:Lemom", ["曲名"], fuzzy_index, use_query_syntax=True
+        ) == []
+        assert search_service.suggest(
+            "Lemom OR 米津", ["曲名"], fuzzy_index, use_query_syntax=True
+        ) == []
+        assert search_service.suggest(
+            "-Lemom", ["曲名"], fuzzy_index, use_query_syntax=True
+        ) == []
+    
+    def test_fuzzy_search_positions(self, search_service, kana_df, fuzzy_index):
+        """近い値を持つ行位置が返されることを確認"""
+        positions = search_service.fuzzy_search_positions("Lemom", ["曲名"], fuzzy_index)
+        
+        assert positions.tolist() == [3]
+        assert search_service.fuzzy_search_positions("", ["曲名"], fuzzy_index).tolist() == []
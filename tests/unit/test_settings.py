@@ -29,11 +29,17 @@ class TestConfigEnvironmentVariables:
             assert config.css_file_path == "src/ui/styles/style.css"
             assert config.initial_display_limit == 25
             assert config.display_increment == 25
+            assert config.song_list_page_size == 100
             assert config.page_title == "しのうたタイム"
             assert config.page_icon == "👻"
             assert config.layout == "wide"
             assert config.enable_cache is True
             assert config.cache_ttl == 3600
+            assert config.cache_content_hash is False
+            assert config.processed_data_file_path == "data/M_YT_LIVE_PROCESSED.arrow"
+            assert config.persist_processed_data is False
+            assert config.search_cache_size == 256
+            assert config.incremental_search is True
     
     def test_from_env_with_custom_values(self):
         """環境変数からカスタム値を読み込み"""
@@ -46,11 +52,17 @@ class TestConfigEnvironmentVariables:
             "SHINOUTA_CSS_FILE_PATH": "custom/style.css",
             "SHINOUTA_INITIAL_DISPLAY_LIMIT": "50",
             "SHINOUTA_DISPLAY_INCREMENT": "10",
+            "SHINOUTA_SONG_LIST_PAGE_SIZE": "30",
             "SHINOUTA_PAGE_TITLE": "カスタムタイトル",
             "SHINOUTA_PAGE_ICON": "🎵",
             "SHINOUTA_LAYOUT": "centered",
             "SHINOUTA_ENABLE_CACHE": "false",
-            "SHINOUTA_CACHE_TTL": "7200"
+            "SHINOUTA_CACHE_TTL": "7200",
+            "SHINOUTA_CACHE_CONTENT_HASH": "true",
+            "SHINOUTA_PROCESSED_DATA_FILE_PATH": "custom/processed.arrow",
+            "SHINOUTA_PERSIST_PROCESSED_DATA": "true",
+            "SHINOUTA_SEARCH_CACHE_SIZE": "64",
+            "SHINOUTA_INCREMENTAL_SEARCH": "false"
         }
         
         with patch.dict(os.environ, env_vars, clear=True):
@@ -65,11 +77,17 @@ class TestConfigEnvironmentVariables:
             assert config.css_file_path == "custom/style.css"
             assert config.initial_display_limit == 50
             assert config.display_increment == 10
+            assert config.song_list_page_size == 30
             assert config.page_title == "カスタムタイトル"
             assert config.page_icon == "🎵"
             assert config.layout == "centered"
             assert config.enable_cache is False
             assert config.cache_ttl == 7200
+            assert config.cache_content_hash is True
+            assert config.processed_data_file_path == "custom/processed.arrow"
+            assert config.persist_processed_data is True
+            assert config.search_cache_size == 64
+            assert config.incremental_search is False
     
     def test_from_env_boolean_conversion(self):
         """ブール値の型変換テスト"""
@@ -292,6 +310,16 @@ class TestConfigValidation:
         assert "display_increment" in str(exc_info.value)
         assert "正の整数である必要があります" in str(exc_info.value)
     
+    def test_validate_zero_song_list_page_size(self):
+        """楽曲リストの1ページあたりの表示件数が0の場合のエラー"""
+        config = Config(song_list_page_size=0)
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            config.validate()
+        
+        assert "song_list_page_size" in str(exc_info.value)
+        assert "正の整数である必要があります" in str(exc_info.value)
+    
     def test_validate_zero_display_increment(self):
         """表示増分が0の場合のエラー"""
         config = Config(display_increment=0)
@@ -332,6 +360,15 @@ class TestConfigValidation:
         assert "cache_ttl" in str(exc_info.value)
         assert "0以上である必要があります" in str(exc_info.value)
     
+    def test_validate_negative_search_cache_size(self):
+        """検索結果キャッシュの最大エントリ数が負の場合のエラー"""
+        config = Config(search_cache_size=-1)
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            config.validate()
+        
+        assert "search_cache_size" in str(exc_info.value)
+    
     def test_validate_zero_cache_ttl(self):
         """キャッシュTTLが0の場合は有効（キャッシュ無効化）"""
         config = Config(cache_ttl=0)
@@ -4,7 +4,7 @@ SongListServiceのユニットテスト
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 import unittest.mock
 
 from src.services.song_list_service import SongListService
@@ -293,6 +293,110 @@ class TestSongListService:
         result = service._select_latest_from_records([])
         assert result is None
 
+    
+    # ========================================
+    # 差分更新のテスト
+    # ========================================
+    
+    def _make_service(self, mock_live_repo, timestamp_infos):
+        """指定したタイムスタンプ情報を返すサービスを作成する"""
+        repo = Mock(spec=TimestampRepository)
+        repo.load_all.return_value = timestamp_infos
+        return SongListService(mock_live_repo, repo)
+    
+    def test_update_song_list_matches_full_generation(self, mock_live_repo, mock_timestamp_repo):
+        """追加されたレコードの差分更新が全件生成と一致することを確認"""
+        all_infos = mock_timestamp_repo.load_all.return_value + [
+            TimestampInfo(id=4, live_id=2, timestamp="3:00", song_name="曲A(1chorus)", artist="アーティストA"),
+            TimestampInfo(id=5, live_id=2, timestamp="4:00", song_name="曲C", artist="アーティストC"),
+        ]
+        previous = self._make_service(
+            mock_live_repo, [info for info in all_infos if info.id <= 3]
+        ).generate_song_list()
+        service = self._make_service(mock_live_repo, all_infos)
+        
+        updated = service.update_song_list(previous, since_id=3)
+        
+        assert updated == service.generate_song_list()
+        assert [song.song_name for song in updated] == ["曲A", "曲B", "曲C"]
+    
+    def test_update_song_list_reuses_unaffected_songs(self, mock_live_repo, mock_timestamp_repo):
+        """影響のないグループは再計算せず、前回の内容を再利用することを確認"""
+        previous = [
+            SongInfo(artist="アーティストB", artist_sort="前回の読み", song_name="曲B", latest_url="url-b"),
+        ]
+        service = SongListService(mock_live_repo, mock_timestamp_repo)
+        service.artist_sort_generator = Mock(wraps=service.artist_sort_generator)
+        
+        updated = service.update_song_list(previous, since_id=2)
+        
+        # 曲B（ID 3）のグループのみ再計算される
+        assert service.artist_sort_generator.generate.call_count == 1
+        assert {song.song_name for song in updated} == {"曲B"}
+        assert updated[0].artist_sort != "前回の読み"
+        
+        updated = service.update_song_list(previous, since_id=3)
+        assert updated == previous
+    
+    def test_update_song_list_with_changed_live(self, mock_live_repo, mock_timestamp_repo):
+        """変更された配信から選ばれていた曲のグループが再計算されることを確認"""
+        service = SongListService(mock_live_repo, mock_timestamp_repo)
+        # 前回は配信2に「曲X」があったが、修正されて「曲A」になった
+        previous = [
+            SongInfo(
+                artist="アーティストA", artist_sort="あーてぃすとA", song_name="曲X",
+                latest_url="https://youtube.com/watch?v=def&t=754"
+            ),
+        ]
+        
+        updated = service.update_song_list(previous, changed_live_ids=[2])
+        
+        assert [song.song_name for song in updated] == ["曲A"]
+        assert updated[0].latest_url == "https://youtube.com/watch?v=def&t=754"
+    
+    def test_update_song_list_keeps_tie_order(self, mock_live_repo):
+        """ソートキーが同じ曲も全件生成と同じ順序で並ぶことを確認"""
+        all_infos = [
+            TimestampInfo(id=1, live_id=1, timestamp="1:00", song_name="曲X", artist="さユリ"),
+            TimestampInfo(id=2, live_id=1, timestamp="2:00", song_name="曲Y", artist="アーティストA"),
+            TimestampInfo(id=3, live_id=2, timestamp="3:00", song_name="曲X", artist="さユり"),
+        ]
+        service = self._make_service(mock_live_repo, all_infos)
+        expected = service.generate_song_list()
+        previous = [song for song in expected if song.artist != "さユり"]
+        
+        with patch.object(service, "normalize_song_name", wraps=service.normalize_song_name) as mock_normalize:
+            updated = service.update_song_list(previous, since_id=2)
+        
+        assert updated == expected
+        # 同順位の並べ替えでは、該当アーティストのレコードのみを正規化する
+        normalized = [call.args[0] for call in mock_normalize.call_args_list]
+        assert "曲Y" not in normalized
+    
+    def test_update_song_list_applies_mapping_to_padded_artist(self, mock_live_repo, tmp_path):
+        """前後に空白を含むアーティスト名にも全件生成と同じ修正マッピングが適用されることを確認"""
+        all_infos = [
+            TimestampInfo(id=1, live_id=1, timestamp="1:00", song_name="曲X", artist=" アーティストA "),
+            TimestampInfo(id=2, live_id=2, timestamp="2:00", song_name="曲Y", artist="アーティストB"),
+        ]
+        repo = Mock(spec=TimestampRepository)
+        repo.load_all.return_value = all_infos
+        service = SongListService(
+            mock_live_repo, repo, mapping_file_path=str(tmp_path / "mapping.tsv")
+        )
+        previous = service.generate_song_list()
+        
+        service.mapping_repository.save_mapping("アーティストA", "えー")
+        expected = service.generate_song_list()
+        updated = service.update_song_list(previous, since_id=2)
+        
+        assert updated == expected
+        assert [song.artist_sort for song in updated if song.song_name == "曲X"] == ["えー"]
+    
+    def test_update_song_list_without_delta_regenerates(self, service):
+        """差分の指定がない場合は全件を再生成することを確認"""
+        assert service.update_song_list([]) == service.generate_song_list()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
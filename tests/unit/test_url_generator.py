@@ -41,6 +41,13 @@ class TestURLGenerator:
         assert generator.parse_timestamp("12:34:56:78") is None
         assert generator.parse_timestamp("") is None
     
+    def test_parse_timestamp_matches_pipeline_rules(self, generator):
+        """データ処理パイプライン（convert_timestamp_to_seconds）と同じ規則で変換することを確認"""
+        from src.core.utils import convert_timestamp_to_seconds
+        
+        for timestamp in [" 1:23", "1:23\n", "100:30", "１:２３", "1_0:30", "12:34:56:78"]:
+            assert generator.parse_timestamp(timestamp) == convert_timestamp_to_seconds(timestamp)
+    
     def test_generate_timestamped_url_basic(self, generator):
         """基本的なタイムスタンプ付きURL生成"""
         # 要件4.1: ベースURLにタイムスタンプパラメータを付加
@@ -76,3 +83,18 @@ class TestURLGenerator:
         base_url = "https://youtube.com/watch?v=abc123"
         url = generator.generate_timestamped_url(base_url, "invalid")
         assert url == base_url
+    
+    def test_build_timestamped_url(self, generator):
+        """変換済みの秒数からURLを生成できることを確認"""
+        url = generator.build_timestamped_url(
+            "https://youtube.com/watch?v=abc123&list=playlist",
+            754
+        )
+        assert "v=abc123" in url
+        assert "list=playlist" in url
+        assert "t=754" in url
+    
+    def test_build_timestamped_url_none_seconds(self, generator):
+        """秒数がNoneの場合はベースURLをそのまま返す"""
+        base_url = "https://youtube.com/watch?v=abc123"
+        assert generator.build_timestamped_url(base_url, None) == base_url
@@ -5,14 +5,22 @@ src/core/utils.pyの各関数が正しく動作することを確認するテス
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 from src.core.utils import (
     convert_timestamp_to_seconds,
+    convert_timestamps_to_seconds,
     generate_youtube_url,
+    generate_youtube_urls,
     generate_song_numbers,
     convert_date_string,
+    normalize_search_text,
+    get_search_key_column,
+    build_search_keys,
+    find_descending_date_slice,
+    is_descending_dates,
 )
 
 
@@ -38,6 +46,16 @@ class TestConvertTimestampToSeconds:
         assert convert_timestamp_to_seconds("") is None
         assert convert_timestamp_to_seconds("12") is None
     
+    def test_int_semantics_edge_inputs(self):
+        """各区切りをint()と同じ規則で変換することを確認（空白・全角数字・3桁以上の分など）"""
+        assert convert_timestamp_to_seconds(" 1:23") == 83
+        assert convert_timestamp_to_seconds("1:23 ") == 83
+        assert convert_timestamp_to_seconds("1:23\n") == 83
+        assert convert_timestamp_to_seconds("100:30") == 6030
+        assert convert_timestamp_to_seconds("１:２３") == 83
+        assert convert_timestamp_to_seconds("-1:30") == -30
+        assert convert_timestamp_to_seconds("1_0:30") == 630
+    
     def test_none_input(self):
         """None入力の場合にNoneを返すことを確認"""
         assert convert_timestamp_to_seconds(None) is None
@@ -49,6 +67,61 @@ class TestConvertTimestampToSeconds:
         # 実際の使用ケースではDataFrameから文字列が渡されるため、このケースは稀
 
 
+class TestConvertTimestampsToSeconds:
+    """convert_timestamps_to_seconds関数のテスト"""
+    
+    def test_matches_scalar_function(self):
+        """各要素の結果がconvert_timestamp_to_secondsと一致することを確認"""
+        values = [
+            "1:23:45", "12:34", "0:00", " 1 : 02 ", "99:99:99",
+            "invalid", "", "12", "1:2:3:4", "1.5:00", "a:b", None, 123,
+            " 1:23", "1:23 ", "1:23\n", "100:30", "１:２３", "-1:30", "1_0:30",
+            "1:23:４５", "+1:00", "1: 2:3",
+        ]
+        
+        result = convert_timestamps_to_seconds(pd.Series(values, dtype=object))
+        
+        for value, seconds in zip(values, result):
+            expected = convert_timestamp_to_seconds(value)
+            if expected is None:
+                assert pd.isna(seconds), value
+            else:
+                assert seconds == expected, value
+    
+    def test_edge_inputs_match_scalar_results(self):
+        """標準的でない形式の行も、1件ずつの変換と同じ値になることを確認"""
+        values = pd.Series([" 1:23", "12:34", "100:30", "１:２３", "-1:30", "invalid"], index=[4, 5, 6, 7, 8, 9])
+        
+        result = convert_timestamps_to_seconds(values)
+        
+        assert result.tolist() == [83, 754, 6030, 83, -30, pd.NA]
+        assert result.index.tolist() == [4, 5, 6, 7, 8, 9]
+    
+    def test_returns_nullable_integer(self):
+        """nullable整数型（Int64）で返し、インデックスを維持することを確認"""
+        series = pd.Series(["1:00", "invalid"], index=[3, 8])
+        
+        result = convert_timestamps_to_seconds(series)
+        
+        assert result.dtype == "Int64"
+        assert result.index.tolist() == [3, 8]
+        assert result.iloc[0] == 60
+        assert pd.isna(result.iloc[1])
+    
+    def test_mm_ss_only(self):
+        """時間の区切りを含む行がない場合も変換できることを確認"""
+        result = convert_timestamps_to_seconds(pd.Series(["12:34", "0:05"]))
+        
+        assert result.tolist() == [754, 5]
+    
+    def test_empty_series(self):
+        """空の列を変換できることを確認"""
+        result = convert_timestamps_to_seconds(pd.Series([], dtype=object))
+        
+        assert len(result) == 0
+        assert result.dtype == "Int64"
+
+
 class TestGenerateYoutubeUrl:
     """generate_youtube_url関数のテスト"""
     
@@ -84,6 +157,45 @@ class TestGenerateYoutubeUrl:
         assert result == "https://www.youtube.com/watch?v=abc123&t=754s"
 
 
+class TestGenerateYoutubeUrls:
+    """generate_youtube_urls関数のテスト"""
+    
+    def test_matches_scalar_function(self):
+        """各行の結果がgenerate_youtube_urlと一致することを確認"""
+        base_urls = pd.Series([
+            "https://www.youtube.com/watch?v=abc123",
+            None,
+            "https://www.youtube.com/live/xyz?si=q",
+            "https://www.youtube.com/watch?v=def",
+            "https://www.youtube.com/watch?v=ghi",
+        ])
+        seconds = pd.Series([754, 100, 0, None, 12.7])
+        
+        result = generate_youtube_urls(base_urls, seconds)
+        
+        expected = [
+            generate_youtube_url(url, sec)
+            for url, sec in zip(base_urls, seconds)
+        ]
+        assert result.tolist() == expected
+        assert result.tolist()[4] == "https://www.youtube.com/watch?v=ghi&t=12s"
+    
+    def test_preserves_index(self):
+        """入力と同じインデックスを持つことを確認"""
+        base_urls = pd.Series(["https://youtu.be/a", "https://youtu.be/b"], index=[5, 9])
+        seconds = pd.Series([1, 2], index=[5, 9])
+        
+        result = generate_youtube_urls(base_urls, seconds)
+        
+        assert result.index.tolist() == [5, 9]
+    
+    def test_all_missing(self):
+        """すべて欠損の場合は空文字列になることを確認"""
+        result = generate_youtube_urls(pd.Series([None, None]), pd.Series([None, 3]))
+        
+        assert result.tolist() == ["", ""]
+
+
 class TestGenerateSongNumbers:
     """generate_song_numbers関数のテスト"""
     
@@ -162,6 +274,22 @@ class TestGenerateSongNumbers:
         # 結果には新しい列が追加されていることを確認
         assert "曲順" in result.columns
         assert "曲目" in result.columns
+    
+    def test_missing_date_keeps_integer_labels(self):
+        """配信日が欠損した行があっても曲目番号が整数表記になることを確認"""
+        df = pd.DataFrame({
+            "LIVE_ID": [1, 2, 3],
+            "ライブ配信日_sortable": [
+                pd.Timestamp("2024-01-01"),
+                pd.Timestamp("2024-01-01"),
+                pd.NaT,
+            ],
+        })
+        
+        result = generate_song_numbers(df)
+        
+        assert list(result["曲目"]) == ["1-1曲目", "2-1曲目", "1曲目"]
+        assert pd.isna(result["ライブ番号"].iloc[2])
 
 
 class TestConvertDateString:
@@ -208,3 +336,83 @@ class TestConvertDateString:
     def test_pandas_na(self):
         """pandas NAの場合にNoneを返すことを確認"""
         assert convert_date_string(pd.NA) is None
+
+
+class TestNormalizeSearchText:
+    """normalize_search_text関数のテスト"""
+    
+    def test_katakana_width_and_hiragana_unified(self):
+        """全角カナ・半角カナ・ひらがなが同じキーになることを確認"""
+        expected = normalize_search_text("ボカロ")
+        assert expected == "ぼかろ"
+        assert normalize_search_text("ﾎﾞｶﾛ") == expected
+        assert normalize_search_text("ぼかろ") == expected
+    
+    def test_fullwidth_alphanumeric_and_case(self):
+        """全角英数字と大文字小文字が畳み込まれることを確認"""
+        assert normalize_search_text("ＬｉＳＡ") == "lisa"
+        assert normalize_search_text("YOASOBI") == "yoasobi"
+        assert normalize_search_text("１２３") == "123"
+    
+    def test_prolonged_sound_mark_kept(self):
+        """長音記号が維持されることを確認"""
+        assert normalize_search_text("ブルーバード") == "ぶるーばーど"
+    
+    def test_missing_values(self):
+        """欠損値が空文字列になることを確認"""
+        assert normalize_search_text(None) == ""
+        assert normalize_search_text(float("nan")) == ""
+
+
+class TestBuildSearchKeys:
+    """get_search_key_column / build_search_keys関数のテスト"""
+    
+    def test_search_key_column_name(self):
+        """検索キー列名の形式を確認"""
+        assert get_search_key_column("曲名") == "曲名_検索キー"
+    
+    def test_build_search_keys(self):
+        """列全体の検索キーが生成され、インデックスが維持されることを確認"""
+        series = pd.Series(["ボカロ", None, "ＬｉＳＡ", "ボカロ"], index=[10, 11, 12, 13])
+        
+        result = build_search_keys(series)
+        
+        assert result.tolist() == ["ぼかろ", "", "lisa", "ぼかろ"]
+        assert result.index.tolist() == [10, 11, 12, 13]
+
+
+class TestFindDescendingDateSlice:
+    """find_descending_date_slice関数のテスト"""
+    
+    @pytest.fixture
+    def dates(self):
+        """降順に並び、欠損値が末尾にある日時配列"""
+        return pd.to_datetime(pd.Series([
+            "2024-03-01 10:00", "2024-02-29 23:00", "2024-02-10 00:00", "2024-01-05 00:00", None
+        ])).to_numpy()
+    
+    def test_range_includes_both_ends(self, dates):
+        """開始日と終了日（その日の終わりまで）を含むことを確認"""
+        assert find_descending_date_slice(dates, "2024-02-01", "2024-02-29") == slice(1, 3)
+        assert find_descending_date_slice(dates, "2024-02-10", "2024-02-10") == slice(2, 3)
+    
+    def test_open_ended(self, dates):
+        """開始日・終了日を省略した場合は制限なしで、欠損値は含まないことを確認"""
+        assert find_descending_date_slice(dates) == slice(0, 4)
+        assert find_descending_date_slice(dates, start="2024-02-10") == slice(0, 3)
+        assert find_descending_date_slice(dates, end="2024-01-31") == slice(3, 4)
+    
+    def test_empty_results(self, dates):
+        """該当がない場合や開始日が終了日より後の場合は空の範囲になることを確認"""
+        for start, end in [("2025-01-01", None), ("2024-03-02", "2024-01-01")]:
+            result = find_descending_date_slice(dates, start, end)
+            assert result.start == result.stop
+        assert find_descending_date_slice(dates[:0]) == slice(0, 0)
+    
+    def test_is_descending_dates(self, dates):
+        """降順（欠損値は末尾）に並んでいるかを判定できることを確認"""
+        assert is_descending_dates(dates)
+        assert is_descending_dates(dates[:0])
+        assert not is_descending_dates(dates[::-1])
+        # 欠損値が末尾以外にある場合は降順とみなさない
+        assert not is_descending_dates(np.concatenate([dates[-1:], dates[:-1]]))
@@ -0,0 +1,35 @@
+"""
+配信期間フィルターの単体テスト
+"""
+from datetime import date
+
+from src.ui.components import get_preset_date_range
+
+
+class TestGetPresetDateRange:
+    """get_preset_date_range関数のテスト"""
+
+    def test_this_month(self):
+        """今月は月初から基準日までになることを確認"""
+        assert get_preset_date_range("今月", today=date(2024, 3, 15)) == (
+            date(2024, 3, 1), date(2024, 3, 15)
+        )
+
+    def test_previous_month(self):
+        """先月は前月の月初から月末までになることを確認（年をまたぐ場合を含む）"""
+        assert get_preset_date_range("先月", today=date(2024, 3, 15)) == (
+            date(2024, 2, 1), date(2024, 2, 29)
+        )
+        assert get_preset_date_range("先月", today=date(2024, 1, 5)) == (
+            date(2023, 12, 1), date(2023, 12, 31)
+        )
+
+    def test_this_year(self):
+        """今年は1月1日から基準日までになることを確認"""
+        assert get_preset_date_range("今年", today=date(2024, 3, 15)) == (
+            date(2024, 1, 1), date(2024, 3, 15)
+        )
+
+    def test_all(self):
+        """全期間は期間なしになることを確認"""
+        assert get_preset_date_range("全期間") is None
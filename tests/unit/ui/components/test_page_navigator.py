@@ -0,0 +1,40 @@
+"""
+ページ送りナビゲーションの単体テスト
+"""
+from unittest.mock import MagicMock, patch
+
+from src.ui.components import render_page_navigator
+
+
+class TestRenderPageNavigator:
+    """render_page_navigator関数のテスト"""
+
+    @staticmethod
+    def _render(total_count, page, clicked=None):
+        """ボタンのクリックを指定してナビゲーションを表示する"""
+        with patch("src.ui.components.st") as mock_st:
+            mock_st.columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
+            mock_st.button.side_effect = lambda label, key, disabled: key == clicked
+            result = render_page_navigator(total_count, page, page_size=100, key="nav")
+        return result, mock_st
+
+    def test_single_page_renders_nothing(self):
+        """1ページに収まる場合は何も表示しないことを確認"""
+        result, mock_st = self._render(100, 0)
+
+        assert result is None
+        mock_st.button.assert_not_called()
+
+    def test_status_and_disabled_buttons(self):
+        """表示範囲の表示と、先頭ページでは「前へ」が無効になることを確認"""
+        result, mock_st = self._render(250, 0)
+
+        assert result is None
+        mock_st.markdown.assert_called_once_with("ページ 1 / 3（1〜100件目 / 全250件）")
+        mock_st.button.assert_any_call("◀ 前へ", key="nav_prev", disabled=True)
+        mock_st.button.assert_any_call("次へ ▶", key="nav_next", disabled=False)
+
+    def test_click_returns_new_page(self):
+        """ボタンのクリックで移動先のページ番号を返すことを確認"""
+        assert self._render(250, 1, clicked="nav_next")[0] == 2
+        assert self._render(250, 1, clicked="nav_prev")[0] == 0
@@ -0,0 +1,77 @@
+"""
+RowHtmlCacheの単体テスト
+"""
+import pytest
+import pandas as pd
+
+from src.ui.components.results_table import RowHtmlCache
+
+
+class TestRowHtmlCache:
+    """RowHtmlCacheクラスのテスト"""
+
+    @pytest.fixture
+    def display_df(self):
+        """表示用に整形済みのサンプルデータ"""
+        return pd.DataFrame({
+            "曲名": ["Song A", "Song B", None],
+            "アーティスト": [
+                '<div class="artist-cell">Artist A</div>',
+                '<div class="artist-cell">Artist B</div>',
+                '<div class="artist-cell">Artist C</div>',
+            ],
+            "曲目": ["1曲目", "2曲目", "3曲目"],
+        })
+
+    @pytest.fixture
+    def column_headers(self):
+        """カスタムヘッダー"""
+        return {"曲名": "曲名", "アーティスト": "アーティスト", "曲目": "No."}
+
+    def test_matches_to_html(self, display_df, column_headers):
+        """全行を表示した場合、to_htmlとヘッダー置換の結果と一致することを確認"""
+        columns = ["曲目", "曲名", "アーティスト"]
+        cache = RowHtmlCache(display_df, columns, column_headers)
+
+        expected = display_df[columns].to_html(
+            escape=False, index=False, justify="left", classes="dataframe"
+        )
+        for original, custom in column_headers.items():
+            expected = expected.replace(f"<th>{original}</th>", f"<th>{custom}</th>")
+
+        assert cache.render_table(range(len(display_df))) == expected
+
+    def test_matches_to_html_with_missing_values(self, column_headers):
+        """object型の列のNoneや欠損値もto_htmlと同じ表記になることを確認"""
+        df = pd.DataFrame({
+            "曲名": pd.Series(["Song A", None, float("nan")], dtype=object),
+            "曲目": pd.array([1, None, 3], dtype="Int64"),
+        })
+        cache = RowHtmlCache(df, ["曲名", "曲目"], {})
+
+        expected = df.to_html(escape=False, index=False, justify="left", classes="dataframe")
+
+        assert cache.render_table(range(len(df))) == expected
+        assert "<td>None</td>" in expected
+
+    def test_render_selected_rows_in_order(self, display_df, column_headers):
+        """指定した行位置の行だけが指定順に出力されることを確認"""
+        cache = RowHtmlCache(display_df, ["曲名"], column_headers)
+
+        html_table = cache.render_table([1, 0])
+
+        assert "Song C" not in html_table
+        assert html_table.index("Song B") < html_table.index("Song A")
+
+    def test_render_empty(self, display_df, column_headers):
+        """行位置が空の場合はヘッダーのみのテーブルになることを確認"""
+        cache = RowHtmlCache(display_df, ["曲名"], column_headers)
+
+        html_table = cache.render_table([])
+
+        assert "<th>曲名</th>" in html_table
+        assert "<td>" not in html_table
+
+    def test_len(self, display_df, column_headers):
+        """キャッシュされた行数を返すことを確認"""
+        assert len(RowHtmlCache(display_df, ["曲名"], column_headers)) == 3
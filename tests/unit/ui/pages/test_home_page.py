@@ -5,6 +5,7 @@ import pytest
 import sys
 import os
 from unittest.mock import Mock, patch, MagicMock
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -40,8 +41,22 @@ class TestHomePage:
         config.enable_cache = True
         config.initial_display_limit = 25
         config.display_increment = 25
+        config.search_cache_size = 256
+        config.incremental_search = True
         return config
 
+    @pytest.fixture(autouse=True)
+    def mock_load_live_index(self):
+        """ライブインデックスの構築をモック化する"""
+        with patch('src.ui.pages.home_page.load_live_index') as mock_load:
+            yield mock_load
+
+    @pytest.fixture(autouse=True)
+    def mock_date_range_filter(self):
+        """配信期間フィルターの表示をモック化する（デフォルトは全期間）"""
+        with patch('src.ui.pages.home_page.render_date_range_filter', return_value=None) as mock_filter:
+            yield mock_filter
+
     @pytest.fixture
     def mock_search_service(self):
         """SearchServiceのモック"""
@@ -70,10 +85,11 @@ class TestHomePage:
         assert home_page.config is not None
         assert home_page.search_service is not None
 
+    @patch('src.ui.pages.home_page.get_data_version', return_value="v1")
     @patch('src.ui.pages.home_page.st')
     @patch('src.ui.pages.home_page.load_and_process_data')
     @patch('src.ui.pages.home_page.display_footer')
-    def test_run_success(self, mock_footer, mock_load_data, mock_st, home_page, sample_df):
+    def test_run_success(self, mock_footer, mock_load_data, mock_st, mock_version, home_page, sample_df):
         """正常系の実行テスト"""
         # Session Stateのモック
         mock_st.session_state = MockSessionState()
@@ -94,14 +110,16 @@ class TestHomePage:
         mock_load_data.assert_called_once_with(
             home_page.config.lives_file_path,
             home_page.config.songs_file_path,
-            home_page.config.enable_cache
+            home_page.config.enable_cache,
+            "v1"
         )
         home_page._handle_search_and_display.assert_called_once_with(sample_df)
         mock_footer.assert_called_once()
 
+    @patch('src.ui.pages.home_page.get_data_version', return_value="v1")
     @patch('src.ui.pages.home_page.st')
     @patch('src.ui.pages.home_page.load_and_process_data')
-    def test_run_failure(self, mock_load_data, mock_st, home_page):
+    def test_run_failure(self, mock_load_data, mock_st, mock_version, home_page):
         """データ読み込み失敗時のテスト"""
         # Session Stateのモック
         mock_st.session_state = MockSessionState()
@@ -155,9 +173,12 @@ class TestHomePage:
         assert mock_st.session_state.display_limit == home_page.config.initial_display_limit
         home_page._render_results.assert_called_once()
 
+    @patch('src.ui.pages.home_page.load_search_index')
     @patch('src.ui.pages.home_page.render_search_form')
     @patch('src.ui.pages.home_page.st')
-    def test_perform_search(self, mock_st, mock_render_form, home_page, sample_df):
+    def test_perform_search(
+        self, mock_st, mock_render_form, mock_load_index, home_page, sample_df, mock_load_live_index
+    ):
         """検索実行テスト"""
         # Session Stateのモック
         mock_st.session_state = MockSessionState()
@@ -165,7 +186,8 @@ class TestHomePage:
         # 検索ボタン押下状態
         mock_render_form.return_value = ("Query", True, True)
         
-        home_page.search_service.search.return_value = sample_df.iloc[[0]]
+        positions = np.array([0], dtype=np.int32)
+        home_page.search_service.search_positions.return_value = positions
         home_page._render_results = MagicMock()
 
         # 実行
@@ -173,13 +195,260 @@ class TestHomePage:
 
         # 検証
         assert mock_st.session_state.search_query == "Query"
-        home_page.search_service.search.assert_called_once()
-        home_page._render_results.assert_called_once()
+        home_page.search_service.search_positions.assert_called_once()
+        # 構築済みの検索インデックスが検索に渡される
+        _, kwargs = home_page.search_service.search_positions.call_args
+        assert kwargs["index"] is mock_load_index.return_value
+        assert kwargs["normalize"] is True
+        assert kwargs["use_query_syntax"] is True
+        assert kwargs["live_index"] is mock_load_live_index.return_value
+        # セッション状態にはDataFrameではなく行位置を保持する
+        assert mock_st.session_state.filtered_positions is positions
+        assert "filtered_df" not in mock_st.session_state
+        home_page._render_results.assert_called_once_with(sample_df, positions)
+
+    @patch('src.ui.pages.home_page.load_search_index')
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_stale_positions_are_recomputed(
+        self, mock_st, mock_render_form, mock_load_index, home_page, sample_df
+    ):
+        """データが更新された場合、保持していた行位置を再検索することを確認"""
+        mock_st.session_state = MockSessionState()
+        mock_st.session_state.search_query = "Query"
+        mock_st.session_state.include_live_title = True
+        mock_st.session_state.display_limit = 25
+        mock_st.session_state.filtered_positions = np.array([0, 1], dtype=np.int32)
+        mock_st.session_state.filtered_version = "old"
+        home_page.data_version = "new"
+
+        mock_render_form.return_value = ("Query", True, False)
+        positions = np.array([1], dtype=np.int32)
+        home_page.search_service.search_positions.return_value = positions
+        home_page._render_results = MagicMock()
+
+        home_page._handle_search_and_display(sample_df)
+
+        home_page.search_service.search_positions.assert_called_once()
+        assert mock_st.session_state.filtered_version == "new"
+        home_page._render_results.assert_called_once_with(sample_df, positions)
+
+    @patch('src.ui.pages.home_page.render_suggestions')
+    @patch('src.ui.pages.home_page.load_fuzzy_index')
+    @patch('src.ui.pages.home_page.load_search_index')
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_zero_results_show_suggestions(
+        self, mock_st, mock_render_form, mock_load_index, mock_load_fuzzy,
+        mock_render_suggestions, home_page, sample_df
+    ):
+        """検索結果が0件の場合に「もしかして」の候補を表示することを確認"""
+        from src.models.search_query_models import FuzzyMatch
+
+        mock_st.session_state = MockSessionState()
+        mock_render_form.return_value = ("Sonng A", True, True)
+        home_page.search_service.search_positions.return_value = np.empty(0, dtype=np.int32)
+        home_page.search_service.suggest.return_value = [
+            FuzzyMatch(text="Song A", field="曲名", distance=1, row_count=1),
+            FuzzyMatch(text="Song A", field="アーティスト", distance=1, row_count=1),
+        ]
+        home_page._render_results = MagicMock()
+
+        home_page._handle_search_and_display(sample_df)
+
+        args, kwargs = home_page.search_service.suggest.call_args
+        assert args[0] == "Sonng A"
+        assert args[2] is mock_load_fuzzy.return_value
+        assert kwargs["use_query_syntax"] is True
+        # 同じ値の候補は一つにまとめて表示する
+        suggestions, = mock_render_suggestions.call_args[0]
+        assert suggestions == ["Song A"]
+
+        # 候補を選択すると入力ボックスを更新し、次の実行で再検索する
+        mock_render_suggestions.call_args[1]["on_select"]("Song A")
+        assert mock_st.session_state.search_input_box == "Song A"
+        assert mock_st.session_state.search_query == "Song A"
+        assert mock_st.session_state.filtered_version is None
+
+    @patch('src.ui.pages.home_page.render_suggestions')
+    @patch('src.ui.pages.home_page.load_search_index')
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_no_suggestions_when_results_found(
+        self, mock_st, mock_render_form, mock_load_index, mock_render_suggestions,
+        home_page, sample_df
+    ):
+        """検索結果がある場合は候補を表示しないことを確認"""
+        mock_st.session_state = MockSessionState()
+        mock_render_form.return_value = ("Song A", True, True)
+        home_page.search_service.search_positions.return_value = np.array([0], dtype=np.int32)
+        home_page._render_results = MagicMock()
+
+        home_page._handle_search_and_display(sample_df)
+
+        home_page.search_service.suggest.assert_not_called()
+        mock_render_suggestions.assert_not_called()
+
+    @patch('src.ui.pages.home_page.load_search_index')
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_incremental_search_on_input_change(
+        self, mock_st, mock_render_form, mock_load_index, home_page, sample_df
+    ):
+        """入力が確定して変わった場合、ボタンなしで前回の結果から絞り込むことを確認"""
+        previous_positions = np.array([0, 1], dtype=np.int32)
+        mock_st.session_state = MockSessionState(
+            search_query="Song",
+            include_live_title=True,
+            display_limit=25,
+            filtered_positions=previous_positions,
+            filtered_version="v1",
+        )
+        home_page.data_version = "v1"
+        mock_render_form.return_value = ("Song A", True, False)
+        home_page.search_service.is_narrowing_query.return_value = True
+        home_page.search_service.search_positions.return_value = np.array([0], dtype=np.int32)
+        home_page._render_results = MagicMock()
+
+        home_page._handle_search_and_display(sample_df)
+
+        home_page.search_service.is_narrowing_query.assert_called_once_with(
+            "Song", "Song A", normalize=True, use_query_syntax=True
+        )
+        _, kwargs = home_page.search_service.search_positions.call_args
+        assert kwargs["candidates"] is previous_positions
+        assert mock_st.session_state.search_query == "Song A"
+
+    @patch('src.ui.pages.home_page.load_search_index')
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_incremental_search_falls_back_to_full_search(
+        self, mock_st, mock_render_form, mock_load_index, home_page, sample_df
+    ):
+        """絞り込みにならないクエリや対象フィールドの変更では全件を検索することを確認"""
+        mock_st.session_state = MockSessionState(
+            search_query="Song A",
+            include_live_title=True,
+            display_limit=25,
+            filtered_positions=np.array([0], dtype=np.int32),
+            filtered_version="v1",
+        )
+        home_page.data_version = "v1"
+        home_page.search_service.is_narrowing_query.return_value = False
+        home_page._render_results = MagicMock()
+
+        mock_render_form.return_value = ("Song", True, False)
+        home_page._handle_search_and_display(sample_df)
+        assert home_page.search_service.search_positions.call_args[1]["candidates"] is None
+
+        # ライブタイトルの有無が変わった場合は前回の結果を使わない
+        home_page.search_service.is_narrowing_query.return_value = True
+        mock_render_form.return_value = ("Song", False, False)
+        home_page._handle_search_and_display(sample_df)
+        assert home_page.search_service.search_positions.call_args[1]["candidates"] is None
+
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_incremental_search_disabled(
+        self, mock_st, mock_render_form, home_page, sample_df
+    ):
+        """インクリメンタル検索が無効な場合、ボタンを押すまで検索しないことを確認"""
+        home_page.config.incremental_search = False
+        mock_st.session_state = MockSessionState()
+        mock_render_form.return_value = ("Song", True, False)
+        home_page._render_results = MagicMock()
+
+        home_page._handle_search_and_display(sample_df)
+
+        home_page.search_service.search_positions.assert_not_called()
+        assert mock_st.session_state.search_query == ""
+
+    @patch('src.ui.pages.home_page.load_search_index')
+    @patch('src.ui.pages.home_page.render_search_form')
+    @patch('src.ui.pages.home_page.st')
+    def test_date_range_change_triggers_search(
+        self, mock_st, mock_render_form, mock_load_index, mock_date_range_filter,
+        home_page, sample_df
+    ):
+        """配信期間を変更すると、キーワードがなくても期間で絞り込むことを確認"""
+        from datetime import date
+
+        mock_st.session_state = MockSessionState()
+        mock_render_form.return_value = ("", True, False)
+        date_range = (date(2024, 2, 1), date(2024, 2, 29))
+        mock_date_range_filter.return_value = date_range
+        positions = np.array([1], dtype=np.int32)
+        home_page.search_service.search_positions.return_value = positions
+        home_page._render_results = MagicMock()
+
+        home_page._handle_search_and_display(sample_df)
+
+        _, kwargs = home_page.search_service.search_positions.call_args
+        assert kwargs["date_range"] == date_range
+        assert mock_st.session_state.date_range == date_range
+        mock_st.write.assert_called_with("2024/02/01〜2024/02/29に配信された曲: 1件")
+        home_page._render_results.assert_called_once_with(sample_df, positions)
+
+    def test_get_data_version_changes_with_file(self, tmp_path):
+        """データファイルが更新されるとデータバージョンが変わることを確認"""
+        from src.ui.pages.home_page import get_data_version
+
+        lives_file = tmp_path / "lives.tsv"
+        songs_file = tmp_path / "songs.tsv"
+        lives_file.write_text("ID\n1\n", encoding="utf-8")
+        songs_file.write_text("ID\n1\n", encoding="utf-8")
+
+        config = Config(
+            lives_file_path=str(lives_file),
+            songs_file_path=str(songs_file)
+        )
+        version1 = get_data_version(config)
+        assert get_data_version(config) == version1
+
+        songs_file.write_text("ID\n1\n2\n", encoding="utf-8")
+        assert get_data_version(config) != version1
         
-    @patch('src.ui.pages.home_page.render_results_table')
+    @patch('src.ui.pages.home_page.DataPipeline')
+    @patch('src.ui.pages.home_page.ProcessedDataRepository')
+    def test_load_and_process_data_prefers_processed_file(
+        self, mock_repository_class, mock_pipeline_class, sample_df
+    ):
+        """処理済みデータファイルがあればパイプラインを実行しないことを確認"""
+        from src.ui.pages.home_page import load_and_process_data
+
+        mock_repository_class.return_value.load.return_value = sample_df
+
+        result = load_and_process_data("lives.tsv", "songs.tsv", True, "processed-hit")
+
+        pd.testing.assert_frame_equal(result, sample_df)
+        mock_pipeline_class.assert_not_called()
+
+    @patch('src.ui.pages.home_page.Config.from_env')
+    @patch('src.ui.pages.home_page.DataPipeline')
+    @patch('src.ui.pages.home_page.ProcessedDataRepository')
+    def test_load_and_process_data_persists_result(
+        self, mock_repository_class, mock_pipeline_class, mock_from_env, sample_df
+    ):
+        """処理済みデータがない場合、パイプラインを実行して結果を保存することを確認"""
+        from src.ui.pages.home_page import load_and_process_data
+
+        mock_from_env.return_value = Config(persist_processed_data=True)
+        mock_repository = mock_repository_class.return_value
+        mock_repository.load.return_value = None
+        mock_pipeline_class.return_value.execute.return_value = sample_df
+
+        result = load_and_process_data("lives.tsv", "songs.tsv", True, "processed-miss")
+
+        pd.testing.assert_frame_equal(result, sample_df)
+        mock_repository.save.assert_called_once()
+
+    @patch('src.ui.pages.home_page.load_row_html_cache')
+    @patch('src.ui.pages.home_page.render_cached_results_table')
     @patch('src.ui.pages.home_page.render_pagination')
     @patch('src.ui.pages.home_page.st')
-    def test_render_results(self, mock_st, mock_pagination, mock_results_table, home_page, sample_df):
+    def test_render_results(
+        self, mock_st, mock_pagination, mock_results_table, mock_load_cache, home_page, sample_df
+    ):
         """結果表示テスト"""
         mock_st.session_state = MockSessionState()
         mock_st.session_state.display_limit = 25
@@ -192,10 +461,51 @@ class TestHomePage:
         mock_pagination.assert_called_once()
         mock_st.rerun.assert_not_called()
 
-    @patch('src.ui.pages.home_page.render_results_table')
+    @patch('src.ui.pages.home_page.load_row_html_cache')
+    @patch('src.ui.pages.home_page.render_cached_results_table')
+    @patch('src.ui.pages.home_page.render_pagination')
+    @patch('src.ui.pages.home_page.st')
+    def test_render_results_renders_only_displayed_rows(
+        self, mock_st, mock_pagination, mock_results_table, mock_load_cache, home_page, sample_df
+    ):
+        """表示件数分の行だけがキャッシュから表示されることを確認"""
+        mock_st.session_state = MockSessionState()
+        mock_st.session_state.display_limit = 1
+        mock_pagination.return_value = None
+
+        home_page._render_results(sample_df)
+
+        row_cache, page_positions = mock_results_table.call_args[0]
+        assert row_cache is mock_load_cache.return_value
+        assert list(page_positions) == [0]
+        # 総件数は絞り込み前の件数
+        assert mock_pagination.call_args.kwargs["total_count"] == 2
+
+    @patch('src.ui.pages.home_page.load_row_html_cache')
+    @patch('src.ui.pages.home_page.render_cached_results_table')
     @patch('src.ui.pages.home_page.render_pagination')
     @patch('src.ui.pages.home_page.st')
-    def test_render_results_pagination_click(self, mock_st, mock_pagination, mock_results_table, home_page, sample_df):
+    def test_render_results_with_positions(
+        self, mock_st, mock_pagination, mock_results_table, mock_load_cache, home_page, sample_df
+    ):
+        """行位置で指定された行のみが表示されることを確認"""
+        mock_st.session_state = MockSessionState()
+        mock_st.session_state.display_limit = 25
+        mock_pagination.return_value = None
+
+        home_page._render_results(sample_df, np.array([1], dtype=np.int32))
+
+        _, page_positions = mock_results_table.call_args[0]
+        assert list(page_positions) == [1]
+        assert mock_pagination.call_args.kwargs["total_count"] == 1
+
+    @patch('src.ui.pages.home_page.load_row_html_cache')
+    @patch('src.ui.pages.home_page.render_cached_results_table')
+    @patch('src.ui.pages.home_page.render_pagination')
+    @patch('src.ui.pages.home_page.st')
+    def test_render_results_pagination_click(
+        self, mock_st, mock_pagination, mock_results_table, mock_load_cache, home_page, sample_df
+    ):
         """ページネーションボタン押下時のテスト"""
         mock_st.session_state = MockSessionState()
         mock_st.session_state.display_limit = 25
@@ -206,3 +516,19 @@ class TestHomePage:
 
         assert mock_st.session_state.display_limit == 50
         mock_st.rerun.assert_called_once()
+
+    def test_build_display_frame(self, sample_df):
+        """表示用の列がHTMLで装飾されることを確認"""
+        from src.ui.pages.home_page import build_display_frame, DISPLAY_COLUMNS
+
+        df = sample_df.assign(ライブ配信日=["2024/01/01", "2024/01/02"], 曲目=["1曲目", "2曲目"])
+
+        df_display = build_display_frame(df)
+
+        assert list(df_display.columns) == DISPLAY_COLUMNS
+        assert df_display.iloc[0]["YouTubeリンク"] == (
+            '<a href="http://url1" target="_blank">YouTubeへ👻</a>'
+        )
+        assert df_display.iloc[0]["アーティスト"] == '<div class="artist-cell">Artist A</div>'
+        # 元のDataFrameは変更されない
+        assert df.iloc[0]["アーティスト"] == "Artist A"
@@ -0,0 +1,257 @@
+"""
+SongListPageクラスと楽曲リストの前処理の単体テスト
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+import pandas as pd
+
+from src.config.settings import Config
+from src.ui.pages.song_list_page import (
+    SongListPage,
+    add_song_list_search_keys,
+    build_initial_index,
+    build_song_list_display_frame,
+    get_artist_initial,
+    get_song_list_version,
+    prepare_song_list,
+)
+from src.ui.components.results_table import RowHtmlCache
+
+
+@pytest.fixture
+def song_list_df():
+    """V_SONG_LIST.TSVと同じ列を持つサンプルデータ"""
+    return pd.DataFrame({
+        "アーティスト": ["YOASOBI", "-", "Aimer", "aiko", "米津玄師"],
+        "アーティスト(ソート用)": ["YOASOBI", "-", "Aimer", "aiko", "よねづけんし"],
+        "曲名": ["夜に駆ける", "不明", "残響散歌", "カブトムシ", "Lemon"],
+        "最近の歌唱": ["url1", "url2", None, "url4", "url5"],
+    })
+
+
+class TestPrepareSongList:
+    """prepare_song_list関数のテスト"""
+
+    def test_excludes_hyphen_and_sorts_case_insensitively(self, song_list_df):
+        """「-」のアーティストを除外し、大文字小文字を区別せずにソートすることを確認"""
+        result = prepare_song_list(song_list_df)
+
+        assert result["アーティスト"].tolist() == ["aiko", "Aimer", "YOASOBI", "米津玄師"]
+        assert result.index.tolist() == [0, 1, 2, 3]
+
+    def test_stable_within_artist(self):
+        """同じアーティスト内の曲順が維持されることを確認"""
+        df = pd.DataFrame({
+            "アーティスト": ["B", "A", "B"],
+            "アーティスト(ソート用)": ["B", "A", "B"],
+            "曲名": ["1", "2", "3"],
+            "最近の歌唱": ["u", "u", "u"],
+        })
+
+        assert prepare_song_list(df)["曲名"].tolist() == ["2", "1", "3"]
+
+
+class TestBuildSongListDisplayFrame:
+    """build_song_list_display_frame関数のテスト"""
+
+    def test_decorates_cells(self, song_list_df):
+        """アーティスト列の装飾とリンク列の生成を確認"""
+        result = build_song_list_display_frame(prepare_song_list(song_list_df))
+
+        assert result["アーティスト"].iloc[0] == '<div class="artist-cell">aiko</div>'
+        assert result["リンク"].iloc[0] == '<a href="url4" target="_blank">YouTubeへ👻</a>'
+        # URLが欠損している場合は空文字列
+        assert result["リンク"].iloc[1] == ""
+
+
+class TestArtistInitial:
+    """頭文字インデックスのテスト"""
+
+    def test_get_artist_initial(self):
+        """英字・かな・数字・その他の頭文字の判定を確認"""
+        assert get_artist_initial("yoasobi") == "Y"
+        assert get_artist_initial("Ａimer") == "A"
+        assert get_artist_initial("よねづけんし") == "や"
+        # 濁点・半濁点とカタカナ・半角カナは行に揃える
+        assert get_artist_initial("ぼかろ") == "は"
+        assert get_artist_initial("ガゼット") == "か"
+        assert get_artist_initial("ｻｶﾅｸｼｮﾝ") == "さ"
+        assert get_artist_initial("1640mp") == "#"
+        assert get_artist_initial("μ's") == "他"
+        assert get_artist_initial(None) == "他"
+
+    def test_build_initial_index(self):
+        """頭文字ごとに最初の行位置が表示順に求められることを確認"""
+        initial_index = build_initial_index(["1", "aiko", "Aimer", "かんざき", "きたの"])
+
+        assert list(initial_index) == ["#", "A", "か"]
+        assert initial_index == {"#": 0, "A": 1, "か": 3}
+
+
+class TestGetSongListVersion:
+    """get_song_list_version関数のテスト"""
+
+    def test_changes_when_file_changes(self, tmp_path):
+        """楽曲リストファイルが更新されるとバージョンが変わることを確認"""
+        path = tmp_path / "V_SONG_LIST.TSV"
+        path.write_text("a\n", encoding="utf-8")
+        config = MagicMock(spec=Config)
+        config.song_list_file_path = str(path)
+        config.cache_content_hash = False
+
+        before = get_song_list_version(config)
+        path.write_text("a\nb\n", encoding="utf-8")
+
+        assert get_song_list_version(config) != before
+
+
+class MockSessionState(dict):
+    """SessionStateのモック（属性アクセスと辞書アクセス両対応）"""
+    def __getattr__(self, key):
+        if key in self:
+            return self[key]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+class TestSongListPage:
+    """SongListPageクラスのテスト"""
+
+    @pytest.fixture
+    def mock_config(self):
+        """Configのモック"""
+        config = MagicMock(spec=Config)
+        config.song_list_file_path = "song_list.tsv"
+        config.cache_content_hash = False
+        config.song_list_page_size = 100
+        config.search_cache_size = 256
+        return config
+
+    @pytest.fixture
+    def page(self, mock_config):
+        """SongListPageのインスタンス"""
+        with patch("src.ui.pages.song_list_page.Config.from_env", return_value=mock_config), \
+             patch("src.ui.pages.song_list_page.load_search_result_cache", return_value=None):
+            return SongListPage()
+
+    @pytest.fixture
+    def session_state(self):
+        """セッション状態のモック"""
+        return MockSessionState()
+
+    def test_run_renders_current_page(self, page, song_list_df, session_state):
+        """現在のページの行だけをキャッシュ済みの行HTMLから表示することを確認"""
+        page.config.song_list_page_size = 2
+        prepared = prepare_song_list(song_list_df)
+        html_cache = RowHtmlCache(
+            build_song_list_display_frame(prepared), ["曲名"], {"曲名": "曲名"}
+        )
+        session_state.song_list_page = 1
+        session_state.song_list_version = "v1"
+        session_state.song_list_searched_query = ""
+        with patch("src.ui.pages.song_list_page.st") as mock_st, \
+             patch("src.ui.pages.song_list_page.get_song_list_version", return_value="v1"), \
+             patch("src.ui.pages.song_list_page.load_song_list", return_value=prepared) as mock_load, \
+             patch("src.ui.pages.song_list_page.load_song_list_html_cache", return_value=html_cache), \
+             patch("src.ui.pages.song_list_page.load_song_list_initial_index", return_value={}), \
+             patch("src.ui.pages.song_list_page.render_page_navigator", return_value=None), \
+             patch("src.ui.pages.song_list_page.display_footer"):
+            mock_st.session_state = session_state
+            mock_st.text_input.return_value = ""
+            page.run()
+
+        mock_load.assert_called_once_with("song_list.tsv", "v1")
+        mock_st.markdown.assert_any_call("**全 4 件**")
+        html_table = mock_st.write.call_args[0][0]
+        assert "夜に駆ける" in html_table and "Lemon" in html_table
+        assert "カブトムシ" not in html_table
+
+    def test_page_reset_on_data_update(self, page, song_list_df, session_state):
+        """データが更新された場合は先頭ページに戻ることを確認"""
+        session_state.song_list_page = 3
+        session_state.song_list_version = "old"
+        with patch("src.ui.pages.song_list_page.st") as mock_st, \
+             patch("src.ui.pages.song_list_page.get_song_list_version", return_value="new"), \
+             patch("src.ui.pages.song_list_page.load_song_list", return_value=prepare_song_list(song_list_df)), \
+             patch("src.ui.pages.song_list_page.load_song_list_html_cache", return_value=None), \
+             patch("src.ui.pages.song_list_page.load_song_list_initial_index", return_value={}), \
+             patch("src.ui.pages.song_list_page.render_page_navigator", return_value=None), \
+             patch("src.ui.pages.song_list_page.display_footer"):
+            mock_st.session_state = session_state
+            mock_st.text_input.return_value = ""
+            page.run()
+
+        assert session_state.song_list_page == 0
+        assert session_state.song_list_version == "new"
+
+    def test_search_renders_matches(self, page, song_list_df, session_state):
+        """検索語に一致する行だけを表示し、先頭ページに戻ることを確認"""
+        prepared = add_song_list_search_keys(prepare_song_list(song_list_df))
+        html_cache = RowHtmlCache(
+            build_song_list_display_frame(prepared), ["曲名"], {"曲名": "曲名"}
+        )
+        session_state.song_list_page = 2
+        session_state.song_list_version = "v1"
+        session_state.song_list_searched_query = ""
+        with patch("src.ui.pages.song_list_page.st") as mock_st, \
+             patch("src.ui.pages.song_list_page.get_song_list_version", return_value="v1"), \
+             patch("src.ui.pages.song_list_page.load_song_list", return_value=prepared), \
+             patch("src.ui.pages.song_list_page.load_song_list_search_index", return_value=None), \
+             patch("src.ui.pages.song_list_page.load_song_list_html_cache", return_value=html_cache), \
+             patch("src.ui.pages.song_list_page.render_page_navigator", return_value=None), \
+             patch("src.ui.pages.song_list_page.display_footer"):
+            mock_st.session_state = session_state
+            # 読みがな（アーティスト(ソート用)）はカタカナでも検索できる
+            mock_st.text_input.return_value = "ヨネヅ "
+            page.run()
+
+        assert session_state.song_list_page == 0
+        mock_st.markdown.assert_any_call("**「ヨネヅ」の検索結果: 1 件**")
+        html_table = mock_st.write.call_args[0][0]
+        assert "Lemon" in html_table and "夜に駆ける" not in html_table
+        # 検索中は頭文字による移動を表示しない
+        mock_st.selectbox.assert_not_called()
+
+    def test_search_without_matches(self, page, song_list_df, session_state):
+        """一致する楽曲がない場合はメッセージを表示することを確認"""
+        prepared = add_song_list_search_keys(prepare_song_list(song_list_df))
+        with patch("src.ui.pages.song_list_page.st") as mock_st, \
+             patch("src.ui.pages.song_list_page.get_song_list_version", return_value="v1"), \
+             patch("src.ui.pages.song_list_page.load_song_list", return_value=prepared), \
+             patch("src.ui.pages.song_list_page.load_song_list_search_index", return_value=None), \
+             patch("src.ui.pages.song_list_page.display_footer"):
+            mock_st.session_state = session_state
+            mock_st.text_input.return_value = "存在しない曲"
+            page.run()
+
+        mock_st.info.assert_any_call("「存在しない曲」に一致する楽曲は見つかりませんでした。")
+        mock_st.write.assert_not_called()
+
+    def test_jump_to_initial(self, page, session_state):
+        """頭文字を選択すると、その頭文字を含むページに移動することを確認"""
+        page.config.song_list_page_size = 100
+        session_state.song_list_page = 0
+        session_state.song_list_initial = "や"
+        with patch("src.ui.pages.song_list_page.st") as mock_st:
+            mock_st.session_state = session_state
+            page._jump_to_initial({"A": 0, "や": 250})
+
+        assert session_state.song_list_page == 2
+        assert session_state.song_list_initial is None
+
+    def test_run_shows_error(self, page):
+        """読み込みに失敗した場合はエラーを表示することを確認"""
+        with patch("src.ui.pages.song_list_page.st") as mock_st, \
+             patch("src.ui.pages.song_list_page.get_song_list_version", return_value="v1"), \
+             patch("src.ui.pages.song_list_page.load_song_list", return_value=None), \
+             patch("src.ui.pages.song_list_page.DataService") as mock_service_cls, \
+             patch("src.ui.pages.song_list_page.display_footer"):
+            mock_service = mock_service_cls.return_value
+            mock_service.load_song_list_data.return_value = None
+            mock_service.get_last_error.return_value = "ファイルが見つかりません"
+            page.run()
+
+        mock_st.error.assert_called_once_with("エラー: ファイルが見つかりません")
+        mock_st.warning.assert_called_once()